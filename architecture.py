@@ -0,0 +1,346 @@
+# architecture.py
+"""
+Builds the component/dependency graph of the documented project.
+
+The graph is derived from the pages themselves, not maintained by hand:
+
+- the project trees on the Frontend, Backend and GenAI pages give the
+  files and folders of each tier (containment edges),
+- the code listings give the imports between those files and the
+  third-party libraries they use, and the HTTP endpoints they declare.
+
+Files are grouped by role (pages, components, controllers, models, routes,
+ML modules, ...) from their paths. The node layout is computed here, in one
+pass over the containment tree, so the browser does not have to run a
+physics simulation; the caller caches it by `Graph.digest()`.
+"""
+
+import hashlib
+import json
+import math
+import os
+import posixpath
+import re
+import sys
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+
+from content import code_listings, page_path, project_trees
+
+# Page title -> tier id of the project documented on it
+TIERS = {
+    "Frontend": "frontend",
+    "Backend": "backend",
+    "GenAI and Machine learning": "ml",
+}
+
+APP_ID = "homescrapper"
+
+# (path pattern, group) pairs; the first match decides a file's group
+GROUP_RULES = [
+    (re.compile(r"(^|/)pages/.+\.jsx$"), "page"),
+    (re.compile(r"(^|/)(components|part\d+)/.+\.jsx$"), "component"),
+    (re.compile(r"(^|/)hooks/"), "hook"),
+    (re.compile(r"(^|/)atom/"), "state"),
+    (re.compile(r"(^|/)controller/"), "controller"),
+    (re.compile(r"(^|/)model/"), "model"),
+    (re.compile(r"(^|/)routes/", re.I), "route"),
+    (re.compile(r"(^|/)middleware/"), "middleware"),
+    (re.compile(r"(^|/)db/"), "database"),
+    (re.compile(r"\.py$"), "ml module"),
+    (re.compile(r"(^|/)(main|app)\.(jsx?|py)$"), "entry point"),
+    (re.compile(r"\.(png|svg|jpe?g|css)$"), "asset"),
+]
+
+JS_IMPORT_RE = re.compile(
+    r"""^\s*import\s+(?:(?P<names>[\w\s{},*]+?)\s+from\s+)?['"](?P<spec>[^'"]+)['"]""", re.M
+)
+JS_REQUIRE_RE = re.compile(
+    r"""(?:const|let|var)\s+(?P<names>[\w\s{},]+?)\s*=\s*require\(\s*['"](?P<spec>[^'"]+)['"]\s*\)"""
+)
+JS_ROUTE_RE = re.compile(
+    r"""\b(?:app|router)\.(?P<method>use|get|post|put|patch|delete)\(\s*['"](?P<path>/[^'"]*)['"]"""
+    r"""(?P<handlers>[^)]*)\)"""
+)
+HTML_SCRIPT_RE = re.compile(r"""<script[^>]*\ssrc=['"](?P<spec>[^'"]+)['"]""")
+PY_IMPORT_RE = re.compile(r"^\s*(?:from\s+(?P<source>[\w.]+)\s+import|import\s+(?P<module>[\w.]+))", re.M)
+PY_ROUTE_RE = re.compile(r"""@app\.(?P<method>get|post|put|patch|delete)\(\s*['"](?P<path>[^'"]+)['"]""")
+
+# Python namespace packages, named by their first two components
+NAMESPACE_PACKAGES = {"google"}
+
+# Layout: distance between rings of the containment tree, and the least
+# arc length between neighbouring nodes on the outermost ring
+RING_SPACING = 160.0
+NODE_GAP = 45.0
+
+
+@dataclass
+class Node:
+    id: str
+    label: str
+    group: str
+    tier: str = ""
+    path: str = ""
+    # Containment parent; None for the app and for libraries
+    parent: Optional[str] = None
+
+
+@dataclass(frozen=True)
+class Edge:
+    source: str
+    target: str
+    # "contains", "imports", "declares" or "routes to"
+    kind: str
+
+
+@dataclass
+class Graph:
+    nodes: Dict[str, Node] = field(default_factory=dict)
+    edges: List[Edge] = field(default_factory=list)
+    _edge_set: set = field(default_factory=set, repr=False)
+    _digest: Optional[str] = field(default=None, repr=False)
+
+    def add_node(self, node: Node) -> Node:
+        if node.id not in self.nodes:
+            self.nodes[node.id] = node
+            self._digest = None
+        return self.nodes[node.id]
+
+    def add_edge(self, source: str, target: str, kind: str) -> None:
+        edge = Edge(source, target, kind)
+        if source != target and edge not in self._edge_set:
+            self._edge_set.add(edge)
+            self.edges.append(edge)
+            self._digest = None
+
+    def digest(self) -> str:
+        """Returns a hash of the graph's nodes and edges, for caching its layout."""
+        if self._digest is None:
+            payload = json.dumps(
+                [sorted((n.id, n.group, n.parent or "") for n in self.nodes.values()),
+                 sorted((e.source, e.target, e.kind) for e in self.edges)],
+                separators=(",", ":"),
+            )
+            self._digest = hashlib.sha256(payload.encode()).hexdigest()
+        return self._digest
+
+    def neighbours(self, node_id: str) -> Tuple[List[Edge], List[Edge]]:
+        """Returns the (outgoing, incoming) edges of a node."""
+        outgoing = [e for e in self.edges if e.source == node_id]
+        incoming = [e for e in self.edges if e.target == node_id]
+        return outgoing, incoming
+
+
+def file_group(path: str) -> str:
+    """Returns the role of a project file, judged from its path."""
+    if path.endswith("/"):
+        return "folder"
+    for pattern, group in GROUP_RULES:
+        if pattern.search(path):
+            return group
+    return "file"
+
+
+def source_versions(pages: dict = TIERS) -> tuple:
+    """Returns the modification times of the pages the graph is built from."""
+    return tuple((title, os.stat(page_path(title)).st_mtime_ns) for title in pages)
+
+
+def _package(spec: str, language: str) -> str:
+    """Returns the distribution a bare import names, e.g. react-dom/client -> react-dom."""
+    if language == "python":
+        parts = spec.split(".")
+        return ".".join(parts[:2]) if parts[0] in NAMESPACE_PACKAGES else parts[0]
+    parts = spec.split("/")
+    return "/".join(parts[:2]) if spec.startswith("@") else parts[0]
+
+
+class _TierBuilder:
+    """Adds one tier's files, imports and endpoints to the graph."""
+
+    def __init__(self, graph: Graph, tier: str, title: str, root: str, paths: List[str]):
+        self.graph = graph
+        self.tier = tier
+        self.root_id = f"{tier}:"
+        self.paths = set(paths)
+        graph.add_node(Node(self.root_id, f"{title} · {root}", "tier", tier, "", APP_ID))
+        graph.add_edge(APP_ID, self.root_id, "contains")
+        for path in paths:
+            parent = posixpath.dirname(path.rstrip("/"))
+            parent_id = self.node_id(parent + "/") if parent else self.root_id
+            graph.add_node(Node(self.node_id(path), posixpath.basename(path.rstrip("/")),
+                                file_group(path), tier, path, parent_id))
+            graph.add_edge(parent_id, self.node_id(path), "contains")
+
+    def node_id(self, path: str) -> str:
+        return f"{self.tier}:{path}"
+
+    def find(self, label: str) -> Optional[str]:
+        """Returns the tree path a listing's label refers to, e.g. 'connectDB.js'."""
+        if label in self.paths:
+            return label
+        matches = sorted(p for p in self.paths if p.endswith("/" + label))
+        return matches[0] if matches else None
+
+    def resolve(self, source: str, spec: str) -> Optional[str]:
+        """
+        Returns the node a relative import points at. Imports of files the
+        tree does not list resolve to their nearest listed folder.
+        """
+        base = "" if spec.startswith("/") else posixpath.dirname(source)
+        path = posixpath.normpath(posixpath.join(base, spec.lstrip("/")))
+        while path not in (".", "") and not path.startswith(".."):
+            for candidate in (path, path + "/", path + ".js", path + ".jsx"):
+                if candidate in self.paths:
+                    return self.node_id(candidate)
+            path = posixpath.dirname(path)
+        return None
+
+    def library(self, name: str, language: str) -> str:
+        registry = "pypi" if language == "python" else "npm"
+        node = self.graph.add_node(Node(f"{registry}:{name}", name, "library"))
+        return node.id
+
+    def add_listing(self, label: str, code: str, language: str) -> None:
+        source = self.find(label)
+        if source is None:
+            return
+        source_id = self.node_id(source)
+        if language == "python":
+            self._python(source_id, code)
+        elif language == "html":
+            for match in HTML_SCRIPT_RE.finditer(code):
+                target = self.resolve(source, match["spec"])
+                if target:
+                    self.graph.add_edge(source_id, target, "imports")
+        else:
+            self._javascript(source, source_id, code)
+
+    def _javascript(self, source: str, source_id: str, code: str) -> None:
+        bindings = {}
+        for match in list(JS_IMPORT_RE.finditer(code)) + list(JS_REQUIRE_RE.finditer(code)):
+            spec = match["spec"]
+            if spec.startswith((".", "/")):
+                target = self.resolve(source, spec)
+            else:
+                target = self.library(_package(spec, "javascript"), "javascript")
+            if target is None:
+                continue
+            self.graph.add_edge(source_id, target, "imports")
+            for name in re.findall(r"\w+", match["names"] or ""):
+                bindings[name] = target
+        for match in JS_ROUTE_RE.finditer(code):
+            endpoint = self._endpoint(source_id, match["method"], match["path"])
+            for name in re.findall(r"\w+", match["handlers"]):
+                if name in bindings:
+                    self.graph.add_edge(endpoint, bindings[name], "routes to")
+
+    def _python(self, source_id: str, code: str) -> None:
+        modules = {posixpath.basename(p)[:-3]: p for p in self.paths if p.endswith(".py")}
+        for match in PY_IMPORT_RE.finditer(code):
+            name = match["source"] or match["module"]
+            local = modules.get(name.split(".")[-1]) or modules.get(name.split(".")[0])
+            if local:
+                self.graph.add_edge(source_id, self.node_id(local), "imports")
+            elif name.split(".")[0] not in sys.stdlib_module_names:
+                self.graph.add_edge(source_id, self.library(_package(name, "python"), "python"), "imports")
+        for match in PY_ROUTE_RE.finditer(code):
+            self._endpoint(source_id, match["method"], match["path"])
+
+    def _endpoint(self, source_id: str, method: str, path: str) -> str:
+        method = "ANY" if method == "use" else method.upper()
+        node = self.graph.add_node(
+            Node(f"{self.tier}:{method} {path}", f"{method} {path}", "endpoint", self.tier, path, source_id)
+        )
+        self.graph.add_edge(source_id, node.id, "declares")
+        return node.id
+
+
+def build_graph(pages: dict = TIERS) -> Graph:
+    """
+    Builds the architecture graph from the documentation pages.
+
+    Parameters:
+        pages (dict): Page title -> tier id, for the pages documenting a tier.
+
+    Returns:
+        Graph: Files, folders, endpoints and libraries, and their edges.
+    """
+    graph = Graph()
+    graph.add_node(Node(APP_ID, "Home$crapper", "app"))
+    for title, tier in pages.items():
+        for root, paths in project_trees(title):
+            builder = _TierBuilder(graph, tier, title, root, paths)
+            for block in code_listings(title):
+                builder.add_listing(block.label, block.text, block.language)
+    return graph
+
+
+def radial_layout(graph: Graph, ring: float = RING_SPACING, gap: float = NODE_GAP) -> Dict[str, Tuple[int, int]]:
+    """
+    Places the containment tree on concentric rings around the app node.
+
+    Each node gets an arc of its parent's proportional to its number of
+    leaves, so subtrees never overlap. Libraries, which sit outside the
+    tree, go on an outer ring at the mean angle of the files importing them.
+    Runs in linear time and always gives the same positions for a graph.
+
+    Returns:
+        dict: Node id -> (x, y).
+    """
+    children: Dict[str, List[str]] = {node_id: [] for node_id in graph.nodes}
+    for node in graph.nodes.values():
+        if node.parent in children:
+            children[node.parent].append(node.id)
+
+    leaves, depth, order = {}, {APP_ID: 0}, [APP_ID]
+    for node_id in order:
+        for child in children[node_id]:
+            depth[child] = depth[node_id] + 1
+            order.append(child)
+    for node_id in reversed(order):
+        leaves[node_id] = sum(leaves[child] for child in children[node_id]) or 1
+
+    # Spread the rings out far enough that the outermost one fits every leaf
+    max_depth = max(depth.values()) or 1
+    ring = max(ring, leaves[APP_ID] * gap / (2 * math.pi * max_depth))
+
+    angles = {APP_ID: 0.0}
+    spans = {APP_ID: (0.0, 2 * math.pi)}
+    for node_id in order:
+        start, end = spans[node_id]
+        for child in children[node_id]:
+            width = (end - start) * leaves[child] / leaves[node_id]
+            spans[child] = (start, start + width)
+            angles[child] = start + width / 2
+            start += width
+
+    positions = {
+        node_id: (round(depth[node_id] * ring * math.cos(angles[node_id])),
+                  round(depth[node_id] * ring * math.sin(angles[node_id])))
+        for node_id in order
+    }
+
+    # Libraries: circular mean of their importers' angles, then nudged
+    # apart so neighbours keep at least `gap` between them
+    radius = (max_depth + 1.5) * ring
+    importers: Dict[str, List[float]] = {}
+    for edge in graph.edges:
+        if edge.target not in positions and edge.source in angles:
+            importers.setdefault(edge.target, []).append(angles[edge.source])
+    placed = sorted(
+        (math.atan2(sum(map(math.sin, a)), sum(map(math.cos, a))) % (2 * math.pi), node_id)
+        for node_id, a in importers.items()
+    )
+    min_step = gap / radius
+    previous = -math.inf
+    for angle, node_id in placed:
+        angle = max(angle, previous + min_step)
+        positions[node_id] = (round(radius * math.cos(angle)), round(radius * math.sin(angle)))
+        previous = angle
+
+    # Anything unreachable (e.g. a library nobody imports) goes below the graph
+    for i, node_id in enumerate(sorted(set(graph.nodes) - set(positions))):
+        positions[node_id] = (round(-radius + i * gap), round(radius + ring))
+    return positions
@@ -0,0 +1,310 @@
+# assets.py
+
+import contextvars
+import gzip
+import json
+import os
+import sqlite3
+import threading
+import time
+import urllib.parse
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Optional
+
+from instrumentation import span
+from shared_cache import SharedCache
+
+# Hard limits for a single fetch: (connect, read) in seconds
+CONNECT_TIMEOUT = 3.05
+READ_TIMEOUT = 5
+
+# Prebuilt bundle of minified animations (see tools/pack_assets.py)
+BUNDLE_PATH = os.environ.get(
+    "HOMESCRAPPER_ASSET_BUNDLE",
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "lottie_bundle.json.gz"),
+)
+BUNDLE_VERSION = 1
+
+# Optional base URL that asset requests are redirected to, e.g. an internal
+# mirror of the asset host (the path of the original URL is kept)
+ASSET_MIRROR = os.environ.get("HOMESCRAPPER_ASSET_MIRROR", "")
+
+# How long a fetched animation is considered fresh
+TTL_SECONDS = 60 * 60
+
+# How long to wait before retrying a URL whose last fetch failed
+FAILURE_BACKOFF_SECONDS = 60
+
+# SQLite file shared by the app processes on this host, so replicas fetch
+# each asset once between them (see shared_cache.py); empty disables it.
+# Defaults to the user's own cache directory: its contents are rendered as
+# trusted, so it must not live where other users can plant it.
+SHARED_CACHE_PATH = os.environ.get(
+    "HOMESCRAPPER_SHARED_CACHE",
+    os.path.join(os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache"),
+                 "homescrapper", "cache.sqlite"),
+)
+
+
+@dataclass
+class _Entry:
+    data: Optional[dict]
+    fetched_at: float
+    retry_at: float = 0.0
+
+
+# Module-level state survives Streamlit reruns because imported modules are
+# only executed once per process.
+_cache = {}
+_refreshing = set()
+_lock = threading.Lock()
+# requests is imported on the first network fetch, not at startup: bundled
+# and cached assets never need it
+_session = None
+_refresher = ThreadPoolExecutor(max_workers=2, thread_name_prefix="lottie-refresh")
+_fetcher = ThreadPoolExecutor(max_workers=4, thread_name_prefix="lottie-fetch")
+_bundle = None
+# None until first use; False if the shared cache is disabled or unusable
+_shared = None
+
+
+def read_bundle(path: str = BUNDLE_PATH) -> dict:
+    """
+    Reads a packed asset bundle.
+
+    Parameters:
+        path (str): Path to the gzip-compressed bundle.
+
+    Returns:
+        dict: Mapping of asset URL to parsed Lottie JSON. Empty if the bundle
+        is missing or unreadable.
+    """
+    try:
+        with gzip.open(path, "rt", encoding="utf-8") as f:
+            bundle = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if bundle.get("version") != BUNDLE_VERSION:
+        return {}
+    return bundle.get("assets", {})
+
+
+def write_bundle(assets: dict, path: str = BUNDLE_PATH) -> None:
+    """
+    Writes assets to a gzip-compressed bundle, replacing it atomically.
+
+    Parameters:
+        assets (dict): Mapping of asset URL to Lottie JSON data.
+        path (str): Destination of the bundle.
+    """
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    payload = json.dumps(
+        {"version": BUNDLE_VERSION, "assets": assets},
+        separators=(",", ":"),
+        ensure_ascii=False,
+        sort_keys=True,
+    )
+    tmp_path = f"{path}.tmp"
+    with gzip.open(tmp_path, "wt", encoding="utf-8", compresslevel=9) as f:
+        f.write(payload)
+    os.replace(tmp_path, path)
+
+
+def bundled_asset(url: str) -> Optional[dict]:
+    """Returns the bundled copy of an asset, reading the bundle once per process."""
+    global _bundle
+    if _bundle is None:
+        with _lock:
+            if _bundle is None:
+                _bundle = read_bundle()
+    return _bundle.get(url)
+
+
+def shared_cache() -> Optional[SharedCache]:
+    """Returns the cross-process cache, opening it once per process."""
+    global _shared
+    if _shared is None:
+        with _lock:
+            if _shared is None:
+                try:
+                    _shared = SharedCache(SHARED_CACHE_PATH) if SHARED_CACHE_PATH else False
+                except (OSError, sqlite3.Error):
+                    _shared = False
+    return _shared or None
+
+
+def cache_stats() -> Optional[dict]:
+    """Returns the shared cache's statistics, or None if it is disabled."""
+    cache = shared_cache()
+    return cache.stats() if cache is not None else None
+
+
+def _http():
+    """Returns the HTTP session used for asset fetches, creating it on first use."""
+    global _session
+    if _session is None:
+        import requests
+
+        with _lock:
+            if _session is None:
+                _session = requests.Session()
+    return _session
+
+
+def _mirrored(url: str) -> str:
+    """Rewrites an asset URL to ASSET_MIRROR, if one is configured."""
+    if not ASSET_MIRROR:
+        return url
+    parts = urllib.parse.urlsplit(url)
+    path = urllib.parse.urlunsplit(("", "", parts.path, parts.query, ""))
+    return ASSET_MIRROR.rstrip("/") + path
+
+
+def _fetch(url: str) -> Optional[dict]:
+    """
+    Fetches and parses a Lottie JSON file, bounded by the fetch timeouts.
+
+    Parameters:
+        url (str): The URL of the Lottie JSON file.
+
+    Returns:
+        dict: The Lottie animation JSON data, or None if the fetch failed.
+    """
+    import requests
+
+    with span("asset.fetch", url=url):
+        try:
+            r = _http().get(_mirrored(url), timeout=(CONNECT_TIMEOUT, READ_TIMEOUT))
+            if r.status_code != 200:
+                return None
+            return r.json()
+        except (requests.RequestException, ValueError):
+            return None
+
+
+def _store(url: str, data: Optional[dict], age: float = 0.0) -> Optional[dict]:
+    """
+    Records a fetch result, keeping previously cached data on failure.
+
+    `age` is how long ago the data was fetched, for data that another
+    process fetched first.
+    """
+    now = time.monotonic()
+    with _lock:
+        previous = _cache.get(url)
+        if data is not None:
+            _cache[url] = _Entry(data, now - age)
+        elif previous is not None and previous.data is not None:
+            previous.retry_at = now + FAILURE_BACKOFF_SECONDS
+            data = previous.data
+        else:
+            _cache[url] = _Entry(None, now, retry_at=now + FAILURE_BACKOFF_SECONDS)
+    return data
+
+
+def _load(url: str, ttl: float) -> Optional[dict]:
+    """
+    Fetches an asset into the in-memory cache, through the shared cache if
+    it is enabled: a copy another process fetched less than `ttl` ago is
+    reused, and only one process fetches a given URL at a time.
+    """
+    cache = shared_cache()
+    if cache is None:
+        return _store(url, _fetch(url))
+    try:
+        lookup = cache.get_or_compute(
+            f"lottie:{url}", lambda: _fetch(url), ttl=ttl,
+            failure_ttl=FAILURE_BACKOFF_SECONDS, wait_timeout=CONNECT_TIMEOUT + READ_TIMEOUT,
+        )
+    except sqlite3.Error:
+        return _store(url, _fetch(url))
+    return _store(url, lookup.value, age=lookup.age)
+
+
+def _refresh(url: str, ttl: float) -> None:
+    try:
+        _load(url, ttl)
+    finally:
+        with _lock:
+            _refreshing.discard(url)
+
+
+def _schedule_refresh(url: str, ttl: float) -> None:
+    with _lock:
+        if url in _refreshing:
+            return
+        _refreshing.add(url)
+    _refresher.submit(_refresh, url, ttl)
+
+
+def load_lottieurl(url: str, ttl: float = TTL_SECONDS) -> Optional[dict]:
+    """
+    Loads a Lottie animation from a URL, caching the parsed JSON in memory.
+
+    Assets packed into the local bundle are served from it without touching
+    the network. For anything else, the first call for a URL blocks on the
+    network (bounded by the fetch timeouts), unless another process on this
+    host already fetched it into the shared cache. Later calls return the cached
+    data immediately; once it is older than `ttl` the stale copy is still
+    returned while a background thread refreshes it. Failed fetches are
+    retried at most once every FAILURE_BACKOFF_SECONDS, so an unreachable
+    host cannot stall every rerun.
+
+    Parameters:
+        url (str): The URL of the Lottie JSON file.
+        ttl (float): Seconds before cached data is refreshed.
+
+    Returns:
+        dict: The Lottie animation JSON data, or None if it is unavailable.
+    """
+    data = bundled_asset(url)
+    if data is not None:
+        return data
+
+    now = time.monotonic()
+    with _lock:
+        entry = _cache.get(url)
+
+    if entry is None:
+        return _load(url, ttl)
+
+    if entry.data is None:
+        if now < entry.retry_at:
+            return None
+        return _load(url, ttl)
+
+    if now - entry.fetched_at > ttl and now >= entry.retry_at:
+        _schedule_refresh(url, ttl)
+    return entry.data
+
+
+def load_lottieurl_async(url: str, ttl: float = TTL_SECONDS) -> Future:
+    """
+    Starts loading a Lottie animation without blocking the caller.
+
+    Bundled and cached assets resolve immediately; anything that would need
+    a network round trip is fetched on a worker thread, so a page can render
+    its text first and fill in the animation once the future completes.
+
+    Parameters:
+        url (str): The URL of the Lottie JSON file.
+        ttl (float): Seconds before cached data is refreshed.
+
+    Returns:
+        Future: Resolves to the Lottie animation JSON data, or None.
+    """
+    with _lock:
+        entry = _cache.get(url)
+    ready = bundled_asset(url) is not None or (
+        entry is not None
+        and (entry.data is not None or time.monotonic() < entry.retry_at)
+    )
+    if ready:
+        future = Future()
+        future.set_result(load_lottieurl(url, ttl))
+        return future
+    # Run in a copy of the caller's context so the fetch is still timed as
+    # part of the caller's run when profiling is on
+    context = contextvars.copy_context()
+    return _fetcher.submit(context.run, load_lottieurl, url, ttl)
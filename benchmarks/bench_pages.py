@@ -0,0 +1,254 @@
+# benchmarks/bench_pages.py
+"""
+Headless render benchmark for the documentation app.
+
+Drives app.py through Streamlit's AppTest with asset requests redirected to
+a local fake server, and measures:
+
+- cold start: a fresh interpreter importing the app and rendering Home once,
+- per page: first render, warm rerun latency (median/p95) and peak Python
+  allocations while rendering,
+- peak RSS of the benchmark process.
+
+The results are written as JSON. Given a baseline report, any metric that
+grew by more than the threshold fails the run with exit status 1.
+
+Usage (from the repository root):
+    python -m benchmarks.bench_pages [--runs 20] [--output bench_report.json]
+        [--baseline previous.json --threshold 0.25]
+"""
+
+import argparse
+import http.server
+import json
+import os
+import platform
+import resource
+import statistics
+import subprocess
+import sys
+import threading
+import time
+import tracemalloc
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+APP_PATH = os.path.join(ROOT, "app.py")
+
+# Small but structurally valid Lottie document served for every asset URL
+FAKE_LOTTIE = {"v": "5.7.4", "fr": 30, "ip": 0, "op": 60, "w": 100, "h": 100, "layers": []}
+
+
+class _FakeAssetHandler(http.server.BaseHTTPRequestHandler):
+    latency = 0.0
+
+    def do_GET(self):
+        time.sleep(self.latency)
+        body = json.dumps(FAKE_LOTTIE).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+class _FakeAssetServer(http.server.ThreadingHTTPServer):
+    daemon_threads = True
+    # Well above the default of 5, so concurrent asset fetches are never
+    # dropped and retried after a 1 s SYN retransmit
+    request_queue_size = 128
+
+
+def start_fake_asset_server(latency: float) -> _FakeAssetServer:
+    """Starts a local HTTP server that answers every GET with FAKE_LOTTIE."""
+    handler = type("Handler", (_FakeAssetHandler,), {"latency": latency})
+    server = _FakeAssetServer(("127.0.0.1", 0), handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def cold_probe() -> dict:
+    """Runs in a fresh interpreter: imports the app and renders Home once."""
+    start = time.perf_counter()
+    import streamlit  # noqa: F401
+    from streamlit.testing.v1 import AppTest
+
+    sys.path.insert(0, ROOT)
+    import assets  # noqa: F401
+    import ui  # noqa: F401
+    imported = time.perf_counter()
+
+    at = AppTest.from_file(APP_PATH, default_timeout=60).run()
+    if at.exception:
+        raise RuntimeError(f"Home failed to render: {at.exception}")
+    return {
+        "import_s": imported - start,
+        "first_run_s": time.perf_counter() - imported,
+    }
+
+
+def measure_cold_start() -> dict:
+    start = time.perf_counter()
+    output = subprocess.run(
+        [sys.executable, "-m", "benchmarks.bench_pages", "--cold-probe"],
+        cwd=ROOT, env=os.environ.copy(), check=True, capture_output=True, text=True,
+    ).stdout
+    result = json.loads(output.strip().splitlines()[-1])
+    result["process_s"] = time.perf_counter() - start
+    return result
+
+
+def measure_pages(runs: int) -> dict:
+    from streamlit.testing.v1 import AppTest
+
+    from views import PAGES, page_slug
+
+    # Warm up the AppTest machinery so it is not billed to the first page
+    AppTest.from_string("import streamlit as st", default_timeout=60).run()
+
+    results = {}
+    for title in PAGES:
+        at = AppTest.from_file(APP_PATH, default_timeout=60)
+        at.query_params["page"] = page_slug(title)
+
+        start = time.perf_counter()
+        at.run()
+        first_render = time.perf_counter() - start
+        if at.exception:
+            raise RuntimeError(f"{title} failed to render: {at.exception}")
+
+        warm = []
+        for _ in range(runs):
+            start = time.perf_counter()
+            at.run()
+            warm.append(time.perf_counter() - start)
+
+        warm.sort()
+        results[title] = {
+            "first_render_s": first_render,
+            "warm_median_s": statistics.median(warm),
+            "warm_p95_s": warm[min(len(warm) - 1, int(len(warm) * 0.95))],
+        }
+
+    # Allocation tracing slows everything down, so memory gets its own pass
+    tracemalloc.start()
+    for title in PAGES:
+        at = AppTest.from_file(APP_PATH, default_timeout=60)
+        at.query_params["page"] = page_slug(title)
+        tracemalloc.reset_peak()
+        allocated_before = tracemalloc.get_traced_memory()[0]
+        at.run()
+        peak = tracemalloc.get_traced_memory()[1] - allocated_before
+        results[title]["peak_alloc_mb"] = peak / 2**20
+    tracemalloc.stop()
+    return results
+
+
+def flatten(report: dict, prefix: str = "") -> dict:
+    """Flattens the numeric metrics of a report into dotted keys."""
+    metrics = {}
+    for key, value in report.items():
+        if key == "meta":
+            continue
+        if isinstance(value, dict):
+            metrics.update(flatten(value, f"{prefix}{key}."))
+        elif isinstance(value, (int, float)):
+            metrics[f"{prefix}{key}"] = value
+    return metrics
+
+
+def find_regressions(report: dict, baseline: dict, threshold: float, min_delta: float) -> list:
+    """
+    Compares a report against a baseline.
+
+    Returns:
+        list: (metric, baseline, current) for every metric that grew by more
+        than `threshold` (relative) and `min_delta` (absolute).
+    """
+    current = flatten(report)
+    regressions = []
+    for metric, before in flatten(baseline).items():
+        after = current.get(metric)
+        if after is None or before <= 0:
+            continue
+        if after > before * (1 + threshold) and after - before > min_delta:
+            regressions.append((metric, before, after))
+    return regressions
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Headless render benchmark for app.py")
+    parser.add_argument("--runs", type=int, default=20, help="warm reruns per page")
+    parser.add_argument("--asset-latency", type=float, default=0.05,
+                        help="seconds the fake asset server waits before answering")
+    parser.add_argument("--use-bundle", action="store_true",
+                        help="serve assets from the packed bundle instead of the fake server")
+    parser.add_argument("--output", default="bench_report.json", help="report path")
+    parser.add_argument("--baseline", help="report to compare against")
+    parser.add_argument("--threshold", type=float, default=0.25,
+                        help="allowed relative growth of any metric")
+    parser.add_argument("--min-delta", type=float, default=0.002,
+                        help="ignore regressions smaller than this absolute amount")
+    parser.add_argument("--cold-probe", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.cold_probe:
+        print(json.dumps(cold_probe()))
+        return 0
+
+    # Must be configured before the app's modules are imported, here and in
+    # the cold-start subprocess which inherits the environment
+    server = start_fake_asset_server(args.asset_latency)
+    os.environ["HOMESCRAPPER_ASSET_MIRROR"] = f"http://127.0.0.1:{server.server_port}"
+    if not args.use_bundle:
+        os.environ["HOMESCRAPPER_ASSET_BUNDLE"] = os.devnull
+    # Keep runs independent of assets cached by earlier runs or other replicas
+    os.environ["HOMESCRAPPER_SHARED_CACHE"] = ""
+    sys.path.insert(0, ROOT)
+
+    import streamlit
+
+    report = {
+        "meta": {
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+            "python": platform.python_version(),
+            "streamlit": streamlit.__version__,
+            "runs": args.runs,
+            "asset_latency_s": args.asset_latency,
+            "use_bundle": args.use_bundle,
+        },
+        "cold_start": measure_cold_start(),
+        "pages": measure_pages(args.runs),
+        # ru_maxrss is reported in kilobytes on Linux
+        "peak_rss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+    }
+    server.shutdown()
+
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+
+    cold = report["cold_start"]
+    print(f"cold start: import {cold['import_s'] * 1000:.0f} ms, "
+          f"first run {cold['first_run_s'] * 1000:.0f} ms, process {cold['process_s']:.2f} s")
+    for title, page in report["pages"].items():
+        print(f"{title:<30} first {page['first_render_s'] * 1000:7.1f} ms  "
+              f"warm p50 {page['warm_median_s'] * 1000:6.1f} ms  "
+              f"p95 {page['warm_p95_s'] * 1000:6.1f} ms  "
+              f"peak {page['peak_alloc_mb']:.1f} MB")
+    print(f"peak RSS {report['peak_rss_mb']:.0f} MB; report written to {args.output}")
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)
+        regressions = find_regressions(report, baseline, args.threshold, args.min_delta)
+        for metric, before, after in regressions:
+            print(f"REGRESSION {metric}: {before:.4g} -> {after:.4g}", file=sys.stderr)
+        if regressions:
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
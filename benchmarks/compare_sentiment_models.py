@@ -0,0 +1,162 @@
+# benchmarks/compare_sentiment_models.py
+"""
+Compares the sentiment model formats on the same data:
+
+- "tfidf pickle": the documented TfidfVectorizer + LogisticRegression
+  pipeline, saved with joblib,
+- "tfidf mapped": the same pipeline exported as a memory-mapped artifact,
+- "hashing": the compact hashing model from train_sentiment.py.
+
+For each it reports held-out accuracy, agreement with the pickled model,
+size on disk, and the time and peak RSS of a fresh process loading it and
+answering one prediction.
+
+Without --data, a synthetic labelled corpus is generated, which is enough
+to compare size and load cost but says little about real accuracy.
+
+Usage (from the repository root):
+    python -m benchmarks.compare_sentiment_models [--data labelled.csv] [--samples 50000]
+        [--features 262144] [--output compare_report.json]
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+POSITIVE = ["good", "great", "love", "helpful", "amazing", "excellent", "easy", "fast", "recommend"]
+NEGATIVE = ["bad", "slow", "hate", "useless", "terrible", "awful", "broken", "crash", "refund"]
+
+# ru_maxrss survives fork+exec, so it would report the parent's peak; the
+# kernel's per-process high-water mark (VmHWM) starts afresh on exec
+LOAD_PROBE = """\
+import re, resource, sys, time
+started = time.perf_counter()
+from ml_service.sentiment import SentimentModel
+SentimentModel.load(sys.argv[1]).predict(["the pickup was quick and easy"])
+elapsed = time.perf_counter() - started
+try:
+    with open("/proc/self/status") as f:
+        peak_kb = int(re.search(r"VmHWM:\\s+(\\d+)", f.read()).group(1))
+except OSError:
+    peak_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+print(elapsed, peak_kb)
+"""
+
+
+def synthetic_corpus(samples: int, vocabulary: int = 50_000, seed: int = 0):
+    """Generates noisy labelled feedback: filler words plus a few sentiment words."""
+    rng = np.random.default_rng(seed)
+    filler = np.array([f"w{i}" for i in range(vocabulary)])
+    # Zipf-like word frequencies, as in real text
+    weights = 1 / np.arange(1, vocabulary + 1)
+    weights /= weights.sum()
+    labels = rng.integers(0, 2, samples)
+    texts = []
+    for label in labels:
+        words = list(rng.choice(filler, rng.integers(8, 30), p=weights))
+        cues = POSITIVE if (label == 1) != (rng.random() < 0.1) else NEGATIVE
+        words += list(rng.choice(cues, rng.integers(1, 3)))
+        rng.shuffle(words)
+        texts.append(" ".join(words))
+    return texts, labels
+
+
+def disk_size(path: str) -> int:
+    if os.path.isfile(path):
+        return os.path.getsize(path)
+    return sum(os.path.getsize(os.path.join(directory, name))
+               for directory, _, names in os.walk(path) for name in names)
+
+
+def measure_load(path: str) -> dict:
+    """Loads a model in a fresh interpreter; returns its wall time and peak RSS."""
+    result = subprocess.run(
+        [sys.executable, "-c", LOAD_PROBE, path], cwd=ROOT,
+        capture_output=True, text=True, check=True,
+    )
+    seconds, max_rss_kb = result.stdout.split()
+    return {"load_s": float(seconds), "peak_rss_mb": int(max_rss_kb) / 1024}
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Compares sentiment model formats.")
+    parser.add_argument("--data", help="CSV or JSONL with text and label columns (default: synthetic)")
+    parser.add_argument("--text-column", default="text")
+    parser.add_argument("--label-column", default="label")
+    parser.add_argument("--samples", type=int, default=50_000, help="synthetic corpus size")
+    parser.add_argument("--features", type=int, default=2 ** 18, help="hash columns")
+    parser.add_argument("--ngrams", type=int, nargs=2, default=(1, 2), metavar=("MIN", "MAX"))
+    parser.add_argument("--output", default="compare_report.json")
+    args = parser.parse_args(argv)
+
+    import joblib
+    from sklearn.feature_extraction.text import TfidfVectorizer
+    from sklearn.linear_model import LogisticRegression
+    from sklearn.pipeline import make_pipeline
+
+    from ml_service.artifact import VocabularyModel, publish
+    from ml_service.sentiment import SentimentModel, clean_text
+    from ml_service.train_sentiment import read_labelled, train_hashing
+
+    if args.data:
+        texts, labels = read_labelled(args.data, args.text_column, args.label_column)
+    else:
+        texts, labels = synthetic_corpus(args.samples)
+        texts = [clean_text(text) for text in texts]
+    split = int(len(texts) * 0.8)
+    order = np.random.default_rng(1).permutation(len(texts))
+    train, test = order[:split], order[split:]
+    train_texts, test_texts = [texts[i] for i in train], [texts[i] for i in test]
+    expected = np.array(["Positive" if labels[i] == 1 else "Negative" for i in test])
+
+    workdir = tempfile.mkdtemp(prefix="sentiment-models-")
+    paths, train_s = {}, {}
+
+    started = time.perf_counter()
+    pipeline = make_pipeline(TfidfVectorizer(ngram_range=tuple(args.ngrams)), LogisticRegression(max_iter=1000))
+    pipeline.fit(train_texts, labels[train])
+    train_s["tfidf pickle"] = train_s["tfidf mapped"] = time.perf_counter() - started
+    paths["tfidf pickle"] = os.path.join(workdir, "logistic_regression_sentiment_model.pkl")
+    joblib.dump(pipeline, paths["tfidf pickle"])
+    paths["tfidf mapped"] = publish(VocabularyModel.from_pipeline(pipeline), os.path.join(workdir, "mapped"), "v1")
+
+    started = time.perf_counter()
+    hashing = train_hashing(train_texts, labels[train], args.features, tuple(args.ngrams))
+    train_s["hashing"] = time.perf_counter() - started
+    paths["hashing"] = publish(hashing, os.path.join(workdir, "hashing"), "v1")
+
+    reference = None
+    report = {"data": args.data or f"synthetic ({len(texts)} texts)", "test_texts": len(test), "models": {}}
+    for name, path in paths.items():
+        predicted = np.array(SentimentModel.load(path).predict(test_texts))
+        if reference is None:
+            reference = predicted
+        report["models"][name] = {
+            "accuracy": float((predicted == expected).mean()),
+            "agreement_with_pickle": float((predicted == reference).mean()),
+            "size_mb": disk_size(path) / 2 ** 20,
+            "train_s": train_s[name],
+            **measure_load(path),
+        }
+
+    print(f"{report['data']}, {len(test)} held-out texts")
+    print(f"{'model':<14} {'accuracy':>8} {'agree':>7} {'size MB':>8} {'load ms':>8} {'peak RSS MB':>12}")
+    for name, row in report["models"].items():
+        print(f"{name:<14} {row['accuracy']:8.4f} {row['agreement_with_pickle']:7.4f} "
+              f"{row['size_mb']:8.2f} {row['load_s'] * 1000:8.0f} {row['peak_rss_mb']:12.0f}")
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+    print(f"report written to {args.output}; models kept in {workdir}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,387 @@
+# benchmarks/load_api.py
+"""
+Offline load test of the ML API.
+
+Serves ml_service.api with uvicorn in a subprocess against local stand-ins:
+
+- the stub model backend, with a configurable latency,
+- a local HTTP server with a pool of generated JPEG photos,
+- a small hashing sentiment model trained on synthetic feedback.
+
+Each scenario (an endpoint at a concurrency level) is driven closed-loop
+for a fixed duration and reports throughput, p50/p95/p99 latency, error
+rate and the server's event-loop lag, i.e. how late a timer on the
+server's loop fires. The results are written as JSON; given a baseline
+report, lower throughput or higher latency, errors or lag than the
+threshold allows fails the run with exit status 1.
+
+Usage (from the repository root):
+    python -m benchmarks.load_api [--endpoints feedback classify] [--concurrency 1 8 32 128]
+        [--duration 10] [--model-latency 0.2] [--output load_report.json]
+        [--baseline previous.json --threshold 0.25]
+"""
+
+import argparse
+import asyncio
+import http.server
+import io
+import json
+import os
+import platform
+import random
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Seconds between the server's event-loop lag probes
+LAG_INTERVAL = 0.01
+# Absolute error rate increase tolerated against a baseline
+ERROR_RATE_SLACK = 0.01
+
+SCENARIOS = {
+    "feedback": "/analyze-feedback/",
+    "feedback-batch": "/analyze-feedback/batch",
+    "classify": "/classify-scrap/",
+    "classify-stream": "/classify-scrap/stream",
+}
+
+
+class _ImageHandler(http.server.BaseHTTPRequestHandler):
+    images = []
+    latency = 0.0
+
+    def do_GET(self):
+        try:
+            body = self.images[int(self.path.strip("/").split(".")[0])]
+        except (ValueError, IndexError):
+            self.send_error(404)
+            return
+        time.sleep(self.latency)
+        self.send_response(200)
+        self.send_header("Content-Type", "image/jpeg")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+class _ImageServer(http.server.ThreadingHTTPServer):
+    daemon_threads = True
+    # The default backlog of 5 overflows when many image downloads start at
+    # once; each dropped connection then waits a 1 s SYN retransmit, which
+    # would be measured as service latency
+    request_queue_size = 128
+
+
+def start_image_server(count: int, size: int, latency: float, backlog: int = 128) -> _ImageServer:
+    """
+    Starts a local HTTP server serving `count` distinct JPEGs at /<i>.jpg.
+
+    `backlog` should cover the connections opened at once: concurrency
+    times images per request.
+    """
+    from PIL import Image, ImageDraw
+
+    rng = random.Random(0)
+    images = []
+    for _ in range(count):
+        img = Image.new("RGB", (size, size * 3 // 4), tuple(rng.randrange(256) for _ in range(3)))
+        draw = ImageDraw.Draw(img)
+        for _ in range(12):
+            x, y = rng.randrange(size), rng.randrange(size * 3 // 4)
+            draw.ellipse((x, y, x + size // 6, y + size // 6), fill=tuple(rng.randrange(256) for _ in range(3)))
+        buffer = io.BytesIO()
+        img.save(buffer, "JPEG", quality=90)
+        images.append(buffer.getvalue())
+    handler = type("Handler", (_ImageHandler,), {"images": images, "latency": latency})
+    server_class = type("ImageServer", (_ImageServer,),
+                        {"request_queue_size": max(_ImageServer.request_queue_size, backlog)})
+    server = server_class(("127.0.0.1", 0), handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+class LoopLagMonitor:
+    """Measures how late a periodic timer fires on the running event loop."""
+
+    def __init__(self, interval: float = LAG_INTERVAL):
+        self.interval = interval
+        self.samples = []
+
+    async def run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            expected = loop.time() + self.interval
+            await asyncio.sleep(self.interval)
+            self.samples.append(max(0.0, loop.time() - expected))
+
+    def snapshot(self, reset: bool = True) -> dict:
+        samples, self.samples = self.samples, ([] if reset else self.samples)
+        if not samples:
+            return {"lag_mean_ms": 0.0, "lag_p99_ms": 0.0, "lag_max_ms": 0.0}
+        return {
+            "lag_mean_ms": statistics.fmean(samples) * 1000,
+            "lag_p99_ms": percentile(samples, 99) * 1000,
+            "lag_max_ms": max(samples) * 1000,
+        }
+
+
+def serve(port: int) -> None:
+    """Runs in the server subprocess: the API plus a loop lag endpoint."""
+    import uvicorn
+
+    sys.path.insert(0, ROOT)
+    from ml_service.api import app
+
+    monitor = LoopLagMonitor()
+    app.add_api_route("/_loadtest/loop-lag", lambda: monitor.snapshot(), methods=["GET"])
+
+    async def main():
+        server = uvicorn.Server(uvicorn.Config(app, host="127.0.0.1", port=port, log_level="warning"))
+        lag_task = asyncio.create_task(monitor.run())
+        await server.serve()
+        lag_task.cancel()
+
+    asyncio.run(main())
+
+
+def percentile(values: list, pct: float) -> float:
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, round(pct / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def prepare_sentiment_model(directory: str) -> str:
+    from benchmarks.compare_sentiment_models import synthetic_corpus
+    from ml_service.artifact import publish
+    from ml_service.train_sentiment import train_hashing
+
+    texts, labels = synthetic_corpus(5_000, vocabulary=5_000)
+    publish(train_hashing(texts, labels), directory, "loadtest")
+    return directory
+
+
+def start_api(env: dict, port: int) -> subprocess.Popen:
+    process = subprocess.Popen(
+        [sys.executable, "-m", "benchmarks.load_api", "--serve", str(port)], cwd=ROOT, env=env,
+    )
+    import httpx
+
+    deadline = time.monotonic() + 60
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError("API server exited during startup")
+        try:
+            if httpx.get(f"http://127.0.0.1:{port}/healthz", timeout=1).status_code == 200:
+                return process
+        except httpx.HTTPError:
+            time.sleep(0.2)
+    process.terminate()
+    raise RuntimeError("API server did not become ready")
+
+
+def make_payload(scenario: str, rng: random.Random, args, image_base: str) -> dict:
+    if scenario == "feedback":
+        return {"text": rng.choice(FEEDBACK)}
+    if scenario == "feedback-batch":
+        return {"texts": [rng.choice(FEEDBACK) for _ in range(args.batch_size)]}
+    urls = [f"{image_base}/{rng.randrange(args.images)}.jpg" for _ in range(args.images_per_request)]
+    return {"image_urls": urls}
+
+
+FEEDBACK = [
+    "Amazing app, very helpful!", "The pickup was late and the agent was rude",
+    "Great prices for my old newspapers", "App keeps crashing when I upload a photo",
+    "Easy to use and fast", "Terrible support, no refund yet",
+    "Love how it tells me what is recyclable", "The scrap rates are too low",
+]
+
+
+async def run_scenario(client, scenario: str, concurrency: int, args, image_base: str) -> dict:
+    """Drives one scenario closed-loop for `args.duration` seconds."""
+    path = SCENARIOS[scenario]
+    latencies, attempts, errors, item_errors = [], 0, 0, 0
+    deadline = time.perf_counter() + args.duration
+
+    async def worker(seed: int):
+        nonlocal attempts, errors, item_errors
+        rng = random.Random(seed)
+        while time.perf_counter() < deadline:
+            attempts += 1
+            payload = make_payload(scenario, rng, args, image_base)
+            started = time.perf_counter()
+            try:
+                response = await client.post(path, json=payload)
+                body = response.text
+            except Exception:  # timeouts, resets: all count as failed requests
+                errors += 1
+                continue
+            latencies.append(time.perf_counter() - started)
+            if response.status_code >= 400:
+                errors += 1
+            elif scenario.startswith("classify"):
+                lines = body.splitlines() if scenario.endswith("stream") else [body]
+                item_errors += sum(line.count('"error"') for line in lines)
+
+    await client.get("/_loadtest/loop-lag")
+    started = time.perf_counter()
+    await asyncio.gather(*(worker(seed) for seed in range(concurrency)))
+    elapsed = time.perf_counter() - started
+    lag = (await client.get("/_loadtest/loop-lag")).json()
+
+    result = {
+        "requests": attempts,
+        "rps": (attempts - errors) / elapsed,
+        "error_rate": errors / attempts if attempts else 0.0,
+        **lag,
+    }
+    if latencies:
+        result.update(
+            p50_ms=percentile(latencies, 50) * 1000,
+            p95_ms=percentile(latencies, 95) * 1000,
+            p99_ms=percentile(latencies, 99) * 1000,
+        )
+    if scenario.startswith("classify"):
+        result["image_errors"] = item_errors
+    return result
+
+
+def find_regressions(report: dict, baseline: dict, threshold: float) -> list:
+    """
+    Compares a report against a baseline.
+
+    Returns:
+        list: (metric, baseline, current) for every throughput that fell, or
+        latency or lag that grew, by more than `threshold` (relative), and
+        every error rate that grew by more than ERROR_RATE_SLACK.
+    """
+    from benchmarks.bench_pages import flatten
+
+    current = flatten(report["scenarios"])
+    regressions = []
+    for metric, before in flatten(baseline["scenarios"]).items():
+        after = current.get(metric)
+        name = metric.rsplit(".", 1)[-1]
+        if after is None or name in ("requests", "image_errors"):
+            continue
+        if name == "rps":
+            if after < before * (1 - threshold):
+                regressions.append((metric, before, after))
+        elif name == "error_rate":
+            if after > before + ERROR_RATE_SLACK:
+                regressions.append((metric, before, after))
+        elif before > 0 and after > before * (1 + threshold) and after - before > 1.0:
+            regressions.append((metric, before, after))
+    return regressions
+
+
+async def drive(args, port: int, image_base: str) -> dict:
+    import httpx
+
+    scenarios = {}
+    limits = httpx.Limits(max_connections=max(args.concurrency), max_keepalive_connections=max(args.concurrency))
+    async with httpx.AsyncClient(base_url=f"http://127.0.0.1:{port}", timeout=args.timeout,
+                                 limits=limits) as client:
+        for scenario in args.endpoints:
+            for concurrency in args.concurrency:
+                result = await run_scenario(client, scenario, concurrency, args, image_base)
+                scenarios[f"{scenario}@{concurrency}"] = result
+                print(f"{scenario:<16} c={concurrency:<4} {result['rps']:8.1f} req/s  "
+                      f"p50 {result.get('p50_ms', 0):7.1f}  p95 {result.get('p95_ms', 0):7.1f}  "
+                      f"p99 {result.get('p99_ms', 0):7.1f} ms  errors {result['error_rate']:6.1%}  "
+                      f"loop lag p99 {result['lag_p99_ms']:6.1f} ms")
+    return scenarios
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Offline load test of the ML API")
+    parser.add_argument("--endpoints", nargs="+", choices=list(SCENARIOS), default=list(SCENARIOS))
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 8, 32, 128],
+                        help="concurrent clients, one scenario per value")
+    parser.add_argument("--duration", type=float, default=10.0, help="seconds per scenario")
+    parser.add_argument("--model-latency", type=float, default=0.2, help="stub model seconds per image")
+    parser.add_argument("--image-latency", type=float, default=0.0, help="image server seconds per image")
+    parser.add_argument("--images", type=int, default=200, help="distinct images served")
+    parser.add_argument("--image-size", type=int, default=1600, help="width of the served images")
+    parser.add_argument("--images-per-request", type=int, default=4)
+    parser.add_argument("--batch-size", type=int, default=32, help="texts per feedback batch")
+    parser.add_argument("--no-cache", action="store_true", help="disable the classification cache")
+    parser.add_argument("--timeout", type=float, default=30.0, help="client request timeout")
+    parser.add_argument("--output", default="load_report.json", help="report path")
+    parser.add_argument("--baseline", help="report to compare against")
+    parser.add_argument("--threshold", type=float, default=0.25, help="allowed relative change")
+    parser.add_argument("--serve", type=int, metavar="PORT", help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.serve:
+        serve(args.serve)
+        return 0
+
+    sys.path.insert(0, ROOT)
+    images = start_image_server(args.images, args.image_size, args.image_latency,
+                                backlog=max(args.concurrency) * args.images_per_request)
+    workdir = tempfile.mkdtemp(prefix="load-api-")
+    env = {
+        **os.environ,
+        "HOMESCRAPPER_MODEL_BACKEND": "stub",
+        "HOMESCRAPPER_STUB_LATENCY": str(args.model_latency),
+        "HOMESCRAPPER_SENTIMENT_MODEL_PATH": prepare_sentiment_model(os.path.join(workdir, "sentiment")),
+        "HOMESCRAPPER_MAX_IMAGES_PER_REQUEST": str(max(20, args.images_per_request)),
+        "HOMESCRAPPER_MAX_FEEDBACK_TEXTS": str(max(1000, args.batch_size)),
+    }
+    if args.no_cache:
+        env["HOMESCRAPPER_CACHE_ENTRIES"] = "0"
+    port = free_port()
+    server = start_api(env, port)
+    try:
+        scenarios = asyncio.run(drive(args, port, f"http://127.0.0.1:{images.server_port}"))
+    finally:
+        server.terminate()
+        server.wait()
+        images.shutdown()
+
+    report = {
+        "meta": {
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+            "python": platform.python_version(),
+            "duration_s": args.duration,
+            "model_latency_s": args.model_latency,
+            "image_latency_s": args.image_latency,
+            "images": args.images,
+            "images_per_request": args.images_per_request,
+            "batch_size": args.batch_size,
+            "cache": not args.no_cache,
+        },
+        "scenarios": scenarios,
+    }
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+    print(f"report written to {args.output}")
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)
+        regressions = find_regressions(report, baseline, args.threshold)
+        for metric, before, after in regressions:
+            print(f"REGRESSION {metric}: {before:.4g} -> {after:.4g}", file=sys.stderr)
+        if regressions:
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,203 @@
+# benchmarks/recommend_index.py
+"""
+Benchmarks the item-item recommendation index on a synthetic catalog.
+
+Generates listings in a few dozen categories and users whose interactions
+concentrate on one or two of them, holds out each user's last interaction,
+and reports:
+
+- build time and size on disk of the index,
+- per-user query latency from the index, next to computing similarities
+  per request (the history's item vectors against the whole catalog),
+- hit rate@N of the held-out interactions, next to recommending the most
+  popular items,
+- the time to add new listings incrementally versus rebuilding, and how
+  closely the incremental neighbour lists match the rebuilt ones (they
+  differ slightly because a rebuild also recomputes the listing IDF).
+
+Usage (from the repository root):
+    python -m benchmarks.recommend_index [--items 100000] [--users 50000] [--new 1000]
+        [--queries 2000] [--output recommend_report.json] [--index-dir DIR]
+"""
+
+import argparse
+import json
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+from benchmarks.compare_sentiment_models import disk_size
+
+CATEGORIES = 40
+WORDS_PER_CATEGORY = 30
+FILLER_WORDS = 2000
+MATERIALS = ["plastic", "paper", "glass", "copper", "aluminium", "iron", "steel", "wood", "textile", "rubber"]
+CONDITIONS = ["new", "used", "scrap"]
+STATES = ["Maharashtra", "Karnataka", "Delhi", "Tamil Nadu", "Gujarat", "West Bengal", "Kerala", "Punjab"]
+
+
+def synthetic_catalog(n_items: int, seed: int = 0) -> list:
+    """Generates listings whose titles share words within a category."""
+    rng = np.random.default_rng(seed)
+    categories = rng.integers(0, CATEGORIES, n_items)
+    items = []
+    for i, category in enumerate(categories):
+        words = [f"c{category}w{w}" for w in rng.integers(0, WORDS_PER_CATEGORY, 3)]
+        words += [f"f{w}" for w in rng.integers(0, FILLER_WORDS, 2)]
+        items.append({
+            "id": f"item{i}",
+            "title": " ".join(words),
+            "category": f"category{category}",
+            "material": MATERIALS[(category + rng.integers(0, 2)) % len(MATERIALS)],
+            "condition": CONDITIONS[rng.integers(0, len(CONDITIONS))],
+            "state": STATES[rng.integers(0, len(STATES))],
+            "price": float(rng.lognormal(5, 1)),
+        })
+    return items
+
+
+def synthetic_interactions(items: list, n_users: int, per_user: int = 20, seed: int = 1):
+    """
+    Generates interactions: each user favours one or two categories and
+    within them popular items; one in ten interactions is random.
+
+    Returns:
+        tuple: (training (user, item, weight) triples, held-out item id per user)
+    """
+    rng = np.random.default_rng(seed)
+    by_category = {}
+    for position, item in enumerate(items):
+        by_category.setdefault(item["category"], []).append(position)
+    categories = sorted(by_category)
+    popularity = {c: 1 / np.arange(1, len(by_category[c]) + 1) for c in categories}
+    for weights in popularity.values():
+        weights /= weights.sum()
+
+    training, held_out = [], {}
+    for user in range(n_users):
+        favourites = rng.choice(len(categories), rng.integers(1, 3), replace=False)
+        picks = []
+        for _ in range(max(2, rng.poisson(per_user))):
+            if rng.random() < 0.1:
+                picks.append(int(rng.integers(0, len(items))))
+                continue
+            category = categories[favourites[rng.integers(0, len(favourites))]]
+            members = by_category[category]
+            picks.append(members[rng.choice(len(members), p=popularity[category])])
+        user_id = f"user{user}"
+        held_out[user_id] = items[picks[-1]]["id"]
+        training.extend((user_id, items[p]["id"], 3.0 if rng.random() < 0.2 else 1.0) for p in picks[:-1])
+    return training, held_out
+
+
+def percentiles(samples: list) -> dict:
+    values = np.array(samples) * 1000
+    return {f"p{q}_ms": float(np.percentile(values, q)) for q in (50, 95, 99)}
+
+
+def per_request(index, vectors, history: list, n: int) -> np.ndarray:
+    """Recommends by computing the history's similarities to every item on the spot."""
+    positions = index.positions(history)
+    positions = positions[positions >= 0]
+    scores = np.asarray((vectors[positions] @ vectors.T).sum(axis=0)).ravel()
+    scores[positions] = -np.inf
+    best = np.argpartition(-scores, n)[:n]
+    return best[np.argsort(-scores[best])]
+
+
+def benchmark(args, workdir: str) -> dict:
+    """Runs the benchmark, publishing the built index under `workdir`."""
+    from ml_service.artifact import publish
+    from ml_service.recommend import ItemIndex, build_index
+
+    catalog = synthetic_catalog(args.items + args.new)
+    items, new_items = catalog[:args.items], catalog[args.items:]
+    interactions, held_out = synthetic_interactions(items, args.users)
+    histories = {}
+    for user, item, _ in interactions:
+        histories.setdefault(user, []).append(item)
+    report = {"items": args.items, "users": args.users, "interactions": len(interactions), "k": args.k}
+    print(f"{args.items} items, {args.users} users, {len(interactions)} interactions, k={args.k}")
+
+    started = time.perf_counter()
+    index = build_index(items, interactions, k=args.k)
+    report["build_s"] = time.perf_counter() - started
+    directory = publish(index, workdir, "v1")
+    report["size_mb"] = disk_size(directory) / 2 ** 20
+    index = ItemIndex.load(directory)
+    print(f"build {report['build_s']:.1f}s, {report['size_mb']:.1f} MB on disk")
+
+    rng = np.random.default_rng(2)
+    users = rng.choice(sorted(histories), min(args.queries, len(histories)), replace=False)
+    timings, hits = [], 0
+    for user in users:
+        started = time.perf_counter()
+        recommended = index.recommend(histories[user], n=args.n)
+        timings.append(time.perf_counter() - started)
+        hits += held_out[user] in {item_id for item_id, _ in recommended}
+    report["index_query"] = {**percentiles(timings), "mean_history": float(np.mean([len(histories[u]) for u in users]))}
+    report["hit_rate"] = hits / len(users)
+
+    popular = {item_id for item_id, _ in index.recommend([], n=args.n)}
+    report["popularity_hit_rate"] = sum(held_out[user] in popular for user in users) / len(users)
+
+    vectors = index.vectors()
+    timings = []
+    for user in users[:args.baseline_queries]:
+        started = time.perf_counter()
+        per_request(index, vectors, histories[user], args.n)
+        timings.append(time.perf_counter() - started)
+    report["per_request_query"] = percentiles(timings)
+    print(f"query p50 {report['index_query']['p50_ms']:.2f} ms, p99 {report['index_query']['p99_ms']:.2f} ms "
+          f"(per-request similarities: p50 {report['per_request_query']['p50_ms']:.1f} ms)")
+    print(f"hit rate@{args.n} {report['hit_rate']:.3f} (most popular: {report['popularity_hit_rate']:.3f})")
+
+    if args.new:
+        started = time.perf_counter()
+        updated = index.add_items(new_items)
+        report["add_s"] = time.perf_counter() - started
+        started = time.perf_counter()
+        rebuilt = build_index(catalog, interactions, k=args.k)
+        report["rebuild_s"] = time.perf_counter() - started
+        overlaps = []
+        for row in range(len(rebuilt)):
+            incremental, full = set(updated.neighbours[row]) - {-1}, set(rebuilt.neighbours[row]) - {-1}
+            if full:
+                overlaps.append(len(incremental & full) / len(full))
+        report["incremental_overlap"] = float(np.mean(overlaps))
+        print(f"add {args.new} listings {report['add_s']:.2f}s vs rebuild {report['rebuild_s']:.1f}s; "
+              f"neighbour lists match the rebuild at {report['incremental_overlap']:.4f}")
+    return report
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmarks the recommendation index on a synthetic catalog.")
+    parser.add_argument("--items", type=int, default=100_000)
+    parser.add_argument("--users", type=int, default=50_000)
+    parser.add_argument("--new", type=int, default=1000, help="listings added incrementally")
+    parser.add_argument("--k", type=int, default=50)
+    parser.add_argument("--n", type=int, default=10, help="recommendations per query")
+    parser.add_argument("--queries", type=int, default=2000)
+    parser.add_argument("--baseline-queries", type=int, default=50,
+                        help="queries timed for per-request similarity (slow)")
+    parser.add_argument("--output", default="recommend_report.json")
+    parser.add_argument("--index-dir", help="keep the built index here (default: a temporary directory, "
+                                            "removed afterwards)")
+    args = parser.parse_args(argv)
+
+    if args.index_dir:
+        report = benchmark(args, args.index_dir)
+    else:
+        with tempfile.TemporaryDirectory(prefix="recommend-index-") as workdir:
+            report = benchmark(args, workdir)
+
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+    print(f"report written to {args.output}" + (f"; index kept in {args.index_dir}" if args.index_dir else ""))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
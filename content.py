@@ -0,0 +1,218 @@
+# content.py
+"""
+Reads the documentation content of each page straight from its view module.
+
+Pages are plain Streamlit scripts, so rather than importing and executing
+them, their source is parsed with `ast` and the literal arguments of the
+Streamlit calls in `render()` are collected in order. This is what the
+search index is built from, and it never touches the network or the
+Streamlit runtime.
+"""
+
+import ast
+import hashlib
+import importlib.util
+import re
+import textwrap
+from dataclasses import dataclass, field
+
+from views import PAGES
+
+HEADING_CALLS = {"title", "header", "subheader"}
+LOTTIE_LOADERS = {"load_lottieurl", "load_lottieurl_async"}
+
+FENCE_RE = re.compile(r"```[^\n]*\n(.*?)```", re.S)
+# A project tree entry: "├── name", "└── name" or "│── name"; entries are
+# nested four columns per level
+TREE_BRANCH_RE = re.compile(r"[├└│]──\s*")
+TREE_NOTE_RE = re.compile(r"\s*\(.*\)$")
+
+
+@dataclass
+class Block:
+    """One rendered element of a page: a heading, markdown, expander, etc."""
+
+    kind: str
+    text: str = ""
+    children: list = field(default_factory=list)
+    label: str = ""
+    language: str = ""
+
+
+def page_path(title: str) -> str:
+    """Returns the source file of the view module registered for a page."""
+    return importlib.util.find_spec(PAGES[title]).origin
+
+
+def source_hash(path: str) -> str:
+    """Returns the SHA-256 digest of a file's contents."""
+    with open(path, "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+def _literal(node):
+    """Returns the string value of a constant node, or None."""
+    if isinstance(node, ast.Constant) and isinstance(node.value, str):
+        return node.value
+    return None
+
+
+def _call_name(call: ast.Call):
+    """Returns (owner, name) for calls like `st.title(...)` or `name(...)`."""
+    func = call.func
+    if isinstance(func, ast.Attribute) and isinstance(func.value, ast.Name):
+        return func.value.id, func.attr
+    if isinstance(func, ast.Name):
+        return None, func.id
+    return None, None
+
+
+class _PageReader:
+    def __init__(self, tree: ast.Module):
+        self.functions = {
+            node.name: node for node in tree.body if isinstance(node, ast.FunctionDef)
+        }
+        self.constants = {
+            target.id: node.value.value
+            for node in tree.body
+            if isinstance(node, ast.Assign) and _literal(node.value) is not None
+            for target in node.targets
+            if isinstance(target, ast.Name)
+        }
+
+    def _string(self, node):
+        """Returns a string literal, resolving module-level constants."""
+        if isinstance(node, ast.Name):
+            return self.constants.get(node.id)
+        return _literal(node)
+
+    def read(self, statements, seen=()) -> list:
+        blocks = []
+        for stmt in statements:
+            if isinstance(stmt, ast.With):
+                blocks.extend(self._read_with(stmt, seen))
+                continue
+            for node in ast.walk(stmt):
+                if isinstance(node, ast.Call):
+                    blocks.extend(self._read_call(node, seen))
+        return blocks
+
+    def _read_with(self, stmt: ast.With, seen) -> list:
+        for item in stmt.items:
+            call = item.context_expr
+            if isinstance(call, ast.Call) and _call_name(call) == ("st", "expander"):
+                label = _literal(call.args[0]) if call.args else None
+                return [Block("expander", label or "", self.read(stmt.body, seen))]
+        return self.read(stmt.body, seen)
+
+    def _read_call(self, call: ast.Call, seen) -> list:
+        owner, name = _call_name(call)
+        text = _literal(call.args[0]) if call.args else None
+
+        if owner is None and name in self.functions and name not in seen:
+            return self.read(self.functions[name].body, seen + (name,))
+        if owner is None and name in LOTTIE_LOADERS and text:
+            return [Block("lottie", text)]
+        if (owner, name) == ("ui", "code_listing") and len(call.args) == 3:
+            label, code, language = (self._string(arg) for arg in call.args)
+            return [Block("code", code or "", label=label or "", language=language or "")]
+        if owner != "st" or text is None:
+            return []
+        if name in HEADING_CALLS:
+            return [Block(name, text.strip())]
+        if name == "markdown" or name == "write":
+            text = textwrap.dedent(text).strip()
+            return [Block("divider")] if text == "---" else [Block("markdown", text)]
+        if name == "button":
+            return [Block("button", text)]
+        return []
+
+
+def parse_source(source: str, entry: str = "render") -> list:
+    """
+    Extracts the content blocks rendered by a page's entry function.
+
+    Calls to other module-level functions (such as fragments) are followed,
+    so blocks come back in the order they appear on screen.
+
+    Parameters:
+        source (str): Source code of a view module.
+        entry (str): Name of the function that renders the page.
+
+    Returns:
+        list: The page's Block objects.
+    """
+    reader = _PageReader(ast.parse(source))
+    if entry not in reader.functions:
+        return []
+    return reader.read(reader.functions[entry].body, (entry,))
+
+
+def page_blocks(title: str) -> list:
+    """Returns the content blocks of a registered page."""
+    with open(page_path(title), encoding="utf-8") as f:
+        return parse_source(f.read())
+
+
+def iter_blocks(blocks: list):
+    """Yields blocks depth-first, expanders before their contents."""
+    for block in blocks:
+        yield block
+        yield from iter_blocks(block.children)
+
+
+def parse_tree(text: str):
+    """
+    Parses an ASCII project tree such as the ones on the Frontend, Backend
+    and GenAI pages.
+
+    Parameters:
+        text (str): The tree, one entry per line, root first.
+
+    Returns:
+        tuple: (root name, list of paths relative to the root). Directory
+        paths end with "/", including ones only implied by nested entries.
+    """
+    lines = [line.rstrip() for line in text.splitlines() if line.strip()]
+    if not lines:
+        return "", []
+    root = TREE_NOTE_RE.sub("", lines[0].strip())
+    paths = []
+    stack = []  # directory names of the current entry's ancestors
+    for line in lines[1:]:
+        branch = TREE_BRANCH_RE.search(line)
+        if branch is None:
+            continue
+        depth = branch.start() // 4
+        name = TREE_NOTE_RE.sub("", line[branch.end():].strip())
+        if not name:
+            continue
+        del stack[depth:]
+        if len(stack) < depth:
+            # Misaligned entry; attach it to the deepest known directory
+            depth = len(stack)
+        if depth and not stack[-1].endswith("/"):
+            # The parent had children, so it was a directory after all
+            index = paths.index("".join(stack))
+            stack[-1] += "/"
+            paths[index] = "".join(stack)
+        stack.append(name)
+        paths.append("".join(stack))
+    return root, paths
+
+
+def project_trees(title: str) -> list:
+    """Returns the parsed project trees shown in a page's markdown."""
+    trees = []
+    for block in iter_blocks(page_blocks(title)):
+        if block.kind != "markdown":
+            continue
+        for fenced in FENCE_RE.findall(block.text):
+            if TREE_BRANCH_RE.search(fenced):
+                trees.append(parse_tree(fenced))
+    return trees
+
+
+def code_listings(title: str) -> list:
+    """Returns the code listing blocks of a registered page."""
+    return [block for block in iter_blocks(page_blocks(title)) if block.kind == "code"]
@@ -0,0 +1,161 @@
+# instrumentation.py
+"""
+Opt-in render timing for the documentation app.
+
+Timing is off unless HOMESCRAPPER_PROFILE is set (for every session) or a
+session opens the app with `?profile=1`. While a run is being profiled,
+`span()` blocks record how long each part of the run took; when the run
+ends, its record is
+
+- kept for the sidebar debug panel,
+- appended as one JSON line to HOMESCRAPPER_TIMINGS_FILE, if set,
+- folded into process-wide counters, written in Prometheus text format to
+  HOMESCRAPPER_METRICS_FILE (for node_exporter's textfile collector), if set.
+
+When profiling is off, `span()` costs one context variable lookup.
+"""
+
+import contextvars
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Optional
+
+PROFILE_ENV = os.environ.get("HOMESCRAPPER_PROFILE", "").lower() in ("1", "true", "yes")
+TIMINGS_FILE = os.environ.get("HOMESCRAPPER_TIMINGS_FILE", "")
+METRICS_FILE = os.environ.get("HOMESCRAPPER_METRICS_FILE", "")
+
+# Query parameter that turns profiling on for a single session
+PROFILE_QUERY_PARAM = "profile"
+
+METRIC_HELP = {
+    "homescrapper_run_seconds": "Time spent in profiled script runs.",
+    "homescrapper_span_seconds": "Time spent in instrumented sections of a run.",
+}
+
+
+@dataclass
+class RunRecord:
+    """Timings collected during one script run."""
+
+    page: str
+    started: float = field(default_factory=time.perf_counter)
+    timestamp: float = field(default_factory=time.time)
+    spans: list = field(default_factory=list)
+    total_ms: float = 0.0
+
+    def as_dict(self) -> dict:
+        return {
+            "ts": self.timestamp,
+            "page": self.page,
+            "total_ms": round(self.total_ms, 3),
+            "spans": self.spans,
+        }
+
+
+_current_run = contextvars.ContextVar("current_run", default=None)
+_depth = contextvars.ContextVar("span_depth", default=0)
+
+# Process-wide aggregates: (metric, labels) -> [count, seconds]
+_totals = {}
+_lock = threading.Lock()
+
+
+def enabled(query_params=None) -> bool:
+    """Returns True if the current run should be profiled."""
+    if PROFILE_ENV:
+        return True
+    return query_params is not None and query_params.get(PROFILE_QUERY_PARAM) in ("1", "true")
+
+
+def begin_run(page: str) -> RunRecord:
+    """Starts profiling a script run; spans on this thread are recorded into it."""
+    record = RunRecord(page)
+    _current_run.set(record)
+    return record
+
+
+def current_run() -> Optional[RunRecord]:
+    """Returns the run being profiled in this context, if any."""
+    return _current_run.get()
+
+
+@contextmanager
+def span(name: str, **labels):
+    """
+    Times a block of code within the current run.
+
+    Parameters:
+        name (str): What is being timed, e.g. "asset.fetch".
+        **labels: Extra detail stored with the timing (e.g. url=...).
+    """
+    record = _current_run.get()
+    if record is None:
+        yield
+        return
+
+    depth = _depth.get()
+    token = _depth.set(depth + 1)
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        end = time.perf_counter()
+        _depth.reset(token)
+        record.spans.append({
+            "name": name,
+            "depth": depth,
+            "start_ms": round((start - record.started) * 1000, 3),
+            "duration_ms": round((end - start) * 1000, 3),
+            "labels": labels,
+        })
+
+
+def end_run(record: RunRecord) -> None:
+    """Finishes a run: stores its totals and writes the configured sinks."""
+    record.total_ms = (time.perf_counter() - record.started) * 1000
+    record.spans.sort(key=lambda s: s["start_ms"])
+    _current_run.set(None)
+
+    with _lock:
+        _add_total("homescrapper_run_seconds", (("page", record.page),), record.total_ms)
+        for s in record.spans:
+            _add_total("homescrapper_span_seconds", (("name", s["name"]),), s["duration_ms"])
+
+        if TIMINGS_FILE:
+            with open(TIMINGS_FILE, "a", encoding="utf-8") as f:
+                f.write(json.dumps(record.as_dict(), separators=(",", ":")) + "\n")
+        if METRICS_FILE:
+            tmp_path = f"{METRICS_FILE}.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                f.write(_prometheus_text())
+            os.replace(tmp_path, METRICS_FILE)
+
+
+def _add_total(metric: str, labels: tuple, duration_ms: float) -> None:
+    total = _totals.setdefault((metric, labels), [0, 0.0])
+    total[0] += 1
+    total[1] += duration_ms / 1000
+
+
+def _prometheus_text() -> str:
+    lines = []
+    for metric, help_text in METRIC_HELP.items():
+        lines.append(f"# HELP {metric} {help_text}")
+        lines.append(f"# TYPE {metric} summary")
+        for (name, labels), (count, seconds) in sorted(_totals.items()):
+            if name != metric:
+                continue
+            label_text = ",".join(f'{k}="{v}"' for k, v in labels)
+            lines.append(f"{metric}_count{{{label_text}}} {count}")
+            lines.append(f"{metric}_sum{{{label_text}}} {seconds:.6f}")
+    return "\n".join(lines) + "\n"
+
+
+def prometheus_text() -> str:
+    """Returns the process-wide counters in Prometheus exposition format."""
+    with _lock:
+        return _prometheus_text()
@@ -0,0 +1,13 @@
+# ml_service/__init__.py
+"""
+Runnable reference implementation of the GenAI-X-ML API described on the
+"GenAI and Machine learning" documentation page.
+
+Install its dependencies with `pip install -r ml_service/requirements.txt`
+and start it from the repository root with:
+
+    uvicorn ml_service.api:app
+
+By default it uses a deterministic stub model, so it runs fully offline;
+set HOMESCRAPPER_MODEL_BACKEND=gemini and GOOGLE_API_KEY to use Gemini.
+"""
@@ -0,0 +1,165 @@
+# ml_service/api.py
+"""
+FastAPI application serving the GenAI-X-ML endpoints.
+
+Run from the repository root with `uvicorn ml_service.api:app`.
+"""
+
+import asyncio
+import json
+import os
+from contextlib import asynccontextmanager
+from typing import List, Optional
+
+from fastapi import FastAPI, HTTPException, Request
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel, Field
+
+from ml_service.artifact import POINTER, ModelStore
+from ml_service.backends import create_backend
+from ml_service.classify import ScrapClassifier
+from ml_service.config import Settings
+from ml_service.location import IPRangeTable, LocationResolver
+from ml_service.recommend import ItemIndex
+from ml_service.sentiment import MicroBatcher, SentimentModel
+
+settings = Settings.from_env()
+
+
+class ClassifyScrapRequest(BaseModel):
+    image_urls: List[str] = Field(min_length=1, max_length=settings.max_images_per_request)
+    state: Optional[str] = None
+    pin_code: Optional[str] = None
+
+
+class FeedbackRequest(BaseModel):
+    text: str
+
+
+class FeedbackBatchRequest(BaseModel):
+    texts: List[str] = Field(min_length=1, max_length=settings.max_feedback_texts)
+
+
+class RecommendRequest(BaseModel):
+    # Item ids the user viewed, saved or bought, with optional weights
+    history: List[str] = Field(default_factory=list, max_length=settings.max_recommend_history)
+    weights: Optional[List[float]] = None
+    exclude: List[str] = Field(default_factory=list, max_length=settings.max_recommend_history)
+    n: int = Field(10, ge=1, le=settings.max_recommendations)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    app.state.classifier = ScrapClassifier(create_backend(settings), settings)
+    ip_table = IPRangeTable.from_csv(settings.ip_ranges_path) if settings.ip_ranges_path else None
+    app.state.locations = LocationResolver(ip_table, ttl=settings.location_cache_ttl)
+    app.state.sentiment = None
+    app.state.sentiment_batcher = None
+    if os.path.exists(settings.sentiment_model_path):
+        app.state.sentiment = SentimentModel.load(settings.sentiment_model_path)
+        app.state.sentiment_batcher = MicroBatcher(
+            app.state.sentiment.predict,
+            max_batch_size=settings.sentiment_batch_size,
+            max_wait=settings.sentiment_batch_wait,
+        )
+    app.state.recommendations = None
+    if os.path.exists(os.path.join(settings.recommend_index_path, POINTER)):
+        app.state.recommendations = ModelStore[ItemIndex](settings.recommend_index_path, loader=ItemIndex.load)
+    yield
+    await app.state.classifier.aclose()
+    if app.state.sentiment_batcher is not None:
+        await app.state.sentiment_batcher.aclose()
+
+
+app = FastAPI(title="Home$crapper ML API", lifespan=lifespan)
+
+
+def client_ip(request: Request) -> Optional[str]:
+    if settings.trust_forwarded_for:
+        forwarded = request.headers.get("x-forwarded-for")
+        if forwarded:
+            return forwarded.split(",")[0].strip()
+    return request.client.host if request.client else None
+
+
+def request_location(body: ClassifyScrapRequest, request: Request) -> dict:
+    return request.app.state.locations.resolve(client_ip(request), body.pin_code, body.state)
+
+
+def sentiment_model(request: Request) -> SentimentModel:
+    if request.app.state.sentiment is None:
+        raise HTTPException(503, f"Sentiment model not found at {settings.sentiment_model_path}")
+    return request.app.state.sentiment
+
+
+# Feedback Sentiment Endpoints
+@app.post("/analyze-feedback/")
+async def analyze_feedback(body: FeedbackRequest, request: Request):
+    sentiment_model(request)
+    return {"sentiment": await request.app.state.sentiment_batcher.submit(body.text)}
+
+
+@app.post("/analyze-feedback/batch")
+async def analyze_feedback_batch(body: FeedbackBatchRequest, request: Request):
+    model = sentiment_model(request)
+    return {"sentiments": await asyncio.to_thread(model.predict, body.texts)}
+
+
+def recommendation_index(request: Request) -> ModelStore[ItemIndex]:
+    if request.app.state.recommendations is None:
+        raise HTTPException(503, f"Recommendation index not found at {settings.recommend_index_path}")
+    return request.app.state.recommendations
+
+
+# Recommendation Endpoints; queries read the precomputed index and take well
+# under a millisecond, so they run on the event loop
+@app.post("/recommend")
+async def recommend(body: RecommendRequest, request: Request):
+    if body.weights is not None and len(body.weights) != len(body.history):
+        raise HTTPException(422, "weights must have one entry per history item")
+    store = recommendation_index(request)
+    items = store.current().recommend(body.history, body.weights, body.n, body.exclude)
+    return {"items": [{"id": item_id, "score": score} for item_id, score in items], "version": store.version}
+
+
+@app.get("/recommend/similar/{item_id}")
+async def similar_items(item_id: str, request: Request, n: int = 10):
+    store = recommendation_index(request)
+    items = store.current().similar(item_id, max(1, min(n, settings.max_recommendations)))
+    if items is None:
+        raise HTTPException(404, f"Unknown item {item_id!r}")
+    return {"items": [{"id": other, "score": score} for other, score in items], "version": store.version}
+
+
+# Scrap Classification Endpoint
+@app.post("/classify-scrap/")
+async def classify_scrap(body: ClassifyScrapRequest, request: Request):
+    classifier = request.app.state.classifier
+    return await classifier.classify_urls(body.image_urls, request_location(body, request))
+
+
+# Streaming variant: one JSON line per image, in completion order
+@app.post("/classify-scrap/stream")
+async def classify_scrap_stream(body: ClassifyScrapRequest, request: Request):
+    classifier = request.app.state.classifier
+
+    async def lines():
+        results = classifier.iter_classifications(body.image_urls, request_location(body, request))
+        try:
+            async for result in results:
+                yield json.dumps(result, separators=(",", ":")) + "\n"
+        finally:
+            # Runs when the client disconnects too, cancelling pending model calls
+            await results.aclose()
+
+    return StreamingResponse(lines(), media_type="application/x-ndjson")
+
+
+@app.get("/cache/stats")
+async def cache_stats(request: Request):
+    return request.app.state.classifier.cache.stats()
+
+
+@app.get("/healthz")
+async def healthz():
+    return {"status": "ok", "model_backend": settings.model_backend}
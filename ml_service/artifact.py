@@ -0,0 +1,335 @@
+# ml_service/artifact.py
+"""
+Memory-mapped sentiment model artifacts.
+
+A pickled TF-IDF + linear model pipeline is unpickled into private memory
+by every server worker, and the vocabulary dict alone is a large heap of
+Python objects. Exported artifacts instead keep the model in plain .npy
+arrays loaded with `mmap_mode="r"`, so all workers share the same page
+cache pages, and startup needs neither unpickling nor scikit-learn:
+
+    <root>/CURRENT              name of the live version
+    <root>/<version>/meta.json  model kind, tokenizer settings, intercepts, classes
+    <root>/<version>/*.npy      the model's arrays
+
+Two kinds of model are stored:
+
+- "vocabulary": an exported scikit-learn TfidfVectorizer pipeline, with the
+  vocabulary as sorted bytes (looked up with searchsorted),
+- "hashing": terms hashed with CRC-32 into a fixed number of columns (see
+  train_sentiment.py), so there is no vocabulary at all and the IDF and
+  coefficient arrays are float32.
+
+Publishing a new version only rewrites CURRENT; running servers notice and
+switch to it on their next prediction, without a restart.
+
+Usage (from the repository root):
+    python -m ml_service.artifact logistic_regression_sentiment_model.pkl models/sentiment [--version v2]
+"""
+
+import abc
+import argparse
+import json
+import logging
+import os
+import re
+import sys
+import threading
+import time
+import zlib
+from typing import Callable, Generic, List, Sequence, Tuple, TypeVar
+
+import numpy as np
+
+FORMAT_VERSION = 1
+POINTER = "CURRENT"
+
+logger = logging.getLogger(__name__)
+
+# What a ModelStore's loader returns
+Model = TypeVar("Model")
+
+
+class TextModel(abc.ABC):
+    """
+    A TF-IDF weighted linear text classifier over memory-mappable arrays.
+
+    Subclasses define how terms map to columns. Produces the same
+    predictions as the equivalent scikit-learn pipeline.
+
+    Parameters:
+        meta (dict): Tokenizer and TF-IDF settings, intercepts and classes.
+        **arrays: The arrays named in `arrays`, at least "idf" (one weight
+            per column) and "coef" (one row of column weights per class).
+    """
+
+    kind = None
+    arrays = ("idf", "coef")
+
+    def __init__(self, meta: dict, **arrays):
+        self.meta = {**meta, "format": FORMAT_VERSION, "kind": self.kind}
+        for name in self.arrays:
+            setattr(self, name, arrays[name])
+        self.intercept = np.array(meta["intercept"], dtype=np.float64)
+        self.classes = np.array(meta["classes"])
+        self.lowercase = meta["lowercase"]
+        self.token_re = re.compile(meta["token_pattern"])
+        self.ngram_range = tuple(meta["ngram_range"])
+        self.stop_words = frozenset(meta["stop_words"])
+        self.sublinear_tf = meta["sublinear_tf"]
+        self.norm = meta["norm"]
+
+    @property
+    def n_columns(self) -> int:
+        return len(self.idf)
+
+    @classmethod
+    def load(cls, directory: str) -> "TextModel":
+        with open(os.path.join(directory, "meta.json"), encoding="utf-8") as f:
+            meta = json.load(f)
+        if meta["format"] != FORMAT_VERSION or meta.get("kind", "vocabulary") != cls.kind:
+            raise ValueError(f"{directory} does not hold a {cls.kind} model of format {FORMAT_VERSION}")
+        arrays = {name: np.load(os.path.join(directory, f"{name}.npy"), mmap_mode="r")
+                  for name in cls.arrays}
+        return cls(meta, **arrays)
+
+    def save(self, directory: str) -> None:
+        os.makedirs(directory, exist_ok=True)
+        for name in self.arrays:
+            np.save(os.path.join(directory, f"{name}.npy"), getattr(self, name))
+        with open(os.path.join(directory, "meta.json"), "w", encoding="utf-8") as f:
+            json.dump(self.meta, f)
+
+    def analyze(self, text: str) -> List[str]:
+        """Splits a text into the terms the vectorizer counts."""
+        if self.lowercase:
+            text = text.lower()
+        tokens = [token for token in self.token_re.findall(text) if token not in self.stop_words]
+        min_n, max_n = self.ngram_range
+        if max_n == 1:
+            return tokens
+        grams = list(tokens) if min_n == 1 else []
+        for n in range(max(min_n, 2), max_n + 1):
+            grams.extend(" ".join(tokens[i:i + n]) for i in range(len(tokens) - n + 1))
+        return grams
+
+    @abc.abstractmethod
+    def columns(self, grams: List[str]) -> np.ndarray:
+        """Returns the column of each term, or -1 for unknown terms."""
+
+    def term_counts(self, texts: Sequence[str]) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Counts the terms of a batch of texts.
+
+        Returns:
+            tuple: (document index, column, count) arrays, one entry per
+            distinct column of each document.
+        """
+        doc_ids, grams = [], []
+        for doc, text in enumerate(texts):
+            terms = self.analyze(text)
+            grams.extend(terms)
+            doc_ids.extend([doc] * len(terms))
+        if not grams:
+            empty = np.zeros(0, dtype=np.int64)
+            return empty, empty, empty
+        columns = self.columns(grams)
+        known = columns >= 0
+        pairs, counts = np.unique(np.array(doc_ids)[known] * self.n_columns + columns[known],
+                                  return_counts=True)
+        return pairs // self.n_columns, pairs % self.n_columns, counts
+
+    def tfidf(self, texts: Sequence[str]) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Returns the (document index, column, weight) entries of the TF-IDF matrix."""
+        docs, columns, counts = self.term_counts(texts)
+        weights = counts.astype(np.float64)
+        if self.sublinear_tf:
+            weights = 1 + np.log(weights)
+        weights *= self.idf[columns]
+        if self.norm == "l2":
+            norms = np.sqrt(np.bincount(docs, weights * weights, minlength=len(texts)))
+            weights /= norms[docs]
+        elif self.norm == "l1":
+            weights /= np.bincount(docs, np.abs(weights), minlength=len(texts))[docs]
+        return docs, columns, weights
+
+    def decision_function(self, texts: Sequence[str]) -> np.ndarray:
+        """Returns the classifier scores, shape (len(texts), number of coef rows)."""
+        docs, columns, weights = self.tfidf(texts)
+        scores = np.tile(self.intercept, (len(texts), 1))
+        for row in range(self.coef.shape[0]):
+            scores[:, row] += np.bincount(docs, weights * self.coef[row, columns], minlength=len(texts))
+        return scores
+
+    def predict(self, texts: Sequence[str]) -> np.ndarray:
+        scores = self.decision_function(texts)
+        if scores.shape[1] == 1:
+            return self.classes[(scores[:, 0] > 0).astype(int)]
+        return self.classes[scores.argmax(axis=1)]
+
+
+class VocabularyModel(TextModel):
+    """An exported TfidfVectorizer pipeline; see `from_pipeline`."""
+
+    kind = "vocabulary"
+    arrays = ("terms", "idf", "coef")
+
+    def columns(self, grams: List[str]) -> np.ndarray:
+        keys = np.array([gram.encode("utf-8") for gram in grams], dtype=np.bytes_)
+        positions = np.searchsorted(self.terms, keys)
+        positions[positions == len(self.terms)] = 0
+        return np.where(self.terms[positions] == keys, positions, -1)
+
+    @classmethod
+    def from_pipeline(cls, pipeline) -> "VocabularyModel":
+        """
+        Converts a fitted TfidfVectorizer + linear classifier pipeline.
+
+        Raises:
+            ValueError: If the pipeline uses options the model cannot replay.
+        """
+        from sklearn.feature_extraction.text import TfidfVectorizer
+
+        steps = [step for _, step in pipeline.steps]
+        if len(steps) != 2 or not isinstance(steps[0], TfidfVectorizer):
+            raise ValueError("Expected a pipeline of a TfidfVectorizer and a linear classifier")
+        vectorizer, classifier = steps
+        if (vectorizer.analyzer != "word" or vectorizer.tokenizer or vectorizer.preprocessor
+                or vectorizer.strip_accents or vectorizer.binary):
+            raise ValueError("Only the default word analyzer without accent stripping is supported")
+
+        terms = sorted(vectorizer.vocabulary_, key=lambda term: term.encode("utf-8"))
+        columns = np.array([vectorizer.vocabulary_[term] for term in terms])
+        idf = vectorizer.idf_ if vectorizer.use_idf else np.ones(len(terms))
+        meta = {
+            "lowercase": vectorizer.lowercase,
+            "token_pattern": vectorizer.token_pattern,
+            "ngram_range": list(vectorizer.ngram_range),
+            "stop_words": sorted(vectorizer.get_stop_words() or []),
+            "sublinear_tf": vectorizer.sublinear_tf,
+            "norm": vectorizer.norm,
+            "intercept": np.atleast_1d(classifier.intercept_).tolist(),
+            "classes": classifier.classes_.tolist(),
+        }
+        return cls(
+            meta,
+            terms=np.array([term.encode("utf-8") for term in terms], dtype=np.bytes_),
+            idf=np.asarray(idf, dtype=np.float64)[columns],
+            coef=np.ascontiguousarray(np.atleast_2d(classifier.coef_)[:, columns], dtype=np.float64),
+        )
+
+
+class HashingModel(TextModel):
+    """
+    Terms hashed into `meta["n_features"]` columns with CRC-32, which is
+    stable across processes and platforms. Built by train_sentiment.py.
+    """
+
+    kind = "hashing"
+
+    def columns(self, grams: List[str]) -> np.ndarray:
+        n_features = self.meta["n_features"]
+        return np.array([zlib.crc32(gram.encode("utf-8")) % n_features for gram in grams], dtype=np.int64)
+
+
+MODEL_KINDS = {model.kind: model for model in (VocabularyModel, HashingModel)}
+
+
+def load_model(directory: str) -> TextModel:
+    """Memory-maps the model stored in an artifact version directory."""
+    with open(os.path.join(directory, "meta.json"), encoding="utf-8") as f:
+        kind = json.load(f).get("kind", "vocabulary")
+    if kind not in MODEL_KINDS:
+        raise ValueError(f"Unknown model kind {kind!r} in {directory}")
+    return MODEL_KINDS[kind].load(directory)
+
+
+def current_version(root: str) -> str:
+    with open(os.path.join(root, POINTER), encoding="utf-8") as f:
+        return f.read().strip()
+
+
+def publish(model: TextModel, root: str, version: str) -> str:
+    """
+    Saves `model` as `version` under `root` and makes it the live one.
+    Anything with a `save(directory)` method can be published.
+
+    Returns:
+        str: The version directory.
+    """
+    directory = os.path.join(root, version)
+    if os.path.exists(directory):
+        raise ValueError(f"Version {version!r} already exists in {root}")
+    model.save(directory)
+    temp = os.path.join(root, POINTER + ".tmp")
+    with open(temp, "w", encoding="utf-8") as f:
+        f.write(version + "\n")
+    os.replace(temp, os.path.join(root, POINTER))
+    return directory
+
+
+class ModelStore(Generic[Model]):
+    """
+    The live model of an artifact root, following CURRENT.
+
+    The pointer is re-read at most every `check_interval` seconds; when it
+    names a new version, that version is mapped and used for subsequent
+    predictions while calls already running finish on the old one.
+
+    `loader` maps a version directory to its model, and the store is typed
+    by what it returns: a `ModelStore[TextModel]` by default, while other
+    artifacts laid out the same way pass their own loader, e.g.
+    `ModelStore[ItemIndex](root, loader=ItemIndex.load)`.
+    """
+
+    def __init__(self, root: str, check_interval: float = 1.0,
+                 loader: Callable[[str], Model] = load_model):
+        self.root = root
+        self.check_interval = check_interval
+        self.loader = loader
+        self._lock = threading.Lock()
+        self.version = current_version(root)
+        self._model = loader(os.path.join(root, self.version))
+        self._next_check = time.monotonic() + check_interval
+
+    def current(self) -> Model:
+        """Returns the live model, switching to a newly published version first."""
+        if time.monotonic() >= self._next_check:
+            with self._lock:
+                if time.monotonic() >= self._next_check:
+                    self._next_check = time.monotonic() + self.check_interval
+                    try:
+                        version = current_version(self.root)
+                        if version != self.version:
+                            self._model = self.loader(os.path.join(self.root, version))
+                            self.version = version
+                    except (OSError, ValueError) as exc:
+                        # Keep serving the loaded version if the new one is broken
+                        logger.warning("Not switching %s to its new version: %s", self.root, exc)
+        return self._model
+
+    def predict(self, texts: Sequence[str]) -> np.ndarray:
+        """Predicts with the live model; for stores of text models."""
+        return self.current().predict(texts)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Exports a pickled sentiment pipeline as a memory-mapped artifact.")
+    parser.add_argument("model", help="joblib-pickled TfidfVectorizer + classifier pipeline")
+    parser.add_argument("root", help="artifact root, e.g. models/sentiment")
+    parser.add_argument("--version", default=time.strftime("%Y%m%d-%H%M%S"), help="version name")
+    args = parser.parse_args(argv)
+
+    import joblib
+
+    try:
+        directory = publish(VocabularyModel.from_pipeline(joblib.load(args.model)), args.root, args.version)
+    except (OSError, ValueError) as exc:
+        print(exc, file=sys.stderr)
+        return 1
+    print(f"published {directory}; {os.path.join(args.root, POINTER)} -> {args.version}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
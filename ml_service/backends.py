@@ -0,0 +1,113 @@
+# ml_service/backends.py
+"""
+Pluggable generative model backends for scrap classification.
+
+A backend turns a prompt plus one encoded image into the model's text
+answer. The classifier only talks to this interface, so the Gemini model
+can be swapped for the deterministic stub to test throughput offline.
+"""
+
+import abc
+import asyncio
+import hashlib
+import os
+
+from ml_service.config import Settings
+
+
+class ModelBackend(abc.ABC):
+    """Interface every model backend implements."""
+
+    name = "base"
+
+    @abc.abstractmethod
+    async def generate(self, prompt: str, image: bytes, mime_type: str) -> str:
+        """
+        Asks the model about an image.
+
+        Parameters:
+            prompt (str): The instructions for the model.
+            image (bytes): The encoded image.
+            mime_type (str): The image's MIME type, e.g. "image/jpeg".
+
+        Returns:
+            str: The model's text response.
+        """
+
+    async def aclose(self) -> None:
+        """Releases any resources held by the backend."""
+
+
+class StubBackend(ModelBackend):
+    """
+    Deterministic local model: the answer depends only on the image bytes.
+
+    The same image always gets the same classification, and an optional
+    delay stands in for the latency of a real model call.
+    """
+
+    name = "stub"
+
+    # (item, recyclable, sellable)
+    ITEMS = [
+        ("plastic bottle", True, True),
+        ("newspaper bundle", True, True),
+        ("aluminium can", True, True),
+        ("old mobile phone", True, True),
+        ("cardboard box", True, False),
+        ("broken glass", True, False),
+        ("food waste", False, False),
+        ("thermocol packaging", False, False),
+    ]
+
+    def __init__(self, latency: float = 0.0):
+        self.latency = latency
+
+    async def generate(self, prompt: str, image: bytes, mime_type: str) -> str:
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        digest = hashlib.sha256(image).digest()
+        item, recyclable, sellable = self.ITEMS[digest[0] % len(self.ITEMS)]
+        if sellable:
+            advice = "Sell it to a local scrap vendor."
+        elif recyclable:
+            advice = "Hand it over with your dry waste for recycling."
+        else:
+            advice = "Dispose of it with your wet or reject waste."
+        return (
+            f"Item: {item}\n"
+            f"Recyclable: {'yes' if recyclable else 'no'}\n"
+            f"Sellable: {'yes' if sellable else 'no'}\n"
+            f"Recommendation: {advice}"
+        )
+
+
+class GeminiBackend(ModelBackend):
+    """Google Generative AI backend, using the async client API."""
+
+    name = "gemini"
+
+    def __init__(self, model_name: str, api_key: str):
+        # Optional dependency, only needed when this backend is selected
+        import google.generativeai as genai
+
+        genai.configure(api_key=api_key)
+        self._model = genai.GenerativeModel(model_name)
+
+    async def generate(self, prompt: str, image: bytes, mime_type: str) -> str:
+        response = await self._model.generate_content_async(
+            [prompt, {"mime_type": mime_type, "data": image}]
+        )
+        return response.text
+
+
+def create_backend(settings: Settings) -> ModelBackend:
+    """Builds the backend selected by `settings.model_backend`."""
+    if settings.model_backend == "stub":
+        return StubBackend(latency=settings.stub_latency)
+    if settings.model_backend == "gemini":
+        api_key = os.environ.get("GOOGLE_API_KEY")
+        if not api_key:
+            raise RuntimeError("GOOGLE_API_KEY must be set to use the gemini backend")
+        return GeminiBackend(settings.gemini_model, api_key)
+    raise ValueError(f"Unknown model backend: {settings.model_backend!r}")
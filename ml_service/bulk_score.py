@@ -0,0 +1,260 @@
+# ml_service/bulk_score.py
+"""
+Scores the sentiment of a large CSV or JSONL feedback file offline.
+
+The input is streamed in fixed-size chunks which are scored by a pool of
+worker processes, each loading the model once. Results are written in input
+order with only a bounded number of chunks in memory, and a checkpoint after
+every chunk lets an interrupted run resume where it stopped: it records the
+input byte offset reached, so a resumed run seeks straight past the rows
+already scored instead of reading them again.
+
+Usage (from the repository root):
+    python -m ml_service.bulk_score feedback.csv scored.csv [--text-column text]
+        [--chunk-size 10000] [--workers 4] [--model models/sentiment] [--restart]
+"""
+
+import argparse
+import collections
+import csv
+import io
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Iterator, List, Tuple
+
+from ml_service.config import Settings
+from ml_service.sentiment import SentimentModel
+
+# Seconds between progress lines
+REPORT_INTERVAL = 5.0
+
+_model = None
+
+
+def _init_worker(model_path: str) -> None:
+    global _model
+    _model = SentimentModel.load(model_path)
+
+
+def _score(texts: List[str]) -> List[str]:
+    return _model.predict(texts)
+
+
+def file_format(path: str) -> str:
+    """Returns "csv" or "jsonl" based on the file extension."""
+    extension = os.path.splitext(path)[1].lower()
+    if extension == ".csv":
+        return "csv"
+    if extension in (".jsonl", ".ndjson"):
+        return "jsonl"
+    raise ValueError(f"Unsupported file type {extension!r}; expected .csv or .jsonl")
+
+
+def read_chunks(path: str, chunk_size: int) -> Iterator[List[Dict]]:
+    """Yields the rows of a CSV or JSONL file in lists of `chunk_size`."""
+    for chunk, _ in read_chunks_at(path, chunk_size):
+        yield chunk
+
+
+def read_chunks_at(path: str, chunk_size: int, offset: int = 0) -> Iterator[Tuple[List[Dict], int]]:
+    """
+    Yields the rows of a CSV or JSONL file in lists of `chunk_size`, each
+    with the byte offset just past its last row.
+
+    Parameters:
+        offset (int): Where to start reading: 0, or an offset yielded by an
+            earlier call. A CSV header is always read from the start.
+    """
+    fmt = file_format(path)
+    with open(path, "rb") as f:
+        position = offset
+
+        def lines() -> Iterator[str]:
+            nonlocal position
+            for line in f:
+                position += len(line)
+                yield line.decode("utf-8")
+
+        if fmt == "csv":
+            fieldnames = next(csv.reader([f.readline().decode("utf-8")]), [])
+            if offset:
+                f.seek(offset)
+            else:
+                position = f.tell()
+            rows = csv.DictReader(lines(), fieldnames=fieldnames)
+        else:
+            f.seek(offset)
+            rows = (json.loads(line) for line in lines() if line.strip())
+        chunk = []
+        for row in rows:
+            chunk.append(row)
+            if len(chunk) == chunk_size:
+                yield chunk, position
+                chunk = []
+        if chunk:
+            yield chunk, position
+
+
+def csv_columns(path: str) -> List[str]:
+    with open(path, newline="", encoding="utf-8") as f:
+        return next(csv.reader(f), [])
+
+
+def encode_chunk(rows: List[Dict], labels: List[str], fmt: str, columns: List[str]) -> bytes:
+    """Serialises scored rows in the output format."""
+    buffer = io.StringIO()
+    if fmt == "csv":
+        writer = csv.DictWriter(buffer, fieldnames=columns, extrasaction="ignore")
+        for row, label in zip(rows, labels):
+            writer.writerow({**row, "sentiment": label})
+    else:
+        for row, label in zip(rows, labels):
+            buffer.write(json.dumps({**row, "sentiment": label}, ensure_ascii=False) + "\n")
+    return buffer.getvalue().encode("utf-8")
+
+
+class Checkpoint:
+    """
+    Progress of a run, stored next to the output as `<output>.checkpoint`.
+
+    Records how many chunks were written, and the input offset and output
+    size at that point, so a resumed run can drop a partly written chunk and
+    seek past the input already scored.
+    """
+
+    def __init__(self, output: str, source: str, chunk_size: int):
+        self.path = output + ".checkpoint"
+        self.state = {"input": os.path.abspath(source), "chunk_size": chunk_size,
+                      "chunks": 0, "rows": 0, "input_bytes": 0, "output_bytes": 0}
+
+    def load(self) -> bool:
+        """Reads a matching checkpoint; returns False if there is none."""
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                saved = json.load(f)
+        except (OSError, ValueError):
+            return False
+        if (saved.get("input"), saved.get("chunk_size")) != (self.state["input"], self.state["chunk_size"]):
+            raise SystemExit(
+                f"{self.path} was written for a different input or chunk size; "
+                "use --restart to start over"
+            )
+        if "input_bytes" not in saved:
+            raise SystemExit(f"{self.path} has no input offset; use --restart to start over")
+        self.state = saved
+        return True
+
+    def save(self, chunks: int, rows: int, input_bytes: int, output_bytes: int) -> None:
+        self.state.update(chunks=chunks, rows=rows, input_bytes=input_bytes, output_bytes=output_bytes)
+        temp = self.path + ".tmp"
+        with open(temp, "w", encoding="utf-8") as f:
+            json.dump(self.state, f)
+        os.replace(temp, self.path)
+
+    def remove(self) -> None:
+        if os.path.exists(self.path):
+            os.remove(self.path)
+
+
+def score_file(source: str, output: str, model_path: str, text_column: str = "text",
+               chunk_size: int = 10_000, workers: int = None, restart: bool = False) -> int:
+    """
+    Scores every row of `source` into `output`, resuming a previous run
+    unless `restart` is set.
+
+    Returns:
+        int: Number of rows scored by this run.
+    """
+    fmt = file_format(source)
+    if file_format(output) != fmt:
+        raise ValueError("Input and output must have the same format")
+    if not os.path.exists(model_path):
+        raise FileNotFoundError(f"Sentiment model not found at {model_path}")
+
+    columns = []
+    if fmt == "csv":
+        columns = csv_columns(source)
+        if text_column not in columns:
+            raise ValueError(f"{source} has no {text_column!r} column")
+        columns = [*columns, "sentiment"] if "sentiment" not in columns else columns
+
+    checkpoint = Checkpoint(output, source, chunk_size)
+    resumed = not restart and checkpoint.load()
+    done_chunks, done_rows = checkpoint.state["chunks"], checkpoint.state["rows"]
+
+    workers = workers or os.cpu_count() or 1
+    max_in_flight = 2 * workers
+    started = last_report = time.perf_counter()
+    scored = 0
+
+    with open(output, "r+b" if resumed else "wb") as out, \
+            ProcessPoolExecutor(workers, initializer=_init_worker, initargs=(model_path,)) as pool:
+        if resumed:
+            # Drop whatever a crash left after the last checkpointed chunk
+            out.truncate(checkpoint.state["output_bytes"])
+            out.seek(0, os.SEEK_END)
+            print(f"resuming after {done_rows} rows ({done_chunks} chunks)", file=sys.stderr)
+        elif fmt == "csv":
+            header = io.StringIO()
+            csv.writer(header).writerow(columns)
+            out.write(header.getvalue().encode("utf-8"))
+
+        pending = collections.deque()
+
+        def write_oldest() -> None:
+            nonlocal done_chunks, done_rows, scored, last_report
+            rows, input_bytes, future = pending.popleft()
+            out.write(encode_chunk(rows, future.result(), fmt, columns))
+            out.flush()
+            os.fsync(out.fileno())
+            done_chunks += 1
+            done_rows += len(rows)
+            scored += len(rows)
+            checkpoint.save(done_chunks, done_rows, input_bytes, out.tell())
+            now = time.perf_counter()
+            if now - last_report >= REPORT_INTERVAL:
+                last_report = now
+                print(f"{done_rows} rows, {scored / (now - started):,.0f} rows/s", file=sys.stderr)
+
+        for rows, input_bytes in read_chunks_at(source, chunk_size, checkpoint.state["input_bytes"]):
+            texts = [str(row.get(text_column) or "") for row in rows]
+            pending.append((rows, input_bytes, pool.submit(_score, texts)))
+            if len(pending) >= max_in_flight:
+                write_oldest()
+        while pending:
+            write_oldest()
+
+    checkpoint.remove()
+    elapsed = time.perf_counter() - started
+    print(f"scored {scored} rows in {elapsed:.1f}s ({scored / elapsed if elapsed else 0:,.0f} rows/s); "
+          f"{done_rows} rows in {output}", file=sys.stderr)
+    return scored
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("input", help="CSV or JSONL file of feedback")
+    parser.add_argument("output", help="where to write the scored rows (same format)")
+    parser.add_argument("--text-column", default="text", help="column/field holding the feedback text")
+    parser.add_argument("--chunk-size", type=int, default=10_000, help="rows per chunk")
+    parser.add_argument("--workers", type=int, default=None, help="worker processes (default: CPU count)")
+    parser.add_argument("--model", default=Settings.from_env().sentiment_model_path,
+                        help="sentiment model: an artifact root with a CURRENT pointer or one of its "
+                             "version directories (see artifact.py), or a joblib-pickled pipeline")
+    parser.add_argument("--restart", action="store_true", help="ignore any checkpoint and start over")
+    args = parser.parse_args(argv)
+
+    try:
+        score_file(args.input, args.output, args.model, args.text_column,
+                   args.chunk_size, args.workers, args.restart)
+    except (OSError, ValueError) as exc:
+        print(exc, file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,206 @@
+# ml_service/cache.py
+"""
+Content-addressed cache for scrap classification results.
+
+Results are keyed by an exact digest of the decoded, normalized image, so
+the same photo re-uploaded maps to the same key, together with the resolved
+state, the prompt version and the model backend. The digest is exact on
+purpose: a near-duplicate match would serve one listing's classification
+for a different item that merely looks alike. Two tiers are used:
+
+- an in-memory LRU, answering repeat classifications in microseconds,
+- an optional SQLite file shared across restarts and worker processes,
+  with a TTL and a cap on the number of stored entries.
+"""
+
+import asyncio
+import hashlib
+import io
+import json
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional
+
+from PIL import Image, UnidentifiedImageError
+
+# SQLite rows deleted in one go when the disk tier is over capacity
+EVICTION_BATCH = 0.1
+
+
+def content_digest(image: bytes) -> str:
+    """
+    Returns the digest of an encoded image (see `image_digest`).
+
+    Data that cannot be decoded as an image falls back to a SHA-256 of the
+    bytes.
+    """
+    try:
+        with Image.open(io.BytesIO(image)) as img:
+            return image_digest(img)
+    except (UnidentifiedImageError, OSError):
+        return "sha256-" + hashlib.sha256(image).hexdigest()
+
+
+def image_digest(img: Image.Image) -> str:
+    """
+    Returns a SHA-256 of a decoded image's size and RGB pixels.
+
+    Independent of the file's encoding details (metadata, container), but
+    any change to the pixels gives a different digest.
+    """
+    rgb = img.convert("RGB")
+    digest = hashlib.sha256(f"{rgb.width}x{rgb.height}:".encode())
+    digest.update(rgb.tobytes())
+    return "rgb-" + digest.hexdigest()
+
+
+class ResultCache:
+    """
+    Two-tier (memory LRU + optional SQLite) cache of classification results.
+
+    Parameters:
+        max_entries (int): Capacity of the in-memory LRU.
+        ttl (float): Seconds a result stays valid, in both tiers.
+        db_path (str): SQLite file for the disk tier; empty to disable it.
+        max_db_entries (int): Rows kept in the disk tier before the oldest
+            are evicted.
+    """
+
+    def __init__(self, max_entries: int = 10_000, ttl: float = 7 * 24 * 3600,
+                 db_path: str = "", max_db_entries: int = 1_000_000):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.max_db_entries = max_db_entries
+        self._memory = OrderedDict()
+        self._lock = threading.Lock()
+        self._db = None
+        self._db_rows = 0
+        self.counters = {
+            "memory_hits": 0, "disk_hits": 0, "misses": 0,
+            "stores": 0, "memory_evictions": 0, "disk_evictions": 0, "expired": 0,
+        }
+        if db_path:
+            self._db = sqlite3.connect(db_path, check_same_thread=False, isolation_level=None)
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.execute("PRAGMA synchronous=NORMAL")
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS results "
+                "(key TEXT PRIMARY KEY, value TEXT NOT NULL, created REAL NOT NULL)"
+            )
+            self._db.execute("CREATE INDEX IF NOT EXISTS results_created ON results (created)")
+            self._db_rows = self._db.execute("SELECT COUNT(*) FROM results").fetchone()[0]
+
+    def _count(self, counter: str) -> None:
+        self.counters[counter] += 1
+
+    def get_memory(self, key: str) -> Optional[dict]:
+        """Looks a key up in the in-memory tier only."""
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is None:
+                return None
+            value, created = entry
+            if time.time() - created > self.ttl:
+                del self._memory[key]
+                self._count("expired")
+                return None
+            self._memory.move_to_end(key)
+            self._count("memory_hits")
+            return value
+
+    def _put_memory(self, key: str, value: dict, created: float) -> None:
+        with self._lock:
+            self._memory[key] = (value, created)
+            self._memory.move_to_end(key)
+            while len(self._memory) > self.max_entries:
+                self._memory.popitem(last=False)
+                self._count("memory_evictions")
+
+    def get(self, key: str) -> Optional[dict]:
+        """Looks a key up in memory, then on disk. Disk hits are promoted."""
+        value = self.get_memory(key)
+        if value is not None:
+            return value
+        if self._db is not None:
+            with self._lock:
+                row = self._db.execute(
+                    "SELECT value, created FROM results WHERE key = ?", (key,)
+                ).fetchone()
+            if row is not None:
+                if time.time() - row[1] <= self.ttl:
+                    value = json.loads(row[0])
+                    self._put_memory(key, value, row[1])
+                    with self._lock:
+                        self._count("disk_hits")
+                    return value
+                with self._lock:
+                    self._db.execute("DELETE FROM results WHERE key = ?", (key,))
+                    self._count("expired")
+        with self._lock:
+            self._count("misses")
+        return None
+
+    def put(self, key: str, value: dict) -> None:
+        """Stores a result in both tiers."""
+        created = time.time()
+        self._put_memory(key, value, created)
+        with self._lock:
+            self._count("stores")
+            if self._db is None:
+                return
+            self._db.execute(
+                "INSERT OR REPLACE INTO results (key, value, created) VALUES (?, ?, ?)",
+                (key, json.dumps(value, separators=(",", ":")), created),
+            )
+            self._db_rows += 1
+            if self._db_rows > self.max_db_entries:
+                self._evict_disk()
+
+    def _evict_disk(self) -> None:
+        """Drops expired rows, then the oldest rows until under capacity."""
+        self._db.execute("DELETE FROM results WHERE created < ?", (time.time() - self.ttl,))
+        rows = self._db.execute("SELECT COUNT(*) FROM results").fetchone()[0]
+        excess = rows - int(self.max_db_entries * (1 - EVICTION_BATCH))
+        if excess > 0:
+            self._db.execute(
+                "DELETE FROM results WHERE key IN "
+                "(SELECT key FROM results ORDER BY created LIMIT ?)", (excess,)
+            )
+            self.counters["disk_evictions"] += excess
+            rows -= excess
+        self._db_rows = rows
+
+    async def aget(self, key: str) -> Optional[dict]:
+        """Async lookup: memory hits return inline, disk reads run in a thread."""
+        value = self.get_memory(key)
+        if value is not None or self._db is None:
+            if value is None:
+                with self._lock:
+                    self._count("misses")
+            return value
+        return await asyncio.to_thread(self.get, key)
+
+    async def aput(self, key: str, value: dict) -> None:
+        if self._db is None:
+            self.put(key, value)
+        else:
+            await asyncio.to_thread(self.put, key, value)
+
+    def stats(self) -> dict:
+        """Returns hit/miss counters and tier sizes."""
+        with self._lock:
+            lookups = self.counters["memory_hits"] + self.counters["disk_hits"] + self.counters["misses"]
+            hits = lookups - self.counters["misses"]
+            return {
+                **self.counters,
+                "hit_ratio": hits / lookups if lookups else 0.0,
+                "memory_entries": len(self._memory),
+                "disk_entries": self._db_rows if self._db is not None else None,
+            }
+
+    def close(self) -> None:
+        if self._db is not None:
+            self._db.close()
+            self._db = None
@@ -0,0 +1,186 @@
+# ml_service/classify.py
+"""
+Concurrent scrap classification.
+
+Unlike the serial `classify_scrap` loops on the documentation page, every
+image of a request is downloaded concurrently over one shared connection
+pool, and model calls run concurrently too, capped by a semaphore shared
+by all requests so a burst cannot overload the model backend. Downloads are
+size-capped and images are downscaled before inference (see images.py).
+Results are cached by image content (see cache.py), so a repeated photo
+never reaches the model.
+"""
+
+import asyncio
+import re
+from typing import AsyncIterator, Dict, List, Optional
+
+import httpx
+
+from ml_service.backends import ModelBackend
+from ml_service.cache import ResultCache, content_digest
+from ml_service.config import Settings
+from ml_service.images import ImageRejected, PreparedImage, download_image, prepare_image
+from ml_service.rules import DEFAULT_LOCATION, canonical_state, rules_for
+
+# Bump whenever the prompt changes in a way that changes the model's answers
+PROMPT_VERSION = "1"
+
+PROMPT_TEMPLATE = """\
+You are helping a household in {state}, {country} dispose of a scrap item.
+Identify the item in the photo and answer in exactly this format:
+Item: <short name>
+Recyclable: yes or no
+Sellable: yes or no
+Recommendation: <one or two sentences on how to sell, recycle or dispose of it>
+
+Follow these local recycling rules: {rules}"""
+
+ANSWER_RE = re.compile(r"^\s*(recyclable|sellable)\s*:\s*(yes|no)\b", re.I | re.M)
+
+
+def build_prompt(location: Dict[str, str]) -> str:
+    return PROMPT_TEMPLATE.format(
+        state=location.get("state", DEFAULT_LOCATION["state"]),
+        country=location.get("country", DEFAULT_LOCATION["country"]),
+        rules=rules_for(location),
+    )
+
+
+def parse_answer(text: str) -> Dict[str, bool]:
+    """
+    Reads the recyclable/sellable verdicts from a model response.
+
+    Falls back to keyword matching (as the original implementation did) when
+    the model ignored the answer format, but does not count "non-recyclable"
+    as recyclable.
+    """
+    answers = {key.lower(): value.lower() == "yes" for key, value in ANSWER_RE.findall(text)}
+    lowered = text.lower()
+    for key in ("recyclable", "sellable"):
+        if key not in answers:
+            answers[key] = bool(re.search(rf"(?<!non-)(?<!non ){key}", lowered))
+    return answers
+
+
+class ScrapClassifier:
+    """
+    Classifies scrap images with a model backend.
+
+    Create one per process and share it between requests: it owns the HTTP
+    connection pool and the model concurrency limit.
+    """
+
+    def __init__(self, backend: ModelBackend, settings: Settings):
+        self.backend = backend
+        self.settings = settings
+        self.cache = ResultCache(
+            max_entries=settings.cache_entries,
+            ttl=settings.cache_ttl,
+            db_path=settings.cache_db_path,
+            max_db_entries=settings.cache_db_max_entries,
+        )
+        self._client = httpx.AsyncClient(
+            timeout=settings.fetch_timeout,
+            follow_redirects=True,
+            limits=httpx.Limits(
+                max_connections=settings.max_connections,
+                max_keepalive_connections=settings.max_connections,
+            ),
+        )
+        self._model_slots = asyncio.Semaphore(settings.max_model_concurrency)
+
+    async def fetch_image(self, url: str) -> PreparedImage:
+        """
+        Downloads an image and prepares it for the model.
+
+        Only the downscaled copy outlives this call, and decoding runs in a
+        worker thread to keep the event loop free.
+
+        Raises:
+            ImageRejected: If the image is too large or cannot be decoded.
+            httpx.HTTPError: If the download fails.
+        """
+        data = await download_image(self._client, url, self.settings.max_image_bytes)
+        return await asyncio.to_thread(
+            prepare_image, data,
+            max_side=self.settings.max_image_side,
+            quality=self.settings.image_quality,
+            max_pixels=self.settings.max_image_pixels,
+        )
+
+    def cache_key(self, image_digest: str, location: Dict[str, str]) -> str:
+        """Builds the result cache key for an image digest and location."""
+        return f"v{PROMPT_VERSION}:{self.backend.name}:{canonical_state(location).lower()}:{image_digest}"
+
+    async def classify_image(self, image: bytes, mime_type: str, location: Dict[str, str],
+                             image_digest: Optional[str] = None) -> Dict:
+        """
+        Returns the classification of one image, asking the model only when
+        the result is not already cached.
+
+        `image_digest` is computed from `image` when the caller has not already.
+        """
+        if image_digest is None:
+            image_digest = await asyncio.to_thread(content_digest, image)
+        key = self.cache_key(image_digest, location)
+        cached = await self.cache.aget(key)
+        if cached is not None:
+            return {**cached, "cached": True}
+
+        async with self._model_slots:
+            text = await self.backend.generate(build_prompt(location), image, mime_type)
+        result = {
+            **parse_answer(text),
+            "recommendation": text,
+            "recycling_rules": rules_for(location),
+        }
+        await self.cache.aput(key, result)
+        return {**result, "cached": False}
+
+    async def classify_url(self, url: str, location: Dict[str, str]) -> Dict:
+        """Downloads and classifies one image; failures are reported per image."""
+        try:
+            image = await self.fetch_image(url)
+        except httpx.HTTPError as exc:
+            return {"url": url, "error": f"could not fetch image: {exc}"}
+        except ImageRejected as exc:
+            return {"url": url, "error": str(exc)}
+        try:
+            return {"url": url, **await self.classify_image(
+                image.data, image.mime_type, location, image_digest=image.digest
+            )}
+        except Exception as exc:  # model backends raise their own error types
+            return {"url": url, "error": f"classification failed: {exc}"}
+
+    async def classify_urls(self, urls: List[str], location: Dict[str, str]) -> List[Dict]:
+        """Classifies several images concurrently, keeping the input order."""
+        return await asyncio.gather(*(self.classify_url(url, location) for url in urls))
+
+    async def iter_classifications(self, urls: List[str],
+                                   location: Dict[str, str]) -> AsyncIterator[Dict]:
+        """
+        Classifies several images concurrently, yielding each result as soon
+        as it is ready, tagged with the image's position in `urls`.
+
+        Closing the iterator early (e.g. because the client went away)
+        cancels the classifications still in flight.
+        """
+        async def indexed(index: int, url: str) -> Dict:
+            return {"index": index, **await self.classify_url(url, location)}
+
+        tasks = [asyncio.create_task(indexed(index, url)) for index, url in enumerate(urls)]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                yield await next_done
+        finally:
+            pending = [task for task in tasks if not task.done()]
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+
+    async def aclose(self) -> None:
+        await self._client.aclose()
+        await self.backend.aclose()
+        self.cache.close()
@@ -0,0 +1,74 @@
+# ml_service/config.py
+
+import os
+from dataclasses import dataclass, fields
+
+
+def _env(name: str, default):
+    """Reads HOMESCRAPPER_<name>, converted to the type of `default`."""
+    value = os.environ.get(f"HOMESCRAPPER_{name}")
+    if value is None:
+        return default
+    if isinstance(default, bool):
+        return value.strip().lower() in ("1", "true", "yes", "on")
+    return type(default)(value)
+
+
+@dataclass(frozen=True)
+class Settings:
+    """Service configuration, read from HOMESCRAPPER_* environment variables."""
+
+    # "stub" (deterministic, offline) or "gemini"
+    model_backend: str = "stub"
+    gemini_model: str = "gemini-1.5-flash"
+    # Seconds the stub model waits before answering, to mimic a real model
+    stub_latency: float = 0.0
+
+    # Model calls allowed in flight at once, across all requests
+    max_model_concurrency: int = 8
+    # Shared HTTP connection pool used to download images
+    max_connections: int = 32
+    fetch_timeout: float = 10.0
+    max_images_per_request: int = 20
+
+    # Image intake: downloads over max_image_bytes are aborted, images are
+    # downscaled to max_image_side and re-encoded before reaching the model
+    max_image_bytes: int = 15 * 1024 * 1024
+    max_image_pixels: int = 64_000_000
+    max_image_side: int = 1024
+    image_quality: int = 85
+
+    # Classification result cache: in-memory LRU plus optional SQLite file
+    cache_entries: int = 10_000
+    cache_ttl: float = 7 * 24 * 3600.0
+    cache_db_path: str = ""
+    cache_db_max_entries: int = 1_000_000
+
+    # Location: optional CSV of IP ranges (start_ip,end_ip,city,state,country);
+    # IP lookups are cached per client for location_cache_ttl seconds. Only
+    # trust X-Forwarded-For when running behind a proxy that sets it
+    ip_ranges_path: str = ""
+    location_cache_ttl: float = 3600.0
+    trust_forwarded_for: bool = False
+
+    # Feedback sentiment model: a pickled pipeline or, to share memory between
+    # workers and allow hot swaps, an artifact root (see artifact.py). The
+    # endpoints answer 503 if it is missing
+    sentiment_model_path: str = "logistic_regression_sentiment_model.pkl"
+    # Concurrent single-text requests are pooled for up to sentiment_batch_wait
+    # seconds into batches of at most sentiment_batch_size
+    sentiment_batch_size: int = 64
+    sentiment_batch_wait: float = 0.005
+    max_feedback_texts: int = 1000
+
+    # Marketplace recommendations: an index root built by recommend.py,
+    # followed through its CURRENT file so new versions (e.g. with newly
+    # listed products) go live without a restart. The endpoints answer 503
+    # if it is missing
+    recommend_index_path: str = "models/recommendations"
+    max_recommend_history: int = 500
+    max_recommendations: int = 100
+
+    @classmethod
+    def from_env(cls) -> "Settings":
+        return cls(**{f.name: _env(f.name.upper(), f.default) for f in fields(cls)})
@@ -0,0 +1,94 @@
+# ml_service/images.py
+"""
+Image intake for classification: capped streaming download, then a
+reduced-resolution decode, downscale and compact re-encode.
+
+Phone photos are often 10+ MB. Holding them whole (as `BytesIO(response.
+content)` did) and handing full-resolution images to the model makes memory
+grow with upload size and concurrency. Here the download is streamed and
+aborted past a size cap, JPEGs are decoded in draft mode straight at a
+fraction of their resolution, and only a small re-encoded copy is kept.
+"""
+
+import io
+from dataclasses import dataclass
+
+import httpx
+from PIL import Image, ImageOps, UnidentifiedImageError
+
+from ml_service.cache import image_digest
+
+
+class ImageRejected(Exception):
+    """The image is too large, not an image, or could not be decoded."""
+
+
+@dataclass
+class PreparedImage:
+    data: bytes
+    mime_type: str
+    # Digest of the prepared pixels, computed while they are at hand
+    digest: str
+
+
+async def download_image(client: httpx.AsyncClient, url: str, max_bytes: int) -> bytes:
+    """
+    Streams an image download, giving up as soon as it exceeds `max_bytes`.
+
+    Raises:
+        ImageRejected: If the image is larger than `max_bytes`.
+        httpx.HTTPError: If the request fails.
+    """
+    async with client.stream("GET", url) as response:
+        response.raise_for_status()
+        declared = response.headers.get("content-length")
+        if declared is not None and declared.isdigit() and int(declared) > max_bytes:
+            raise ImageRejected(f"image is {int(declared)} bytes, limit is {max_bytes}")
+
+        buffer = bytearray()
+        async for chunk in response.aiter_bytes():
+            buffer += chunk
+            if len(buffer) > max_bytes:
+                raise ImageRejected(f"image exceeds the {max_bytes} byte limit")
+        return bytes(buffer)
+
+
+def prepare_image(data: bytes, max_side: int = 1024, quality: int = 85,
+                  max_pixels: int = 64_000_000) -> PreparedImage:
+    """
+    Decodes an image at reduced resolution and re-encodes it as a compact JPEG.
+
+    Parameters:
+        data (bytes): The downloaded image.
+        max_side (int): Longest side, in pixels, of the prepared image.
+        quality (int): JPEG quality of the prepared image.
+        max_pixels (int): Images declaring more pixels are rejected before
+            decoding (decompression bomb guard).
+
+    Returns:
+        PreparedImage: The re-encoded image and its digest.
+
+    Raises:
+        ImageRejected: If the data is not a decodable image or is too large.
+    """
+    try:
+        with Image.open(io.BytesIO(data)) as img:
+            width, height = img.size
+            if width * height > max_pixels:
+                raise ImageRejected(f"image is {width}x{height}, limit is {max_pixels} pixels")
+            # For JPEG this makes the decoder itself scale down by up to 8x
+            img.draft("RGB", (max_side, max_side))
+            img = ImageOps.exif_transpose(img)
+            img.thumbnail((max_side, max_side), Image.Resampling.LANCZOS, reducing_gap=2.0)
+            if img.mode != "RGB":
+                rgba = img.convert("RGBA")
+                img = Image.new("RGB", rgba.size, "white")
+                img.paste(rgba, mask=rgba.getchannel("A"))
+
+            out = io.BytesIO()
+            img.save(out, "JPEG", quality=quality, optimize=True)
+            return PreparedImage(out.getvalue(), "image/jpeg", image_digest(img))
+    except UnidentifiedImageError:
+        raise ImageRejected("not a supported image format") from None
+    except (OSError, ValueError, Image.DecompressionBombError) as exc:
+        raise ImageRejected(f"could not decode image: {exc}") from exc
@@ -0,0 +1,186 @@
+# ml_service/location.py
+"""
+Offline resolution of a client's location.
+
+The documented `LocationService` called `geocoder.ip("me")` on every
+classification: a network round trip that located the server, not the
+user. Locations here come, in order of preference, from the state the
+client sent, its PIN code (via tables of PIN prefixes and enclave ranges),
+or its IP address (via an optional local table of IP ranges). IP lookups
+are cached per client, and nothing touches the network.
+"""
+
+import bisect
+import csv
+import ipaddress
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
+
+from ml_service.rules import DEFAULT_LOCATION, resolve_state
+
+# Leading digits of Indian PIN codes -> state. Longer prefixes override
+# shorter ones (e.g. Goa's 403 inside Maharashtra's 40); only prefixes that
+# belong to one state entirely are listed, enclaves are in PIN_RANGES.
+PIN_PREFIXES = {
+    "11": "Delhi", "12": "Haryana", "13": "Haryana", "14": "Punjab", "15": "Punjab",
+    "16": "Punjab", "17": "Himachal Pradesh", "18": "Jammu and Kashmir",
+    "19": "Jammu and Kashmir", "194": "Ladakh",
+    "20": "Uttar Pradesh", "21": "Uttar Pradesh", "22": "Uttar Pradesh", "23": "Uttar Pradesh",
+    "24": "Uttar Pradesh", "246": "Uttarakhand", "248": "Uttarakhand",
+    "249": "Uttarakhand", "25": "Uttar Pradesh", "26": "Uttar Pradesh",
+    "263": "Uttarakhand", "27": "Uttar Pradesh", "28": "Uttar Pradesh",
+    "30": "Rajasthan", "31": "Rajasthan", "32": "Rajasthan", "33": "Rajasthan", "34": "Rajasthan",
+    "36": "Gujarat", "37": "Gujarat", "38": "Gujarat", "39": "Gujarat",
+    "40": "Maharashtra", "403": "Goa", "41": "Maharashtra", "42": "Maharashtra",
+    "43": "Maharashtra", "44": "Maharashtra",
+    "45": "Madhya Pradesh", "46": "Madhya Pradesh", "47": "Madhya Pradesh", "48": "Madhya Pradesh",
+    "49": "Chhattisgarh",
+    "50": "Telangana", "51": "Andhra Pradesh", "52": "Andhra Pradesh", "53": "Andhra Pradesh",
+    "56": "Karnataka", "57": "Karnataka", "58": "Karnataka", "59": "Karnataka",
+    "60": "Tamil Nadu", "61": "Tamil Nadu", "62": "Tamil Nadu", "63": "Tamil Nadu", "64": "Tamil Nadu",
+    "67": "Kerala", "68": "Kerala", "69": "Kerala",
+    "70": "West Bengal", "71": "West Bengal", "72": "West Bengal", "73": "West Bengal",
+    "737": "Sikkim", "74": "West Bengal", "744": "Andaman and Nicobar Islands",
+    "75": "Odisha", "76": "Odisha", "77": "Odisha", "78": "Assam",
+    "790": "Arunachal Pradesh", "791": "Arunachal Pradesh", "792": "Arunachal Pradesh",
+    "793": "Meghalaya", "794": "Meghalaya", "795": "Manipur", "796": "Mizoram",
+    "797": "Nagaland", "798": "Nagaland", "799": "Tripura",
+    "80": "Bihar", "81": "Bihar", "82": "Jharkhand", "83": "Jharkhand",
+    "84": "Bihar", "85": "Bihar",
+}
+
+# Inclusive PIN ranges that belong to a different state than their prefix:
+# union territories enclosed by a state, and districts on a state border.
+# Checked before PIN_PREFIXES.
+PIN_RANGES = sorted([
+    (160001, 160036, "Chandigarh"), (160047, 160047, "Chandigarh"),
+    (160101, 160102, "Chandigarh"),
+    (246701, 246764, "Uttar Pradesh"),  # Bijnor
+    (247656, 247671, "Uttarakhand"),  # Haridwar district
+    (262308, 262311, "Uttarakhand"), (262401, 262405, "Uttarakhand"),  # Udham Singh Nagar
+    (262501, 262580, "Uttarakhand"),  # Pithoragarh, Champawat
+    (362520, 362520, "Dadra and Nagar Haveli and Daman and Diu"),  # Diu
+    (362540, 362540, "Dadra and Nagar Haveli and Daman and Diu"),
+    (362570, 362570, "Dadra and Nagar Haveli and Daman and Diu"),
+    (396193, 396193, "Dadra and Nagar Haveli and Daman and Diu"),
+    (396210, 396220, "Dadra and Nagar Haveli and Daman and Diu"),  # Daman
+    (396230, 396240, "Dadra and Nagar Haveli and Daman and Diu"),  # Silvassa
+    (533464, 533464, "Puducherry"),  # Yanam
+    (605001, 605014, "Puducherry"),
+    (609602, 609609, "Puducherry"),  # Karaikal
+    (673310, 673310, "Puducherry"),  # Mahe
+    (682551, 682559, "Lakshadweep"),
+])
+_RANGE_STARTS = [first for first, _, _ in PIN_RANGES]
+
+
+def state_for_pin(pin_code: str) -> Optional[str]:
+    """Returns the state of a six-digit Indian PIN code, or None."""
+    digits = "".join(ch for ch in pin_code if ch.isdigit())
+    if len(digits) != 6:
+        return None
+    pin = int(digits)
+    index = bisect.bisect_right(_RANGE_STARTS, pin) - 1
+    if index >= 0 and pin <= PIN_RANGES[index][1]:
+        return PIN_RANGES[index][2]
+    return PIN_PREFIXES.get(digits[:3]) or PIN_PREFIXES.get(digits[:2])
+
+
+class IPRangeTable:
+    """
+    Looks IP addresses up in sorted, non-overlapping ranges.
+
+    Loaded from a CSV with the columns start_ip, end_ip, city, state, country
+    (e.g. exported from a GeoIP database). IPv4 and IPv6 ranges are kept in
+    separate tables and searched with bisect.
+    """
+
+    def __init__(self, rows=()):
+        ranges = {4: [], 6: []}
+        for start, end, location in rows:
+            first, last = ipaddress.ip_address(start), ipaddress.ip_address(end)
+            ranges[first.version].append((int(first), int(last), location))
+        self._starts: Dict[int, List[int]] = {}
+        self._ranges: Dict[int, List[Tuple[int, int, Dict[str, str]]]] = {}
+        for version, entries in ranges.items():
+            entries.sort(key=lambda entry: entry[0])
+            self._ranges[version] = entries
+            self._starts[version] = [entry[0] for entry in entries]
+
+    @classmethod
+    def from_csv(cls, path: str) -> "IPRangeTable":
+        rows = []
+        with open(path, newline="", encoding="utf-8") as f:
+            for row in csv.DictReader(f):
+                state = resolve_state(row["state"]) or row["state"]
+                location = {"city": row.get("city") or "Unknown", "state": state,
+                            "country": row.get("country") or DEFAULT_LOCATION["country"]}
+                rows.append((row["start_ip"], row["end_ip"], location))
+        return cls(rows)
+
+    def __len__(self) -> int:
+        return sum(len(entries) for entries in self._ranges.values())
+
+    def lookup(self, ip: str) -> Optional[Dict[str, str]]:
+        try:
+            address = ipaddress.ip_address(ip)
+        except ValueError:
+            return None
+        value = int(address)
+        index = bisect.bisect_right(self._starts[address.version], value) - 1
+        if index < 0:
+            return None
+        start, end, location = self._ranges[address.version][index]
+        return location if value <= end else None
+
+
+class LocationResolver:
+    """
+    Resolves the location a classification's rules are chosen for.
+
+    Parameters:
+        ip_table (IPRangeTable): Local IP range table; may be empty.
+        ttl (float): Seconds a client's IP lookup is cached.
+        max_clients (int): Clients kept in the cache.
+    """
+
+    def __init__(self, ip_table: IPRangeTable = None, ttl: float = 3600.0, max_clients: int = 100_000):
+        self.ip_table = ip_table or IPRangeTable()
+        self.ttl = ttl
+        self.max_clients = max_clients
+        self._clients = OrderedDict()
+        self._lock = threading.Lock()
+
+    def resolve(self, client_ip: Optional[str] = None, pin_code: Optional[str] = None,
+                state: Optional[str] = None) -> Dict[str, str]:
+        """
+        Returns the location for a request, preferring an explicit state,
+        then the PIN code, then the client's IP, then the default location.
+        """
+        if state:
+            return {"city": "Unknown", "state": resolve_state(state) or state.strip(),
+                    "country": DEFAULT_LOCATION["country"]}
+        if pin_code:
+            pin_state = state_for_pin(pin_code)
+            if pin_state:
+                return {"city": "Unknown", "state": pin_state, "country": DEFAULT_LOCATION["country"]}
+        if client_ip:
+            return self._by_ip(client_ip)
+        return DEFAULT_LOCATION
+
+    def _by_ip(self, client_ip: str) -> Dict[str, str]:
+        now = time.monotonic()
+        with self._lock:
+            cached = self._clients.get(client_ip)
+            if cached is not None and cached[1] > now:
+                self._clients.move_to_end(client_ip)
+                return cached[0]
+        location = self.ip_table.lookup(client_ip) or DEFAULT_LOCATION
+        with self._lock:
+            self._clients[client_ip] = (location, now + self.ttl)
+            self._clients.move_to_end(client_ip)
+            while len(self._clients) > self.max_clients:
+                self._clients.popitem(last=False)
+        return location
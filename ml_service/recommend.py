@@ -0,0 +1,587 @@
+# ml_service/recommend.py
+"""
+Marketplace recommendations from a precomputed item-item index.
+
+Similarities are computed offline, not per request. Each item is a sparse
+vector with two parts:
+
+- its listing (title words, category, material, condition, state and price
+  band), hashed into `n_features` columns with CRC-32 and IDF-weighted,
+- the users who interacted with it (views, saves, purchases), one column
+  per user.
+
+Both parts are L2-normalised and weighted, so the similarity of two items is
+
+    content_weight * listing cosine + (1 - content_weight) * co-interaction cosine
+
+Values of the listing fields held by much of the catalog ("category=plastic",
+"condition=used") count fully in that score, but would make nearly every
+pair of items a candidate. Their columns are therefore left out of the
+sparse products that find candidate pairs, and added to the scores of the
+candidates exactly afterwards (see `_similarities`).
+
+For every item, the `k` most similar items and their scores are kept in
+dense (items, k) arrays. A user's recommendations are the neighbours of the
+items in their history, scored by the summed similarities, which takes a
+few vectorized NumPy operations over (history x k) entries, however large
+the catalog is.
+
+New listings have no interactions yet, so they are placed by their listing
+alone: `ItemIndex.add_items` compares only the new items with the catalog
+and splices them into the neighbour lists they belong to, without a full
+rebuild. Sold or withdrawn items are deactivated and never recommended.
+
+Indexes are stored like the sentiment artifacts (see artifact.py): .npy
+arrays in a version directory under a root whose CURRENT file names the
+live version, so servers memory-map them and switch to new versions
+without a restart.
+
+Usage (from the repository root):
+    python -m ml_service.recommend build items.jsonl interactions.csv models/recommendations [--k 50]
+    python -m ml_service.recommend add models/recommendations new_items.jsonl
+    python -m ml_service.recommend deactivate models/recommendations ITEM_ID [ITEM_ID ...]
+"""
+
+import argparse
+import json
+import math
+import os
+import re
+import sys
+import time
+import zlib
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from ml_service.artifact import current_version, publish
+from ml_service.bulk_score import read_chunks
+from ml_service.rules import resolve_state
+
+FORMAT_VERSION = 2
+KIND = "item-item"
+
+TOKEN_RE = re.compile(r"[a-z0-9]+")
+
+# Listing fields hashed as whole values, and how much each one counts
+# relative to a single title or description word
+FIELD_WEIGHTS = {"category": 3.0, "material": 2.0, "condition": 1.0, "state": 1.0, "price": 1.0}
+
+# Rows of the similarity matrix computed at once; bounds the memory of the
+# sparse products on large catalogs
+BLOCK_SIZE = 1024
+
+
+def listing_terms(item: dict) -> Dict[str, float]:
+    """Returns the weighted terms of a listing, e.g. {"category=plastic": 3.0, "bottle": 1.0}."""
+    terms = {}
+    text = f"{item.get('title') or ''} {item.get('description') or ''}".lower()
+    for token in TOKEN_RE.findall(text):
+        terms[token] = 1.0
+    for name, weight in FIELD_WEIGHTS.items():
+        value = item.get(name)
+        if value in (None, ""):
+            continue
+        if name == "state":
+            value = resolve_state(str(value)) or value
+        elif name == "price":
+            # Price band: powers of two, so 90 and 110 are neighbours
+            try:
+                value = int(math.log2(max(float(value), 1.0)))
+            except ValueError:
+                continue
+        terms[f"{name}={str(value).strip().lower()}"] = weight
+    return terms
+
+
+def _normalize_rows(matrix):
+    """L2-normalises the rows of a CSR matrix in place; empty rows stay empty."""
+    norms = np.sqrt(np.bincount(np.repeat(np.arange(matrix.shape[0]), np.diff(matrix.indptr)),
+                                matrix.data.astype(np.float64) ** 2, minlength=matrix.shape[0]))
+    norms[norms == 0] = 1.0
+    matrix.data /= np.repeat(norms, np.diff(matrix.indptr)).astype(matrix.data.dtype)
+    return matrix
+
+
+def _listing_entries(items: Sequence[dict], n_features: int):
+    """
+    Returns the (row, hashed column, weight, is a field value) entries of
+    the listings' terms.
+    """
+    rows, columns, values, fields = [], [], [], []
+    for row, item in enumerate(items):
+        for term, weight in listing_terms(item).items():
+            rows.append(row)
+            columns.append(zlib.crc32(term.encode("utf-8")) % n_features)
+            values.append(weight)
+            fields.append("=" in term)
+    return (np.array(rows, dtype=np.int64), np.array(columns, dtype=np.int64),
+            np.array(values, dtype=np.float32), np.array(fields, dtype=bool))
+
+
+def listing_idf(items: Sequence[dict], n_features: int, max_df: float) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Returns the smoothed IDF of each hash column over a catalog, and the
+    columns of common field values.
+
+    Words found in more than `max_df` of the listings get an IDF of 0: a
+    word in much of the catalog says little about similarity. Field values
+    (FIELD_WEIGHTS) are kept however common they are, since listings are
+    grouped by them; those above `max_df` are returned as common columns,
+    to be scored exactly rather than searched (see `_similarities`).
+
+    Returns:
+        tuple: (idf, sorted common columns)
+    """
+    rows, columns, _, fields = _listing_entries(items, n_features)
+    document_frequency = np.bincount(np.unique(rows * n_features + columns) % n_features, minlength=n_features)
+    idf = (np.log((1 + len(items)) / (1 + document_frequency)) + 1).astype(np.float32)
+    frequent = document_frequency > max_df * len(items)
+    field_columns = np.zeros(n_features, dtype=bool)
+    field_columns[columns[fields]] = True
+    idf[frequent & ~field_columns] = 0.0
+    return idf, np.flatnonzero(frequent & field_columns).astype(np.int32)
+
+
+def listing_vectors(items: Sequence[dict], idf: np.ndarray, n_columns: int, weight: float):
+    """
+    Hashes listings into the content part of their item vectors.
+
+    Returns:
+        scipy.sparse.csr_matrix: One row per item, `n_columns` wide, each row
+        of norm sqrt(weight) (or empty).
+    """
+    from scipy.sparse import csr_matrix
+
+    rows, columns, values, _ = _listing_entries(items, len(idf))
+    matrix = csr_matrix((values * idf[columns], (rows, columns)), shape=(len(items), n_columns))
+    matrix.sum_duplicates()
+    matrix.eliminate_zeros()
+    matrix = _normalize_rows(matrix)
+    matrix.data *= np.float32(math.sqrt(weight))
+    return matrix
+
+
+def top_k_rows(rows: np.ndarray, columns: np.ndarray, values: np.ndarray,
+               n_rows: int, k: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Keeps the `k` largest values of each row of a sparse matrix.
+
+    Parameters:
+        rows, columns, values: The matrix's entries, in any order.
+        n_rows (int): Number of rows.
+        k (int): Entries kept per row.
+
+    Returns:
+        tuple: (columns, values) arrays of shape (n_rows, k), each row in
+        descending order of value (ties in input order), padded with -1 and 0.
+    """
+    # One sort on a combined key (row first, then value descending) is
+    # several times faster than lexsort; similarities are within [0, 2)
+    order = np.argsort(rows * 4.0 - values, kind="stable")
+    rows, columns, values = rows[order], columns[order], values[order]
+    positions = np.arange(len(rows))
+    row_starts = np.empty(len(rows), dtype=bool)
+    row_starts[:1] = True
+    np.not_equal(rows[1:], rows[:-1], out=row_starts[1:])
+    rank = positions - np.maximum.accumulate(np.where(row_starts, positions, 0))
+    keep = rank < k
+    neighbours = np.full((n_rows, k), -1, dtype=np.int32)
+    scores = np.zeros((n_rows, k), dtype=np.float32)
+    neighbours[rows[keep], rank[keep]] = columns[keep]
+    scores[rows[keep], rank[keep]] = values[keep]
+    return neighbours, scores
+
+
+def _split_columns(vectors, split_columns: np.ndarray):
+    """
+    Splits the given (sorted) columns off a CSR matrix.
+
+    Returns:
+        tuple: (the matrix without those columns, the same columns as a
+        dense (rows, len(split_columns) + 1) array whose last column is
+        zero, and for each row the positions of its nonzero dense columns,
+        padded with that zero column, as a (rows, width) array, where width
+        is the most such entries in one row)
+    """
+    n_rows = vectors.shape[0]
+    split = np.isin(vectors.indices, split_columns)
+    rest = vectors.copy()
+    rest.data[split] = 0
+    rest.eliminate_zeros()
+
+    rows = np.repeat(np.arange(n_rows), np.diff(vectors.indptr))[split]
+    positions = np.searchsorted(split_columns, vectors.indices[split])
+    dense = np.zeros((n_rows, len(split_columns) + 1), dtype=np.float32)
+    dense[rows, positions] = vectors.data[split]
+    counts = np.bincount(rows, minlength=n_rows)
+    width = int(counts.max()) if len(rows) else 0
+    rank = np.arange(len(rows)) - np.repeat(np.cumsum(counts) - counts, counts)
+    nonzero = np.full((n_rows, width), len(split_columns), dtype=np.int64)
+    nonzero[rows, rank] = positions
+    return rest, dense, nonzero
+
+
+def _similarities(vectors, first_row: int, min_similarity: float, common_columns: np.ndarray,
+                  block_size: int = BLOCK_SIZE):
+    """
+    Yields (first query row, rows, columns, values) for blocks of
+    `vectors[first_row:] @ vectors.T`, without self-similarities and
+    entries at or below `min_similarity`.
+
+    Candidate pairs come from the sparse products without `common_columns`;
+    what the pairs share in those columns is then added exactly, from a
+    dense copy of them (a few values per row). Pairs sharing only common
+    columns are not candidates.
+    """
+    rest, dense, nonzero = _split_columns(vectors, common_columns)
+    transposed = rest.T.tocsr()
+    for start in range(0, vectors.shape[0] - first_row, block_size):
+        block = (rest[first_row + start:first_row + start + block_size] @ transposed).tocoo()
+        rows, columns, values = block.row, block.col, block.data.astype(np.float32)
+        query_rows = rows + first_row + start
+        for i in range(nonzero.shape[1]):
+            position = nonzero[query_rows, i]
+            values += dense[query_rows, position] * dense[columns, position]
+        keep = (values > min_similarity) & (columns != query_rows)
+        yield start, rows[keep], columns[keep].astype(np.int32), values[keep]
+
+
+class ItemIndex:
+    """
+    Precomputed item-item neighbours, with the item vectors needed to add
+    new items later.
+
+    Parameters:
+        meta (dict): Build settings: k, n_features, n_columns, max_df,
+            content_weight and min_similarity.
+        **arrays: The arrays named in `arrays`.
+    """
+
+    kind = KIND
+    arrays = ("item_ids", "id_order", "neighbours", "scores", "active", "popularity", "idf",
+              "common_columns", "vector_indptr", "vector_indices", "vector_data")
+
+    def __init__(self, meta: dict, **arrays):
+        self.meta = {**meta, "format": FORMAT_VERSION, "kind": self.kind}
+        for name in self.arrays:
+            setattr(self, name, arrays[name])
+        self.k = meta["k"]
+        self._sorted_ids = self.item_ids[self.id_order]
+
+    def __len__(self) -> int:
+        return len(self.item_ids)
+
+    @classmethod
+    def load(cls, directory: str) -> "ItemIndex":
+        with open(os.path.join(directory, "meta.json"), encoding="utf-8") as f:
+            meta = json.load(f)
+        if meta.get("format") != FORMAT_VERSION or meta.get("kind") != cls.kind:
+            raise ValueError(f"{directory} does not hold an {cls.kind} index of format {FORMAT_VERSION}")
+        arrays = {name: np.load(os.path.join(directory, f"{name}.npy"), mmap_mode="r")
+                  for name in cls.arrays}
+        return cls(meta, **arrays)
+
+    def save(self, directory: str) -> None:
+        os.makedirs(directory, exist_ok=True)
+        for name in self.arrays:
+            np.save(os.path.join(directory, f"{name}.npy"), getattr(self, name))
+        with open(os.path.join(directory, "meta.json"), "w", encoding="utf-8") as f:
+            json.dump(self.meta, f)
+
+    def vectors(self):
+        from scipy.sparse import csr_matrix
+
+        return csr_matrix((self.vector_data, self.vector_indices, self.vector_indptr),
+                          shape=(len(self), self.meta["n_columns"]))
+
+    def positions(self, item_ids: Sequence[str]) -> np.ndarray:
+        """Returns the position of each item id, or -1 for unknown ids."""
+        if not len(item_ids) or not len(self):
+            return np.full(len(item_ids), -1, dtype=np.int64)
+        keys = np.array([str(item_id).encode("utf-8") for item_id in item_ids], dtype=np.bytes_)
+        found = np.searchsorted(self._sorted_ids, keys)
+        found[found == len(self)] = 0
+        return np.where(self._sorted_ids[found] == keys, self.id_order[found], -1)
+
+    def _ids(self, positions: np.ndarray) -> List[str]:
+        return [item_id.decode("utf-8") for item_id in self.item_ids[positions]]
+
+    def similar(self, item_id: str, n: int = 10) -> Optional[List[Tuple[str, float]]]:
+        """Returns the `n` active items most similar to an item, or None if it is unknown."""
+        position = self.positions([item_id])[0]
+        if position < 0:
+            return None
+        neighbours, scores = self.neighbours[position], self.scores[position]
+        keep = neighbours >= 0
+        keep[keep] = self.active[neighbours[keep]]
+        neighbours, scores = neighbours[keep][:n], scores[keep][:n]
+        return list(zip(self._ids(neighbours), scores.tolist()))
+
+    def recommend(self, history: Sequence[str], weights: Optional[Sequence[float]] = None,
+                  n: int = 10, exclude: Sequence[str] = ()) -> List[Tuple[str, float]]:
+        """
+        Recommends items for a user from the items they interacted with.
+
+        Each history item contributes its neighbours, scored by similarity
+        times the item's weight; candidates are ranked by their summed
+        score. Items in the history or `exclude` and inactive items are
+        skipped. A user without known history gets the most popular items.
+
+        Parameters:
+            history (Sequence[str]): Item ids the user interacted with.
+            weights (Sequence[float]): Optional weight per history item,
+                e.g. higher for purchases than for views.
+            n (int): Number of recommendations.
+            exclude (Sequence[str]): Item ids never to recommend.
+
+        Returns:
+            list: (item id, score) pairs, best first.
+        """
+        positions = self.positions(history)
+        weights = np.ones(len(positions), dtype=np.float32) if weights is None \
+            else np.asarray(weights, dtype=np.float32)
+        known = positions >= 0
+        positions, weights = positions[known], weights[known]
+        seen = np.concatenate([positions, self.positions(exclude)])
+
+        if len(positions):
+            candidates = self.neighbours[positions].ravel()
+            contributions = (self.scores[positions] * weights[:, None]).ravel()
+        else:
+            # Cold start: rank every item by popularity
+            candidates = np.arange(len(self), dtype=np.int32)
+            contributions = np.asarray(self.popularity, dtype=np.float32)
+        keep = candidates >= 0
+        candidates, contributions = candidates[keep], contributions[keep]
+        keep = self.active[candidates] & ~np.isin(candidates, seen)
+        candidates, inverse = np.unique(candidates[keep], return_inverse=True)
+        totals = np.bincount(inverse, contributions[keep], minlength=len(candidates))
+
+        if len(candidates) > n:
+            best = np.argpartition(-totals, n - 1)[:n]
+        else:
+            best = np.arange(len(candidates))
+        best = best[np.lexsort((candidates[best], -totals[best]))]
+        return list(zip(self._ids(candidates[best]), totals[best].tolist()))
+
+    def add_items(self, items: Sequence[dict]) -> "ItemIndex":
+        """
+        Returns a new index with new listings added.
+
+        The new items are compared with every item (old and new) in blocks;
+        each old item whose neighbour list a new item beats gets it spliced
+        in. Costs (new items x catalog) similarities, not a rebuild.
+        Items whose id is already indexed are skipped.
+
+        Parameters:
+            items (Sequence[dict]): Listings with an "id" and listing fields.
+
+        Returns:
+            ItemIndex: The extended index; this one is left unchanged.
+        """
+        from scipy.sparse import vstack
+
+        unique = {}
+        for item in items:
+            unique.setdefault(str(item["id"]), item)
+        known = self.positions(list(unique))
+        items = [item for item, position in zip(unique.values(), known) if position < 0]
+        if not items:
+            return self
+
+        meta = self.meta
+        n_old, k = len(self), self.k
+        new_vectors = listing_vectors(items, self.idf, meta["n_columns"], meta["content_weight"])
+        vectors = vstack([self.vectors(), new_vectors], format="csr")
+
+        neighbours = np.vstack([self.neighbours, np.full((len(items), k), -1, dtype=np.int32)])
+        scores = np.vstack([self.scores, np.zeros((len(items), k), dtype=np.float32)])
+        reverse = ([], [], [])
+        for start, rows, columns, values in _similarities(vectors, n_old, meta["min_similarity"],
+                                                          self.common_columns):
+            block_neighbours, block_scores = top_k_rows(rows, columns, values, min(BLOCK_SIZE, len(items) - start), k)
+            neighbours[n_old + start:n_old + start + len(block_neighbours)] = block_neighbours
+            scores[n_old + start:n_old + start + len(block_scores)] = block_scores
+            # Old items for which the new item would make the top k
+            old = columns < n_old
+            rows, columns, values = rows[old], columns[old], values[old]
+            better = values > self.scores[columns, k - 1]
+            reverse[0].append(columns[better])
+            reverse[1].append(rows[better] + n_old + start)
+            reverse[2].append(values[better])
+
+        targets, new_items, values = (np.concatenate(part) for part in reverse)
+        if len(targets):
+            affected = np.unique(targets)
+            current = neighbours[affected].ravel()
+            listed = current >= 0
+            rows = np.concatenate([np.repeat(np.arange(len(affected)), k)[listed],
+                                   np.searchsorted(affected, targets)])
+            columns = np.concatenate([current[listed], new_items.astype(np.int32)])
+            merged = np.concatenate([scores[affected].ravel()[listed], values])
+            neighbours[affected], scores[affected] = top_k_rows(rows, columns, merged, len(affected), k)
+
+        item_ids = np.concatenate([np.asarray(self.item_ids),
+                                   np.array([str(item["id"]).encode("utf-8") for item in items], dtype=np.bytes_)])
+        return ItemIndex(
+            meta,
+            item_ids=item_ids,
+            id_order=np.argsort(item_ids, kind="stable"),
+            neighbours=neighbours,
+            scores=scores,
+            active=np.concatenate([self.active, np.ones(len(items), dtype=bool)]),
+            popularity=np.concatenate([self.popularity, np.zeros(len(items), dtype=np.float32)]),
+            idf=self.idf,
+            common_columns=self.common_columns,
+            vector_indptr=vectors.indptr.astype(np.int64),
+            vector_indices=vectors.indices.astype(np.int32),
+            vector_data=vectors.data.astype(np.float32),
+        )
+
+    def deactivate(self, item_ids: Sequence[str]) -> "ItemIndex":
+        """Returns a copy of the index in which the given items are never recommended."""
+        positions = self.positions(item_ids)
+        active = np.array(self.active)
+        active[positions[positions >= 0]] = False
+        arrays = {name: getattr(self, name) for name in self.arrays}
+        return ItemIndex(self.meta, **{**arrays, "active": active})
+
+
+def build_index(items: Sequence[dict], interactions: Iterable[Tuple[str, str, float]] = (),
+                k: int = 50, n_features: int = 2 ** 18, content_weight: float = 0.5,
+                max_df: float = 0.05, min_similarity: float = 0.0) -> ItemIndex:
+    """
+    Builds the item-item index of a catalog.
+
+    Parameters:
+        items (Sequence[dict]): Listings, each with an "id" and any of the
+            fields title, description, category, material, condition, state
+            and price.
+        interactions (Iterable): (user id, item id, weight) triples.
+            Interactions with unknown items are ignored.
+        k (int): Neighbours kept per item.
+        n_features (int): Hash columns for listing terms.
+        content_weight (float): Share of the similarity from listings; the
+            rest comes from co-interactions.
+        max_df (float): Listing words found in more than this share of the
+            catalog are ignored; field values that common are kept but only
+            scored, not searched (see `listing_idf`).
+        min_similarity (float): Neighbours at or below this are dropped.
+
+    Returns:
+        ItemIndex: The index, ready to `publish`.
+    """
+    from scipy.sparse import csr_matrix
+
+    if not 0.0 <= content_weight <= 1.0:
+        raise ValueError("content_weight must be between 0 and 1")
+    unique = {}
+    for item in items:
+        unique.setdefault(str(item["id"]), item)
+    items = list(unique.values())
+    item_ids = np.array([item_id.encode("utf-8") for item_id in unique], dtype=np.bytes_)
+    index = {item_id: position for position, item_id in enumerate(unique)}
+
+    users, rows, values = {}, [], []
+    for user_id, item_id, weight in interactions:
+        position = index.get(str(item_id))
+        if position is not None:
+            rows.append(position)
+            users.setdefault(str(user_id), len(users))
+            values.append((users[str(user_id)], float(weight)))
+    user_columns = np.array([user for user, _ in values], dtype=np.int64)
+    weights = np.array([weight for _, weight in values], dtype=np.float32)
+
+    n_columns = n_features + len(users)
+    idf, common_columns = listing_idf(items, n_features, max_df)
+    content = listing_vectors(items, idf, n_columns, content_weight)
+    behaviour = csr_matrix((weights, (np.array(rows, dtype=np.int64), n_features + user_columns)),
+                           shape=(len(items), n_columns))
+    behaviour.sum_duplicates()
+    popularity = np.asarray(behaviour.sum(axis=1)).ravel().astype(np.float32)
+    behaviour = _normalize_rows(behaviour)
+    behaviour.data *= np.float32(math.sqrt(1.0 - content_weight))
+    vectors = (content + behaviour).tocsr()
+    vectors.sort_indices()
+
+    neighbours = np.full((len(items), k), -1, dtype=np.int32)
+    scores = np.zeros((len(items), k), dtype=np.float32)
+    for start, block_rows, columns, block_values in _similarities(vectors, 0, min_similarity, common_columns):
+        count = min(BLOCK_SIZE, len(items) - start)
+        neighbours[start:start + count], scores[start:start + count] = top_k_rows(
+            block_rows, columns, block_values, count, k
+        )
+
+    meta = {"k": k, "n_features": n_features, "n_columns": n_columns, "max_df": max_df,
+            "content_weight": content_weight, "min_similarity": min_similarity}
+    return ItemIndex(
+        meta,
+        item_ids=item_ids,
+        id_order=np.argsort(item_ids, kind="stable"),
+        neighbours=neighbours,
+        scores=scores,
+        active=np.ones(len(items), dtype=bool),
+        popularity=popularity,
+        idf=idf,
+        common_columns=common_columns,
+        vector_indptr=vectors.indptr.astype(np.int64),
+        vector_indices=vectors.indices.astype(np.int32),
+        vector_data=vectors.data.astype(np.float32),
+    )
+
+
+def read_items(path: str) -> List[dict]:
+    """Reads listings from a CSV or JSONL file with an "id" column."""
+    return [row for chunk in read_chunks(path, 10_000) for row in chunk]
+
+
+def read_interactions(path: str):
+    """Yields (user id, item id, weight) from a CSV or JSONL file; weight defaults to 1."""
+    for chunk in read_chunks(path, 10_000):
+        for row in chunk:
+            yield row["user_id"], row["item_id"], float(row.get("weight") or 1.0)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Builds and updates the marketplace recommendation index.")
+    commands = parser.add_subparsers(dest="command", required=True)
+    build = commands.add_parser("build", help="build an index from the full catalog")
+    build.add_argument("items", help="CSV or JSONL of listings (id, title, category, ...)")
+    build.add_argument("interactions", help="CSV or JSONL of user_id, item_id[, weight]")
+    build.add_argument("root", help="index root, e.g. models/recommendations")
+    build.add_argument("--k", type=int, default=50, help="neighbours kept per item")
+    build.add_argument("--features", type=int, default=2 ** 18, help="hash columns for listing terms")
+    build.add_argument("--content-weight", type=float, default=0.5)
+    build.add_argument("--max-df", type=float, default=0.05, help="ignore listing words in more of the catalog")
+    add = commands.add_parser("add", help="add new listings to the live index")
+    add.add_argument("root")
+    add.add_argument("items", help="CSV or JSONL of the new listings")
+    deactivate = commands.add_parser("deactivate", help="stop recommending sold or withdrawn items")
+    deactivate.add_argument("root")
+    deactivate.add_argument("item_ids", nargs="+")
+    for command in (build, add, deactivate):
+        command.add_argument("--version", default=time.strftime("%Y%m%d-%H%M%S"), help="version name")
+    args = parser.parse_args(argv)
+
+    started = time.perf_counter()
+    try:
+        if args.command == "build":
+            index = build_index(read_items(args.items), read_interactions(args.interactions),
+                                args.k, args.features, args.content_weight, args.max_df)
+        else:
+            live = ItemIndex.load(os.path.join(args.root, current_version(args.root)))
+            if args.command == "add":
+                index = live.add_items(read_items(args.items))
+            else:
+                index = live.deactivate(args.item_ids)
+        directory = publish(index, args.root, args.version)
+    except (OSError, KeyError, ValueError) as exc:
+        print(exc, file=sys.stderr)
+        return 1
+    print(f"{args.command}: {len(index)} items in {time.perf_counter() - started:.1f}s; published {directory}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,121 @@
+# ml_service/rules.py
+"""
+State-specific recycling guidance attached to every classification.
+
+State names are matched through a precomputed index of normalised names,
+ISO codes and common aliases, with a fuzzy fallback for misspellings, so
+"tamilnadu", "TN" and "Maharastra" all find their rules.
+"""
+
+import difflib
+import functools
+import re
+from typing import Dict, Optional
+
+DEFAULT_LOCATION = {"city": "Mumbai", "state": "Maharashtra", "country": "India"}
+
+NO_RULES = "No specific rules found."
+
+# Dictionary containing state-specific recycling rules
+RECYCLING_RULES = {
+    "Maharashtra": (
+        "Single-use plastic carry bags and thermocol items are banned. Keep dry and "
+        "wet waste separate; PET bottles and milk pouches can be returned to buy-back points."
+    ),
+    "Karnataka": (
+        "Segregate into wet, dry and sanitary waste. Dry waste collection centres accept "
+        "paper, plastic, metal and glass."
+    ),
+    "Delhi": (
+        "Segregate biodegradable, non-biodegradable and domestic hazardous waste. "
+        "E-waste must go to an authorised collection centre."
+    ),
+    "Tamil Nadu": (
+        "Single-use plastics are banned. Hand over dry recyclables at resource recovery "
+        "centres and compost wet waste where possible."
+    ),
+    "Kerala": (
+        "Clean, dry plastic is collected by Haritha Karma Sena workers; wet waste should be "
+        "composted at source."
+    ),
+    "West Bengal": (
+        "Keep wet and dry waste in separate bins; recyclable dry waste can be sold to "
+        "registered kabadiwalas."
+    ),
+}
+
+
+# ISO 3166-2:IN subdivision codes of the states and union territories
+STATES = {
+    "AN": "Andaman and Nicobar Islands", "AP": "Andhra Pradesh", "AR": "Arunachal Pradesh",
+    "AS": "Assam", "BR": "Bihar", "CH": "Chandigarh", "CT": "Chhattisgarh",
+    "DH": "Dadra and Nagar Haveli and Daman and Diu", "DL": "Delhi", "GA": "Goa",
+    "GJ": "Gujarat", "HP": "Himachal Pradesh", "HR": "Haryana", "JH": "Jharkhand",
+    "JK": "Jammu and Kashmir", "KA": "Karnataka", "KL": "Kerala", "LA": "Ladakh",
+    "LD": "Lakshadweep", "MH": "Maharashtra", "ML": "Meghalaya", "MN": "Manipur",
+    "MP": "Madhya Pradesh", "MZ": "Mizoram", "NL": "Nagaland", "OR": "Odisha",
+    "PB": "Punjab", "PY": "Puducherry", "RJ": "Rajasthan", "SK": "Sikkim",
+    "TG": "Telangana", "TN": "Tamil Nadu", "TR": "Tripura", "UP": "Uttar Pradesh",
+    "UT": "Uttarakhand", "WB": "West Bengal",
+}
+
+STATE_ALIASES = {
+    "NCT of Delhi": "Delhi", "New Delhi": "Delhi", "Delhi NCR": "Delhi",
+    "Orissa": "Odisha", "Pondicherry": "Puducherry", "Uttaranchal": "Uttarakhand",
+    "Bengal": "West Bengal", "Keralam": "Kerala", "Mysore": "Karnataka",
+    "TS": "Telangana", "OD": "Odisha", "UK": "Uttarakhand", "CG": "Chhattisgarh",
+    "Tamilnadu": "Tamil Nadu", "Maharastra": "Maharashtra",
+}
+
+# Minimum difflib similarity for a misspelt state name to match
+FUZZY_CUTOFF = 0.8
+
+
+def normalize(name: str) -> str:
+    """Lowercases a place name and reduces punctuation and spacing."""
+    name = name.lower().replace("&", " and ")
+    return " ".join(re.sub(r"[^a-z0-9]+", " ", name).split())
+
+
+def _build_index() -> Dict[str, str]:
+    index = {}
+    for code, state in STATES.items():
+        index[normalize(code)] = state
+        index[normalize(state)] = state
+        # "tamilnadu", "westbengal"
+        index[normalize(state).replace(" ", "")] = state
+    for alias, state in STATE_ALIASES.items():
+        index[normalize(alias)] = state
+    return index
+
+
+STATE_INDEX = _build_index()
+# Codes are too short for fuzzy matching to be meaningful
+_FUZZY_KEYS = [key for key in STATE_INDEX if len(key) > 3]
+
+
+@functools.lru_cache(maxsize=4096)
+def resolve_state(name: str) -> Optional[str]:
+    """
+    Maps a state name, code or alias (in any case or spelling close enough)
+    to its canonical name.
+
+    Returns:
+        str: The canonical state name, or None if nothing matches.
+    """
+    key = normalize(name)
+    if key in STATE_INDEX:
+        return STATE_INDEX[key]
+    matches = difflib.get_close_matches(key, _FUZZY_KEYS, n=1, cutoff=FUZZY_CUTOFF)
+    return STATE_INDEX[matches[0]] if matches else None
+
+
+def canonical_state(location: Dict[str, str]) -> str:
+    """Returns a location's canonical state name, or its normalised name if unknown."""
+    name = location.get("state") or DEFAULT_LOCATION["state"]
+    return resolve_state(name) or normalize(name)
+
+
+def rules_for(location: Dict[str, str]) -> str:
+    """Returns the recycling rules for a location's state."""
+    return RECYCLING_RULES.get(canonical_state(location), NO_RULES)
@@ -0,0 +1,133 @@
+# ml_service/sentiment.py
+"""
+Feedback sentiment analysis.
+
+The documented `predict_sentiment` classified one text per `model.predict`
+call and let `re.sub` look its patterns up on every call. Here texts are
+cleaned with precompiled patterns and classified in batches with a single
+vectorized TF-IDF + logistic regression pass. Concurrent single-text
+requests are pooled by `MicroBatcher` so bursts share model calls too.
+"""
+
+import asyncio
+import os
+import re
+from typing import Callable, List, Sequence
+
+from ml_service.artifact import ModelStore, load_model
+
+URL_RE = re.compile(r"http\S+|www\S+|https\S+", re.MULTILINE)
+MENTION_RE = re.compile(r"@\w+")
+NON_WORD_RE = re.compile(r"\W")
+
+
+def clean_text(text: str) -> str:
+    """Strips URLs, @mentions and punctuation, and lowercases."""
+    text = URL_RE.sub("", text)
+    text = MENTION_RE.sub("", text)
+    text = NON_WORD_RE.sub(" ", text)
+    return text.lower()
+
+
+class SentimentModel:
+    """
+    Wraps a text classifier predicting 1 for positive feedback: a fitted
+    scikit-learn pipeline (e.g. TfidfVectorizer + LogisticRegression) or an
+    artifact store of memory-mapped models (see artifact.py).
+    """
+
+    def __init__(self, pipeline):
+        self.pipeline = pipeline
+
+    @classmethod
+    def load(cls, path: str) -> "SentimentModel":
+        """
+        Loads an artifact root (following its CURRENT version), a single
+        artifact version directory, or a joblib-pickled pipeline.
+        """
+        if os.path.isdir(path):
+            if os.path.exists(os.path.join(path, "meta.json")):
+                return cls(load_model(path))
+            return cls(ModelStore(path))
+
+        import joblib
+
+        return cls(joblib.load(path))
+
+    def predict(self, texts: Sequence[str]) -> List[str]:
+        """
+        Classifies a batch of raw feedback texts in one model call.
+
+        Returns:
+            list: "Positive" or "Negative" for each text, in order.
+        """
+        if not texts:
+            return []
+        predictions = self.pipeline.predict([clean_text(text) for text in texts])
+        # As documented: class 1 is positive, any other class negative
+        return ["Positive" if prediction == 1 else "Negative" for prediction in predictions]
+
+
+class MicroBatcher:
+    """
+    Pools concurrent single-item calls into batches.
+
+    The first item waits up to `max_wait` seconds for others to join (unless
+    the batch fills first), then the whole batch goes through `predict` in a
+    worker thread. Items arriving meanwhile form the next batch.
+
+    Parameters:
+        predict (Callable): Maps a list of items to a list of results.
+        max_batch_size (int): Largest batch passed to `predict`.
+        max_wait (float): Seconds a batch stays open for more items.
+    """
+
+    def __init__(self, predict: Callable[[List], List], max_batch_size: int = 64,
+                 max_wait: float = 0.005):
+        self.predict = predict
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait
+        self._queue = None
+        self._worker = None
+
+    async def submit(self, item):
+        """Queues one item and returns its result once its batch has run."""
+        if self._worker is None:
+            self._queue = asyncio.Queue()
+            self._worker = asyncio.create_task(self._run())
+        future = asyncio.get_running_loop().create_future()
+        self._queue.put_nowait((item, future))
+        return await future
+
+    def _drain(self, batch: list) -> None:
+        while len(batch) < self.max_batch_size and not self._queue.empty():
+            batch.append(self._queue.get_nowait())
+
+    async def _run(self) -> None:
+        while True:
+            batch = [await self._queue.get()]
+            self._drain(batch)
+            if len(batch) < self.max_batch_size and self.max_wait > 0:
+                await asyncio.sleep(self.max_wait)
+                self._drain(batch)
+
+            # Callers that gave up (e.g. disconnected) are not worth predicting
+            batch = [(item, future) for item, future in batch if not future.done()]
+            if not batch:
+                continue
+            try:
+                results = await asyncio.to_thread(self.predict, [item for item, _ in batch])
+            except Exception as exc:
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(exc)
+                continue
+            for (_, future), result in zip(batch, results):
+                if not future.done():
+                    future.set_result(result)
+
+    async def aclose(self) -> None:
+        if self._worker is not None:
+            self._worker.cancel()
+            await asyncio.gather(self._worker, return_exceptions=True)
+            self._worker = None
@@ -0,0 +1,116 @@
+# ml_service/train_sentiment.py
+"""
+Trains the feedback sentiment model as a compact hashing artifact.
+
+Instead of a TfidfVectorizer, whose vocabulary dominates the model's size
+and load time, terms are hashed into a fixed number of columns (see
+artifact.HashingModel). The IDF weights and logistic regression
+coefficients are stored as float32, and nothing but those arrays has to be
+loaded to serve predictions.
+
+Usage (from the repository root):
+    python -m ml_service.train_sentiment labelled.csv models/sentiment
+        [--text-column text] [--label-column label] [--features 262144]
+"""
+
+import argparse
+import sys
+import time
+from typing import Sequence
+
+import numpy as np
+
+from ml_service.artifact import HashingModel, publish
+from ml_service.bulk_score import read_chunks
+from ml_service.sentiment import clean_text
+
+# TfidfVectorizer's default: words of two or more characters
+TOKEN_PATTERN = r"(?u)\b\w\w+\b"
+
+
+def read_labelled(path: str, text_column: str = "text", label_column: str = "label"):
+    """
+    Reads a CSV or JSONL file of labelled feedback.
+
+    Returns:
+        tuple: (cleaned texts, integer labels)
+    """
+    texts, labels = [], []
+    for chunk in read_chunks(path, 10_000):
+        for row in chunk:
+            texts.append(clean_text(str(row.get(text_column) or "")))
+            labels.append(int(row[label_column]))
+    return texts, np.array(labels)
+
+
+def train_hashing(texts: Sequence[str], labels: Sequence[int], n_features: int = 2 ** 18,
+                  ngram_range=(1, 2), sublinear_tf: bool = True, C: float = 1.0) -> HashingModel:
+    """
+    Fits a hashed TF-IDF + logistic regression model.
+
+    Parameters:
+        texts (Sequence[str]): Cleaned training texts.
+        labels (Sequence[int]): Their classes (1 for positive feedback).
+        n_features (int): Hash columns; more means fewer term collisions.
+        ngram_range (tuple): Smallest and largest word n-grams counted.
+        sublinear_tf (bool): Use 1 + log(count) as the term frequency.
+        C (float): Inverse regularisation strength.
+
+    Returns:
+        HashingModel: The fitted model, ready to `publish`.
+    """
+    from scipy.sparse import csr_matrix
+    from sklearn.linear_model import LogisticRegression
+
+    meta = {
+        "n_features": n_features,
+        "lowercase": True,
+        "token_pattern": TOKEN_PATTERN,
+        "ngram_range": list(ngram_range),
+        "stop_words": [],
+        "sublinear_tf": sublinear_tf,
+        "norm": "l2",
+        "intercept": [0.0],
+        "classes": [0, 1],
+    }
+    model = HashingModel(meta, idf=np.ones(n_features, dtype=np.float32),
+                         coef=np.zeros((1, n_features), dtype=np.float32))
+
+    # Smoothed IDF, as TfidfVectorizer computes it
+    docs, columns, _ = model.term_counts(texts)
+    document_frequency = np.bincount(columns, minlength=n_features)
+    model.idf = (np.log((1 + len(texts)) / (1 + document_frequency)) + 1).astype(np.float32)
+
+    docs, columns, weights = model.tfidf(texts)
+    features = csr_matrix((weights, (docs, columns)), shape=(len(texts), n_features))
+    classifier = LogisticRegression(C=C, max_iter=1000).fit(features, labels)
+
+    meta.update(intercept=classifier.intercept_.tolist(), classes=classifier.classes_.tolist())
+    return HashingModel(meta, idf=model.idf, coef=np.atleast_2d(classifier.coef_).astype(np.float32))
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("data", help="CSV or JSONL file of labelled feedback")
+    parser.add_argument("root", help="artifact root to publish to, e.g. models/sentiment")
+    parser.add_argument("--text-column", default="text")
+    parser.add_argument("--label-column", default="label", help="1 for positive, 0 for negative")
+    parser.add_argument("--features", type=int, default=2 ** 18, help="number of hash columns")
+    parser.add_argument("--ngrams", type=int, nargs=2, default=(1, 2), metavar=("MIN", "MAX"))
+    parser.add_argument("--version", default=time.strftime("%Y%m%d-%H%M%S"), help="version name")
+    args = parser.parse_args(argv)
+
+    try:
+        texts, labels = read_labelled(args.data, args.text_column, args.label_column)
+        started = time.perf_counter()
+        model = train_hashing(texts, labels, args.features, tuple(args.ngrams))
+        directory = publish(model, args.root, args.version)
+    except (OSError, KeyError, ValueError) as exc:
+        print(exc, file=sys.stderr)
+        return 1
+    print(f"trained on {len(texts)} texts in {time.perf_counter() - started:.1f}s; published {directory}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
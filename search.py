@@ -0,0 +1,254 @@
+# search.py
+"""
+Full-text search across the documentation pages.
+
+Every page is split into sections at its headings and indexed into an
+inverted index (term -> section -> term frequency). Results are ranked with
+BM25, with heading words weighted above body text. The index tracks each
+page's source hash and only re-indexes pages whose content has changed.
+"""
+
+import bisect
+import math
+import os
+import re
+import threading
+from dataclasses import dataclass
+
+from content import page_blocks, page_path, source_hash
+from views import PAGES, page_slug, slugify
+
+# BM25 parameters
+K1 = 1.2
+B = 0.75
+
+# Heading words count this many times towards a section's term frequency
+HEADING_WEIGHT = 3
+
+SNIPPET_CHARS = 160
+
+TOKEN_RE = re.compile(r"[a-z0-9]+")
+MARKDOWN_HEADING_RE = re.compile(r"^\s*#{1,6}\s+(.+?)\s*#*\s*$")
+MARKUP_RE = re.compile(r"[*`#>|]+|\[([^\]]*)\]\([^)]*\)")
+STOPWORDS = frozenset(
+    "a an and are as at be by for from has in is it its of on or the to with".split()
+)
+
+
+@dataclass
+class Section:
+    page: str
+    heading: str
+    anchor: str
+    text: str
+
+
+@dataclass
+class Hit:
+    page: str
+    heading: str
+    anchor: str
+    snippet: str
+    score: float
+
+    @property
+    def link(self) -> str:
+        """Relative URL that opens the page scrolled to this section."""
+        return f"?page={page_slug(self.page)}#{self.anchor}"
+
+
+def tokenize(text: str) -> list:
+    """Lowercases text and splits it into indexable terms."""
+    return [t for t in TOKEN_RE.findall(text.lower()) if t not in STOPWORDS]
+
+
+def plain_text(text: str) -> str:
+    """Strips the markdown markup that should not show up in snippets."""
+    text = MARKUP_RE.sub(lambda m: m.group(1) or "", text)
+    return " ".join(text.split())
+
+
+def split_sections(page: str, blocks: list) -> list:
+    """
+    Splits a page's blocks into sections, one per heading.
+
+    Headings are the page's st.title/header/subheader calls plus markdown
+    headings inside its text (lines in fenced code blocks are ignored).
+    """
+    sections = []
+
+    def start(heading):
+        heading = plain_text(heading)
+        sections.append(Section(page, heading, slugify(heading), ""))
+
+    def add(text):
+        if not sections:
+            start(page)
+        sections[-1].text += text + "\n"
+
+    def visit(block):
+        if block.kind in ("title", "header", "subheader"):
+            start(block.text)
+        elif block.kind == "markdown":
+            in_fence = False
+            for line in block.text.splitlines():
+                if line.lstrip().startswith("```"):
+                    in_fence = not in_fence
+                match = None if in_fence else MARKDOWN_HEADING_RE.match(line)
+                if match:
+                    start(match.group(1))
+                else:
+                    add(line)
+        elif block.kind in ("expander", "button"):
+            add(block.text)
+        elif block.kind == "code":
+            add(block.label)
+            add(block.text)
+        for child in block.children:
+            visit(child)
+
+    for block in blocks:
+        visit(block)
+    return sections
+
+
+class _PageEntry:
+    def __init__(self, mtime: int, digest: str, sections: list):
+        self.mtime = mtime
+        self.digest = digest
+        self.sections = sections
+        self.lengths = []
+        self.terms = set()
+
+
+class SearchIndex:
+    """
+    Inverted index over the sections of every registered page.
+
+    Build it once per process and call `refresh()` before querying; only
+    pages whose source changed since the last refresh are re-indexed.
+    """
+
+    def __init__(self, pages: dict = PAGES):
+        self._titles = list(pages)
+        self._pages = {}
+        self._postings = {}
+        self._total_length = 0
+        self._section_count = 0
+        self._vocabulary = []
+        self._lock = threading.Lock()
+        self.refresh()
+
+    def refresh(self) -> list:
+        """
+        Re-indexes pages whose source file changed.
+
+        A file's modification time is checked first, so an unchanged tree
+        costs one stat per page; content is only hashed when that differs.
+
+        Returns:
+            list: Titles of the pages that were re-indexed.
+        """
+        changed = []
+        with self._lock:
+            for title in self._titles:
+                path = page_path(title)
+                mtime = os.stat(path).st_mtime_ns
+                entry = self._pages.get(title)
+                if entry is not None and entry.mtime == mtime:
+                    continue
+                digest = source_hash(path)
+                if entry is not None and entry.digest == digest:
+                    entry.mtime = mtime
+                    continue
+                self._remove(title)
+                sections = split_sections(title, page_blocks(title))
+                self._add(title, _PageEntry(mtime, digest, sections))
+                changed.append(title)
+            if changed:
+                self._vocabulary = sorted(self._postings)
+        return changed
+
+    def _remove(self, title: str) -> None:
+        entry = self._pages.pop(title, None)
+        if entry is None:
+            return
+        for term in entry.terms:
+            postings = self._postings[term]
+            for key in [key for key in postings if key[0] == title]:
+                del postings[key]
+            if not postings:
+                del self._postings[term]
+        self._total_length -= sum(entry.lengths)
+        self._section_count -= len(entry.sections)
+
+    def _add(self, title: str, entry: _PageEntry) -> None:
+        for i, section in enumerate(entry.sections):
+            terms = tokenize(section.text) + tokenize(section.heading) * HEADING_WEIGHT
+            for term in terms:
+                postings = self._postings.setdefault(term, {})
+                postings[(title, i)] = postings.get((title, i), 0) + 1
+            entry.terms.update(terms)
+            entry.lengths.append(len(terms))
+        self._pages[title] = entry
+        self._total_length += sum(entry.lengths)
+        self._section_count += len(entry.sections)
+
+    def _expand(self, term: str, prefix: bool) -> list:
+        """Returns the indexed terms matching a query term."""
+        if not prefix:
+            return [term] if term in self._postings else []
+        start = bisect.bisect_left(self._vocabulary, term)
+        end = bisect.bisect_left(self._vocabulary, term + "\uffff", start)
+        return self._vocabulary[start:end]
+
+    def search(self, query: str, limit: int = 10) -> list:
+        """
+        Ranks sections against a free-text query.
+
+        The last query word also matches as a prefix, so results update
+        while the reader is still typing.
+
+        Parameters:
+            query (str): The search text.
+            limit (int): Maximum number of hits to return.
+
+        Returns:
+            list: Hit objects, best match first.
+        """
+        words = tokenize(query)
+        if not words:
+            return []
+
+        with self._lock:
+            count = self._section_count or 1
+            average_length = self._total_length / count or 1
+            scores = {}
+            for n, word in enumerate(words):
+                for term in self._expand(word, prefix=n == len(words) - 1):
+                    postings = self._postings[term]
+                    idf = math.log(1 + (count - len(postings) + 0.5) / (len(postings) + 0.5))
+                    for key, tf in postings.items():
+                        length = self._pages[key[0]].lengths[key[1]]
+                        norm = K1 * (1 - B + B * length / average_length)
+                        scores[key] = scores.get(key, 0.0) + idf * tf * (K1 + 1) / (tf + norm)
+
+            best = sorted(scores.items(), key=lambda item: item[1], reverse=True)[:limit]
+            return [
+                self._hit(self._pages[title].sections[i], words, score)
+                for (title, i), score in best
+            ]
+
+    @staticmethod
+    def _hit(section: Section, words: list, score: float) -> Hit:
+        text = plain_text(section.text)
+        lowered = text.lower()
+        positions = [lowered.find(word) for word in words]
+        position = min((p for p in positions if p >= 0), default=0)
+        start = max(0, position - SNIPPET_CHARS // 3)
+        snippet = text[start:start + SNIPPET_CHARS]
+        if start > 0:
+            snippet = "…" + snippet
+        if start + SNIPPET_CHARS < len(text):
+            snippet += "…"
+        return Hit(section.page, section.heading, section.anchor, snippet, score)
@@ -0,0 +1,264 @@
+# shared_cache.py
+"""
+A cache shared by every app process on a host, with single-flight fills.
+
+Each Streamlit replica keeps its own in-memory caches, so on a deploy every
+replica (and every session within it) would fetch the same remote asset at
+once. This cache lives in a SQLite file that all replicas open, and a key
+is filled by a single caller at a time:
+
+- within a process, concurrent callers for a key wait for the one caller
+  already computing it,
+- across processes, that caller first takes a lease on the key in the
+  database; other processes serve the stale value they already have, or
+  poll until the lease holder stores the new one.
+
+Leases expire, so a process that dies mid-fetch cannot block a key forever.
+
+Whatever the file holds is trusted by every process that opens it, so the
+cache refuses a file owned by another user, and a directory it creates for
+the file is private to the current user.
+"""
+
+import json
+import os
+import sqlite3
+import stat
+import threading
+import time
+import uuid
+from dataclasses import dataclass
+from typing import Any, Callable, Optional
+
+# Seconds between checks while another process fills a key
+POLL_INTERVAL = 0.05
+
+
+@dataclass
+class Lookup:
+    value: Any
+    # Wall-clock time the value was stored (comparable across processes)
+    stored_at: float
+    fresh: bool = True
+
+    @property
+    def age(self) -> float:
+        return max(0.0, time.time() - self.stored_at)
+
+
+class _Flight:
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Optional[Lookup] = None
+
+
+def check_owner(path: str) -> None:
+    """
+    Refuses a cache file that another user could have planted or can swap.
+
+    Raises:
+        PermissionError: If the file is owned by another user, or its
+            directory is another user's and writable by others without
+            the sticky bit (which would let them replace the file).
+    """
+    if not hasattr(os, "getuid"):
+        return
+    uid = os.getuid()
+    if os.stat(path).st_uid != uid:
+        raise PermissionError(f"{path} is owned by another user")
+    directory = os.stat(os.path.dirname(os.path.abspath(path)))
+    if directory.st_uid not in (uid, 0) or (
+        directory.st_mode & (stat.S_IWGRP | stat.S_IWOTH) and not directory.st_mode & stat.S_ISVTX
+    ):
+        raise PermissionError(f"the directory of {path} can be modified by other users")
+
+
+class SharedCache:
+    """
+    SQLite-backed cache of JSON values, safe for concurrent processes.
+
+    Parameters:
+        path (str): The database file, shared by the cooperating processes.
+        lease_seconds (float): How long a fill may take before other
+            processes may take the key over.
+    """
+
+    def __init__(self, path: str, lease_seconds: float = 30.0):
+        self.path = path
+        self.lease_seconds = lease_seconds
+        self._lock = threading.Lock()
+        self._flights = {}
+        self.counters = {
+            "hits": 0, "stale_hits": 0, "misses": 0, "waits": 0,
+            "wait_seconds": 0.0, "max_wait_seconds": 0.0, "takeovers": 0,
+        }
+        os.makedirs(os.path.dirname(os.path.abspath(path)), mode=0o700, exist_ok=True)
+        self._db = sqlite3.connect(path, timeout=10, check_same_thread=False, isolation_level=None)
+        try:
+            check_owner(path)
+        except OSError:
+            self._db.close()
+            raise
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS entries "
+            "(key TEXT PRIMARY KEY, value TEXT, stored_at REAL NOT NULL, expires_at REAL NOT NULL)"
+        )
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS leases "
+            "(key TEXT PRIMARY KEY, owner TEXT NOT NULL, expires_at REAL NOT NULL)"
+        )
+
+    def _count(self, counter: str, amount: float = 1) -> None:
+        with self._lock:
+            self.counters[counter] += amount
+
+    def _record_wait(self, seconds: float) -> None:
+        with self._lock:
+            self.counters["waits"] += 1
+            self.counters["wait_seconds"] += seconds
+            self.counters["max_wait_seconds"] = max(self.counters["max_wait_seconds"], seconds)
+
+    def get(self, key: str) -> Optional[Lookup]:
+        """Returns the stored entry for a key, fresh or not, or None."""
+        with self._lock:
+            row = self._db.execute(
+                "SELECT value, stored_at, expires_at FROM entries WHERE key = ?", (key,)
+            ).fetchone()
+        if row is None:
+            return None
+        value = json.loads(row[0]) if row[0] is not None else None
+        return Lookup(value, row[1], fresh=time.time() < row[2])
+
+    def put(self, key: str, value: Any, ttl: float) -> Lookup:
+        now = time.time()
+        payload = json.dumps(value, separators=(",", ":")) if value is not None else None
+        with self._lock:
+            self._db.execute(
+                "INSERT OR REPLACE INTO entries (key, value, stored_at, expires_at) VALUES (?, ?, ?, ?)",
+                (key, payload, now, now + ttl),
+            )
+        return Lookup(value, now)
+
+    def _acquire(self, key: str) -> Optional[str]:
+        """Takes the key's lease if nobody holds it; returns the owner token."""
+        owner = f"{os.getpid()}:{uuid.uuid4().hex}"
+        now = time.time()
+        with self._lock:
+            self._db.execute("BEGIN IMMEDIATE")
+            try:
+                row = self._db.execute("SELECT expires_at FROM leases WHERE key = ?", (key,)).fetchone()
+                if row is not None and row[0] > now:
+                    return None
+                self._db.execute(
+                    "INSERT OR REPLACE INTO leases (key, owner, expires_at) VALUES (?, ?, ?)",
+                    (key, owner, now + self.lease_seconds),
+                )
+            finally:
+                self._db.execute("COMMIT")
+        if row is not None:
+            # The previous holder's lease ran out without a release
+            self._count("takeovers")
+        return owner
+
+    def _release(self, key: str, owner: str) -> None:
+        with self._lock:
+            self._db.execute("DELETE FROM leases WHERE key = ? AND owner = ?", (key, owner))
+
+    def get_or_compute(self, key: str, compute: Callable[[], Any], ttl: float,
+                       failure_ttl: float = 60.0, wait_timeout: float = 10.0) -> Lookup:
+        """
+        Returns the value for a key, computing it only if no process has a
+        fresh copy, and only in one caller at a time.
+
+        A `compute` result of None is stored for `failure_ttl` seconds, so
+        other processes do not retry a failing source straight away.
+
+        Parameters:
+            key (str): The cache key.
+            compute (Callable): Produces the value (JSON-serialisable) or None.
+            ttl (float): Seconds a computed value stays fresh.
+            failure_ttl (float): Seconds a None result stays fresh.
+            wait_timeout (float): Longest wait for another process's fill
+                before computing the value here anyway.
+
+        Returns:
+            Lookup: The value and when it was stored. `fresh` is False when a
+            stale value is returned because another process is refreshing it.
+        """
+        entry = self.get(key)
+        if entry is not None and entry.fresh:
+            self._count("hits")
+            return entry
+
+        with self._lock:
+            flight = self._flights.get(key)
+            leader = flight is None
+            if leader:
+                flight = self._flights[key] = _Flight()
+        if not leader:
+            started = time.monotonic()
+            flight.done.wait(wait_timeout)
+            self._record_wait(time.monotonic() - started)
+            return flight.result or entry or Lookup(None, time.time(), fresh=False)
+
+        try:
+            flight.result = self._fill(key, compute, ttl, failure_ttl, wait_timeout, entry)
+            return flight.result
+        finally:
+            with self._lock:
+                del self._flights[key]
+            flight.done.set()
+
+    def _fill(self, key, compute, ttl, failure_ttl, wait_timeout, entry) -> Lookup:
+        started = time.monotonic()
+        polled = False
+        while True:
+            owner = self._acquire(key)
+            if owner is not None:
+                try:
+                    # Another process may have filled it while we waited
+                    latest = self.get(key)
+                    if latest is not None and latest.fresh:
+                        if polled:
+                            self._record_wait(time.monotonic() - started)
+                        self._count("hits")
+                        return latest
+                    value = compute()
+                    self._count("misses")
+                    return self.put(key, value, ttl if value is not None else failure_ttl)
+                finally:
+                    self._release(key, owner)
+
+            # Another process holds the lease
+            if entry is not None and entry.value is not None:
+                self._count("stale_hits")
+                return entry
+            latest = self.get(key)
+            waited = time.monotonic() - started
+            if latest is not None and latest.fresh:
+                self._record_wait(waited)
+                return latest
+            if waited >= wait_timeout:
+                self._record_wait(waited)
+                value = compute()
+                self._count("misses")
+                return self.put(key, value, ttl if value is not None else failure_ttl)
+            polled = True
+            time.sleep(POLL_INTERVAL)
+
+    def stats(self) -> dict:
+        """Returns this process's hit/miss/wait counters and the entry count."""
+        with self._lock:
+            entries = self._db.execute("SELECT COUNT(*) FROM entries").fetchone()[0]
+            lookups = self.counters["hits"] + self.counters["stale_hits"] + self.counters["misses"]
+            return {
+                **self.counters,
+                "hit_ratio": (lookups - self.counters["misses"]) / lookups if lookups else 0.0,
+                "entries": entries,
+            }
+
+    def close(self) -> None:
+        with self._lock:
+            self._db.close()
@@ -0,0 +1,160 @@
+# startup.py
+"""
+Launches the app with its caches warmed in the background.
+
+Streamlit only executes app.py when the first session connects, so that
+session pays for importing every page, reading the asset bundle, fetching
+animations and building the search index. This launcher starts the
+Streamlit server in the same process and does that work on a background
+thread at boot instead: the modules it imports and the caches it fills are
+the ones the script runs reuse.
+
+When the warmup finishes, a readiness file is written (for an exec
+readiness probe such as `test -f /tmp/homescrapper.ready`); it holds the
+duration of each warmup step. The server accepts connections from the start,
+so a session arriving early is served, just without the head start.
+
+Usage (from the repository root):
+    python -m startup [--no-warmup] [streamlit run options, e.g. --server.port 8501]
+"""
+
+import atexit
+import importlib
+import json
+import os
+import sys
+import tempfile
+import threading
+import time
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+APP_PATH = os.path.join(ROOT, "app.py")
+
+READY_FILE = os.environ.get(
+    "HOMESCRAPPER_READY_FILE", os.path.join(tempfile.gettempdir(), "homescrapper.ready")
+)
+
+# Deferred on the request path (see assets.py, views/home.py), but worth
+# loading before the first session needs them
+OPTIONAL_MODULES = ["requests", "streamlit_lottie"]
+
+ready = threading.Event()
+
+
+def _import_modules() -> None:
+    from views import PAGES
+
+    for module in ["ui", *PAGES.values(), *OPTIONAL_MODULES]:
+        try:
+            importlib.import_module(module)
+        except ImportError:
+            pass
+
+
+def _load_assets() -> None:
+    import assets
+    from content import iter_blocks, page_blocks
+    from views import PAGES
+
+    assets.shared_cache()
+    urls = {
+        block.text
+        for title in PAGES
+        for block in iter_blocks(page_blocks(title))
+        if block.kind == "lottie"
+    }
+    for url in sorted(urls):
+        assets.load_lottieurl(url)
+
+
+def _build_search_index() -> None:
+    import ui
+
+    ui.search_index()
+
+
+def _build_architecture_graph() -> None:
+    import architecture
+    from views import architecture as page
+
+    graph = page.project_graph(architecture.source_versions())
+    page.graph_layout(graph.digest(), graph)
+
+
+WARMUP_STEPS = [
+    ("imports", _import_modules),
+    ("assets", _load_assets),
+    ("search index", _build_search_index),
+    ("architecture graph", _build_architecture_graph),
+]
+
+
+def write_ready_file(report: dict, path: str = READY_FILE) -> None:
+    """Writes the readiness file atomically, so a probe never sees half of it."""
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+    os.replace(tmp_path, path)
+
+
+def remove_ready_file(path: str = READY_FILE) -> None:
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
+
+
+def warmup(steps=WARMUP_STEPS, ready_file: str = READY_FILE) -> dict:
+    """
+    Runs the warmup steps, then signals readiness.
+
+    A failing step is recorded and skipped: the app still works without a
+    warm cache, so it should not be held out of rotation for one.
+
+    Parameters:
+        steps (list): (name, function) pairs, run in order.
+        ready_file (str): File written once the warmup is done; empty to
+            only set the `ready` event.
+
+    Returns:
+        dict: The report written to the readiness file.
+    """
+    started = time.perf_counter()
+    report = {"pid": os.getpid(), "steps": {}, "errors": {}}
+    for name, step in steps:
+        step_started = time.perf_counter()
+        try:
+            step()
+        except Exception as exc:
+            report["errors"][name] = repr(exc)
+        report["steps"][name] = round(time.perf_counter() - step_started, 4)
+    report["warmup_s"] = round(time.perf_counter() - started, 4)
+    report["ready_at"] = time.time()
+    if ready_file:
+        write_ready_file(report, ready_file)
+    ready.set()
+    return report
+
+
+def main(argv=None) -> int:
+    args = list(sys.argv[1:] if argv is None else argv)
+    warm = "--no-warmup" not in args
+    if not warm:
+        args.remove("--no-warmup")
+
+    # A file left behind by a previous process must not report this one ready
+    remove_ready_file()
+    atexit.register(remove_ready_file)
+    if warm:
+        threading.Thread(target=warmup, name="warmup", daemon=True).start()
+    else:
+        write_ready_file({"pid": os.getpid(), "steps": {}, "errors": {}, "ready_at": time.time()})
+
+    from streamlit.web import cli
+
+    sys.argv = ["streamlit", "run", APP_PATH, *args]
+    return cli.main()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,35 @@
+# tests/test_bulk_score.py
+
+import csv
+import json
+
+import pytest
+
+from ml_service.bulk_score import read_chunks, read_chunks_at
+
+
+@pytest.fixture(params=["csv", "jsonl"])
+def feedback_file(request, tmp_path):
+    rows = [{"id": str(i), "text": f"très bien,\n{i}" if i % 3 else f"ok {i}"} for i in range(25)]
+    path = tmp_path / f"feedback.{request.param}"
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        if request.param == "csv":
+            writer = csv.DictWriter(f, fieldnames=["id", "text"])
+            writer.writeheader()
+            writer.writerows(rows)
+        else:
+            f.writelines(json.dumps(row) + "\n" for row in rows)
+    return str(path), rows
+
+
+def test_read_chunks(feedback_file):
+    path, rows = feedback_file
+    assert [row for chunk in read_chunks(path, 10) for row in chunk] == rows
+
+
+def test_read_chunks_resumes_from_an_offset(feedback_file):
+    path, rows = feedback_file
+    offsets = [offset for _, offset in read_chunks_at(path, 10)]
+    for done, offset in enumerate(offsets, start=1):
+        resumed = [row for chunk, _ in read_chunks_at(path, 10, offset) for row in chunk]
+        assert resumed == rows[done * 10:]
@@ -0,0 +1,22 @@
+# tests/test_cache.py
+
+import io
+
+from PIL import Image, ImageDraw
+
+from ml_service.cache import content_digest, image_digest
+
+
+def test_similar_images_get_different_digests():
+    bottle, can = Image.new("RGB", (64, 64), "white"), Image.new("RGB", (64, 64), "white")
+    ImageDraw.Draw(bottle).rectangle((24, 8, 40, 56), fill=(30, 120, 40))
+    ImageDraw.Draw(can).rectangle((24, 8, 40, 56), fill=(34, 120, 40))
+    assert image_digest(bottle) != image_digest(can)
+
+
+def test_digest_ignores_the_encoding():
+    image = Image.new("RGB", (32, 16), (200, 10, 10))
+    png, bmp = io.BytesIO(), io.BytesIO()
+    image.save(png, "PNG")
+    image.save(bmp, "BMP")
+    assert content_digest(png.getvalue()) == content_digest(bmp.getvalue()) == image_digest(image)
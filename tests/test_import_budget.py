@@ -0,0 +1,26 @@
+# tests/test_import_budget.py
+
+import os
+
+import pytest
+
+from tools.import_budget import DEFERRED_MODULES, evaluate, measure
+
+# Multiplies every budget, for machines slower than the one they were set on
+SCALE = float(os.environ.get("HOMESCRAPPER_IMPORT_BUDGET_SCALE", "1.0"))
+
+
+@pytest.fixture(scope="module")
+def results():
+    return measure(runs=3)
+
+
+def test_deferred_modules_are_not_imported_at_startup(results):
+    chrome = {name for name, _ in results[0]["chrome"]}
+    assert not chrome & set(DEFERRED_MODULES)
+
+
+def test_import_time_is_within_budget(results):
+    report = evaluate(results, SCALE)
+    over = {phase: entry["median_ms"] for phase, entry in report["phases"].items() if entry["over_budget"]}
+    assert not over, f"over budget (ms): {over}"
@@ -0,0 +1,35 @@
+# tests/test_location.py
+
+import pytest
+
+from ml_service.location import LocationResolver, state_for_pin
+from ml_service.rules import NO_RULES, rules_for
+
+
+@pytest.mark.parametrize("pin_code, state", [
+    ("682001", "Kerala"),
+    ("682555", "Lakshadweep"),
+    ("396001", "Gujarat"),
+    ("396230", "Dadra and Nagar Haveli and Daman and Diu"),
+    ("605001", "Puducherry"),
+    ("605602", "Tamil Nadu"),
+    ("247001", "Uttar Pradesh"),
+    ("247667", "Uttarakhand"),
+    ("160001", "Chandigarh"),
+    ("160055", "Punjab"),
+    ("403001", "Goa"),
+    ("400 001", "Maharashtra"),
+])
+def test_state_for_pin(pin_code, state):
+    assert state_for_pin(pin_code) == state
+
+
+def test_state_for_pin_rejects_malformed_codes():
+    assert state_for_pin("6820") is None
+    assert state_for_pin("999999") is None
+
+
+def test_kochi_pin_gets_kerala_rules():
+    location = LocationResolver().resolve(pin_code="682001")
+    assert location["state"] == "Kerala"
+    assert rules_for(location) == rules_for({"state": "Kerala"}) != NO_RULES
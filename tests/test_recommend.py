@@ -0,0 +1,29 @@
+# tests/test_recommend.py
+
+from ml_service.recommend import build_index
+
+
+def catalog():
+    # "plastic" is held by half the catalog, far above the max_df cutoff
+    items = [{"id": f"filler{i}", "title": f"filler{i}", "category": "plastic" if i % 2 else "paper"}
+             for i in range(100)]
+    items += [
+        {"id": "bottle", "title": "green bottle", "category": "plastic"},
+        {"id": "crate", "title": "bottle crate", "category": "plastic"},
+        {"id": "rack", "title": "bottle rack", "category": "metal"},
+    ]
+    return items
+
+
+def test_common_category_counts_in_similarity():
+    index = build_index(catalog(), k=5)
+    assert len(index.common_columns)
+    scores = dict(index.similar("bottle"))
+    assert scores["crate"] > scores["rack"] > 0
+
+
+def test_common_category_counts_for_added_items():
+    items = catalog()
+    index = build_index(items[:-2], k=5).add_items(items[-2:])
+    scores = dict(index.similar("bottle"))
+    assert scores["crate"] > scores["rack"] > 0
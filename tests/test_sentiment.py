@@ -0,0 +1,19 @@
+# tests/test_sentiment.py
+
+import pytest
+
+from ml_service.sentiment import SentimentModel
+
+
+class FixedPipeline:
+    def __init__(self, predictions):
+        self.predictions = predictions
+
+    def predict(self, texts):
+        return self.predictions[:len(texts)]
+
+
+@pytest.mark.parametrize("predictions", [[1, 0], [1, -1], [1.0, 2], [True, "negative"]])
+def test_class_one_is_positive_and_any_other_class_negative(predictions):
+    expected = ["Positive", "Negative"]
+    assert SentimentModel(FixedPipeline(predictions)).predict(["great", "bad"]) == expected
@@ -0,0 +1,92 @@
+# tests/test_shared_cache.py
+
+import os
+import threading
+import time
+
+import pytest
+
+from shared_cache import SharedCache
+
+
+@pytest.fixture
+def path(tmp_path):
+    return str(tmp_path / "cache.sqlite")
+
+
+class SlowCompute:
+    def __init__(self, value, seconds=0.2):
+        self.value = value
+        self.seconds = seconds
+        self.calls = 0
+        self._lock = threading.Lock()
+
+    def __call__(self):
+        with self._lock:
+            self.calls += 1
+        time.sleep(self.seconds)
+        return self.value
+
+
+def run_concurrently(caches, key, compute):
+    results = [None] * len(caches)
+
+    def call(i):
+        results[i] = caches[i].get_or_compute(key, compute, ttl=60, wait_timeout=5)
+
+    threads = [threading.Thread(target=call, args=(i,)) for i in range(len(caches))]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return results
+
+
+def test_concurrent_callers_in_one_process_compute_once(path):
+    cache = SharedCache(path)
+    compute = SlowCompute({"frames": 60})
+    results = run_concurrently([cache] * 8, "asset", compute)
+    assert compute.calls == 1
+    assert [result.value for result in results] == [{"frames": 60}] * 8
+    assert cache.stats()["waits"] == 7
+
+
+def test_concurrent_processes_compute_once(path):
+    # One SharedCache per "process": separate connections, so the callers
+    # coordinate through the lease table rather than in memory
+    caches = [SharedCache(path) for _ in range(4)]
+    compute = SlowCompute({"frames": 60})
+    results = run_concurrently(caches, "asset", compute)
+    assert compute.calls == 1
+    assert [result.value for result in results] == [{"frames": 60}] * 4
+
+
+def test_failure_is_cached_for_failure_ttl(path):
+    cache = SharedCache(path)
+    compute = SlowCompute(None, seconds=0)
+    for _ in range(3):
+        assert cache.get_or_compute("asset", compute, ttl=60, failure_ttl=0.2).value is None
+    assert compute.calls == 1
+    time.sleep(0.25)
+    cache.get_or_compute("asset", compute, ttl=60, failure_ttl=0.2)
+    assert compute.calls == 2
+
+
+def test_expired_lease_is_taken_over(path):
+    crashed = SharedCache(path, lease_seconds=0.1)
+    # Takes the lease and never releases it, like a process that died mid-fill
+    assert crashed._acquire("asset") is not None
+
+    cache = SharedCache(path)
+    compute = SlowCompute({"frames": 60}, seconds=0)
+    assert cache.get_or_compute("asset", compute, ttl=60, wait_timeout=5).value == {"frames": 60}
+    assert compute.calls == 1
+    assert cache.stats()["takeovers"] == 1
+
+
+@pytest.mark.skipif(not hasattr(os, "getuid") or os.getuid() != 0, reason="needs root to chown")
+def test_refuses_a_file_owned_by_another_user(path):
+    open(path, "w").close()
+    os.chown(path, 65534, 65534)
+    with pytest.raises(PermissionError):
+        SharedCache(path)
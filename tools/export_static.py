@@ -0,0 +1,279 @@
+# tools/export_static.py
+"""
+Exports every registered documentation page as static, minified HTML.
+Interactive-only pages (views.INTERACTIVE_PAGES) are left out.
+
+Page content is read from the view modules (see content.py) and rendered
+with markdown-it-py, the CommonMark/GFM renderer closest to Streamlit's own.
+Lottie animations are inlined from the checked-in asset bundle only (see
+tools/pack_assets.py), never fetched, so an export is reproducible; a missing
+animation is skipped with a warning, or fails the export with --strict, and code blocks are highlighted at build time when
+Pygments is installed, so the browser has no highlighting work to do.
+
+Output layout (default `dist/`):
+
+    site.<hash>.css        shared stylesheet          immutable, cache forever
+    <page>.<hash>.html     rendered page              immutable, cache forever
+    <page>.html            redirect to current build  short cache
+    index.html             redirect to Home           short cache
+    manifest.json          page -> hashed file        short cache
+
+Pages link to each other through the short-lived `<page>.html` names, so a
+page's hashed filename depends only on its own content. A CDN can also use
+manifest.json to rewrite those names to the hashed files directly.
+
+Usage (from the repository root):
+    pip install markdown-it-py  # plus pygments for highlighting
+    python -m tools.export_static [--output dist] [--strict]
+"""
+
+import argparse
+import hashlib
+import html
+import json
+import os
+import re
+import shutil
+import sys
+
+import assets
+from content import page_blocks
+from views import INTERACTIVE_PAGES, PAGES, page_slug, slugify
+
+LOTTIE_PLAYER = "https://cdnjs.cloudflare.com/ajax/libs/lottie-web/5.12.2/lottie_light.min.js"
+HASH_LENGTH = 10
+
+SITE_CSS = """
+body { margin: 0; font-family: "Source Sans Pro", system-ui, sans-serif; color: #31333f; line-height: 1.6; }
+nav { position: fixed; top: 0; bottom: 0; width: 15rem; padding: 2rem 1rem; background: #f0f2f6; }
+nav a { display: block; padding: .3rem .5rem; color: inherit; text-decoration: none; border-radius: .4rem; }
+nav a[aria-current] { background: #fff; font-weight: 600; }
+main { margin-left: 17rem; max-width: 56rem; padding: 1rem 2rem 2rem; }
+pre { background: #f8f9fb; padding: 1rem; border-radius: .5rem; overflow-x: auto; }
+code { font-family: "Source Code Pro", monospace; font-size: .9em; }
+details { border: 1px solid #e6e9ef; border-radius: .5rem; padding: .5rem 1rem; margin: .5rem 0; }
+summary { cursor: pointer; }
+hr { border: 0; border-top: 1px solid #e6e9ef; margin: 2rem 0; }
+.button { display: inline-block; padding: .4rem .8rem; border: 1px solid #d6d6d9; border-radius: .5rem; color: inherit; text-decoration: none; }
+.lottie { height: 300px; }
+"""
+
+PAGE_TEMPLATE = """<!doctype html>
+<html lang="en">
+<head>
+<meta charset="utf-8">
+<meta name="viewport" content="width=device-width, initial-scale=1">
+<title>{title} · Home$crapper</title>
+<link rel="icon" href="data:image/svg+xml,<svg xmlns=%22http://www.w3.org/2000/svg%22 viewBox=%220 0 100 100%22><text y=%22.9em%22 font-size=%2290%22>♻️</text></svg>">
+<link rel="stylesheet" href="{css}">
+{head}
+</head>
+<body>
+<nav><strong>🔎 Explore Home$crapper</strong>{nav}</nav>
+<main>{body}</main>
+</body>
+</html>
+"""
+
+REDIRECT_TEMPLATE = """<!doctype html>
+<html lang="en"><head><meta charset="utf-8">
+<meta http-equiv="refresh" content="0; url={target}">
+<link rel="canonical" href="{target}">
+<script>location.replace("{target}" + location.hash)</script>
+</head><body><a href="{target}">{title}</a></body></html>
+"""
+
+LOTTIE_SCRIPT = """<script defer src="{player}"></script>
+<script>
+addEventListener("DOMContentLoaded", function () {{
+  document.querySelectorAll(".lottie").forEach(function (el) {{
+    lottie.loadAnimation({{
+      container: el, renderer: "svg", loop: true, autoplay: true,
+      animationData: JSON.parse(el.querySelector("script").textContent)
+    }});
+  }});
+}});
+</script>"""
+
+HEADING_RE = re.compile(r"<h([1-6])>(.*?)</h\1>", re.S)
+TAG_RE = re.compile(r"<[^>]+>")
+RAW_BLOCK_RE = re.compile(r"(<(pre|script|style)\b.*?</\2>)", re.S)
+
+
+def content_hash(data: str) -> str:
+    return hashlib.sha256(data.encode("utf-8")).hexdigest()[:HASH_LENGTH]
+
+
+def make_renderer():
+    """Returns a markdown-it renderer, with Pygments highlighting if available."""
+    try:
+        from markdown_it import MarkdownIt
+    except ImportError:
+        sys.exit("The static export needs markdown-it-py: pip install markdown-it-py")
+
+    highlight = None
+    try:
+        from pygments import highlight as pygments_highlight
+        from pygments.formatters import HtmlFormatter
+        from pygments.lexers import get_lexer_by_name
+        from pygments.util import ClassNotFound
+
+        formatter = HtmlFormatter(nowrap=True)
+
+        def highlight(code, lang, attrs):
+            try:
+                lexer = get_lexer_by_name(lang or "text")
+            except ClassNotFound:
+                return ""
+            return pygments_highlight(code, lexer, formatter)
+    except ImportError:
+        pass
+
+    options = {"html": False, "typographer": False}
+    if highlight is not None:
+        options["highlight"] = highlight
+    return MarkdownIt("commonmark", options).enable(["table", "strikethrough"])
+
+
+def pygments_css() -> str:
+    try:
+        from pygments.formatters import HtmlFormatter
+    except ImportError:
+        return ""
+    return HtmlFormatter().get_style_defs("pre")
+
+
+def add_heading_anchors(fragment: str) -> str:
+    """Gives headings the same ids Streamlit uses, so deep links keep working."""
+    def anchor(match):
+        level, inner = match.groups()
+        return f'<h{level} id="{slugify(html.unescape(TAG_RE.sub("", inner)))}">{inner}</h{level}>'
+    return HEADING_RE.sub(anchor, fragment)
+
+
+def minify_html(document: str) -> str:
+    """Collapses whitespace outside <pre>, <script> and <style> blocks."""
+    parts = RAW_BLOCK_RE.split(document)
+    out = []
+    # re.split with two groups yields: text, block, tag name, text, ...
+    for i in range(0, len(parts), 3):
+        out.append(re.sub(r"\s+", " ", parts[i]))
+        if i + 1 < len(parts):
+            out.append(parts[i + 1])
+    return "".join(out).strip()
+
+
+def minify_css(css: str) -> str:
+    css = re.sub(r"/\*.*?\*/", "", css, flags=re.S)
+    css = re.sub(r"\s+", " ", css)
+    return re.sub(r"\s*([{}:;,>])\s*", r"\1", css).replace(";}", "}").strip()
+
+
+def render_blocks(blocks: list, md, missing: list) -> tuple:
+    """
+    Renders page blocks to HTML. URLs of animations missing from the asset
+    bundle are appended to `missing`.
+
+    Returns:
+        tuple: (html, has_animation)
+    """
+    parts = []
+    has_animation = False
+    for block in blocks:
+        if block.kind in ("title", "header", "subheader"):
+            tag = {"title": "h1", "header": "h2", "subheader": "h3"}[block.kind]
+            parts.append(f"<{tag}>{md.renderInline(block.text)}</{tag}>")
+        elif block.kind == "markdown":
+            parts.append(md.render(block.text))
+        elif block.kind == "divider":
+            parts.append("<hr>")
+        elif block.kind == "button":
+            parts.append(f'<p><a class="button" href="#">{md.renderInline(block.text)}</a></p>')
+        elif block.kind == "expander":
+            inner, child_animation = render_blocks(block.children, md, missing)
+            has_animation = has_animation or child_animation
+            parts.append(f"<details><summary>{md.renderInline(block.text)}</summary>{inner}</details>")
+        elif block.kind == "code":
+            listing = md.render(f"```{block.language}\n{block.text}\n```")
+            parts.append(f"<details><summary><code>{html.escape(block.label)}</code></summary>{listing}</details>")
+        elif block.kind == "lottie":
+            data = assets.bundled_asset(block.text)
+            if data is None:
+                print(f"warning: animation {block.text} is not in the asset bundle, skipped", file=sys.stderr)
+                missing.append(block.text)
+                continue
+            payload = json.dumps(data, separators=(",", ":")).replace("</", "<\\/")
+            parts.append(f'<div class="lottie"><script type="application/json">{payload}</script></div>')
+            has_animation = True
+    return add_heading_anchors("".join(parts)), has_animation
+
+
+def export(output: str) -> dict:
+    """
+    Renders every page into `output`.
+
+    Returns:
+        dict: The manifest, mapping page slugs to hashed filenames, with
+        the animations missing from the asset bundle under "missing_assets".
+    """
+    md = make_renderer()
+    os.makedirs(output, exist_ok=True)
+
+    css = minify_css(SITE_CSS + pygments_css())
+    css_name = f"site.{content_hash(css)}.css"
+    with open(os.path.join(output, css_name), "w", encoding="utf-8") as f:
+        f.write(css)
+
+    titles = [title for title in PAGES if title not in INTERACTIVE_PAGES]
+    manifest = {"css": css_name, "pages": {}, "missing_assets": []}
+    for title in titles:
+        slug = page_slug(title)
+        body, has_animation = render_blocks(page_blocks(title), md, manifest["missing_assets"])
+        nav = "".join(
+            f'<a href="{page_slug(t)}.html"{" aria-current=page" if t == title else ""}>{html.escape(t)}</a>'
+            for t in titles
+        )
+        document = minify_html(PAGE_TEMPLATE.format(
+            title=html.escape(title),
+            css=css_name,
+            head=LOTTIE_SCRIPT.format(player=LOTTIE_PLAYER) if has_animation else "",
+            nav=nav,
+            body=body,
+        ))
+        name = f"{slug}.{content_hash(document)}.html"
+        with open(os.path.join(output, name), "w", encoding="utf-8") as f:
+            f.write(document)
+        with open(os.path.join(output, f"{slug}.html"), "w", encoding="utf-8") as f:
+            f.write(REDIRECT_TEMPLATE.format(target=name, title=html.escape(title)))
+        manifest["pages"][slug] = name
+
+    home = manifest["pages"][page_slug(titles[0])]
+    with open(os.path.join(output, "index.html"), "w", encoding="utf-8") as f:
+        f.write(REDIRECT_TEMPLATE.format(target=home, title="Home$crapper"))
+    with open(os.path.join(output, "manifest.json"), "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2)
+    return manifest
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Export the documentation pages as static HTML")
+    parser.add_argument("--output", default="dist", help="output directory")
+    parser.add_argument("--clean", action="store_true", help="remove the output directory first")
+    parser.add_argument("--strict", action="store_true", help="fail if an animation is missing from the bundle")
+    args = parser.parse_args(argv)
+
+    if args.clean and os.path.isdir(args.output):
+        shutil.rmtree(args.output)
+    manifest = export(args.output)
+    for slug, name in manifest["pages"].items():
+        size = os.path.getsize(os.path.join(args.output, name))
+        print(f"{slug:<30} {name} ({size} bytes)")
+    if args.strict and manifest["missing_assets"]:
+        print(f"{len(manifest['missing_assets'])} animation(s) missing from the asset bundle; "
+              "run python -m tools.pack_assets", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,170 @@
+# tools/import_budget.py
+"""
+Checks the app's cold-start import time against a budget.
+
+Each measurement is a fresh interpreter run with `python -X importtime`. It
+imports Streamlit first (its cost is outside our control and is not
+counted), then the modules every script run imports ("chrome"), then each
+page module in turn, and attributes each module's own import time to the
+phase it was imported in. Phases are measured several times and the median
+is compared with the budget.
+
+It also fails if the chrome imports any of the dependencies that must stay
+deferred until a page actually needs them (see DEFERRED_MODULES).
+
+Exits with status 1 when a phase is over budget or a deferred module is
+imported eagerly, so it can gate a deployment; tests/test_import_budget.py
+runs the same check under pytest.
+
+Usage (from the repository root):
+    python -m tools.import_budget [--runs 5] [--scale 1.0] [--output import_report.json]
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Phase -> modules imported in it, in order
+PHASES = {
+    "chrome": ["ui", "instrumentation", "views"],
+    "page: Home": ["views.home"],
+    "page: Frontend": ["views.frontend"],
+    "page: Backend": ["views.backend"],
+    "page: GenAI and Machine learning": ["views.genai_ml"],
+    "page: Architecture": ["views.architecture"],
+}
+
+# Phase -> budget in milliseconds, measured on a 1-vCPU container with
+# roughly 2x headroom; use --scale on slower machines
+BUDGETS_MS = {
+    "chrome": 150,
+    "page: Home": 25,
+    "page: Frontend": 25,
+    "page: Backend": 25,
+    "page: GenAI and Machine learning": 25,
+    "page: Architecture": 40,
+}
+
+# Optional dependencies that must not be imported before a page needs them
+DEFERRED_MODULES = ["requests", "streamlit_lottie", "streamlit_agraph", "architecture", "sklearn", "joblib"]
+
+MARKER = "@@phase "
+
+
+def probe_source(phases: dict = PHASES) -> str:
+    """Returns the script a measurement run executes."""
+    lines = ["import sys", "import streamlit"]
+    for phase, modules in phases.items():
+        lines.append(f"sys.stderr.write({MARKER + phase!r} + '\\n')")
+        lines.extend(f"import {module}" for module in modules)
+    return "\n".join(lines)
+
+
+def parse_importtime(stderr: str) -> dict:
+    """
+    Splits `-X importtime` output into phases.
+
+    Returns:
+        dict: Phase -> list of (module, self time in microseconds). Imports
+        before the first marker are filed under "streamlit".
+    """
+    phase = "streamlit"
+    imports = {phase: []}
+    for line in stderr.splitlines():
+        if line.startswith(MARKER):
+            phase = line[len(MARKER):].strip()
+            imports[phase] = []
+            continue
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, _, name = line[len("import time:"):].split("|")
+        imports[phase].append((name.strip(), int(self_us)))
+    return imports
+
+
+def measure(runs: int, phases: dict = PHASES) -> list:
+    """Runs the probe `runs` times; returns the parsed output of each run."""
+    source = probe_source(phases)
+    results = []
+    # The first run compiles any stale bytecode; it is not counted
+    for i in range(runs + 1):
+        completed = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", source],
+            cwd=ROOT, capture_output=True, text=True,
+        )
+        if completed.returncode != 0:
+            raise RuntimeError(completed.stderr.strip().splitlines()[-1])
+        if i:
+            results.append(parse_importtime(completed.stderr))
+    return results
+
+
+def evaluate(results: list, scale: float = 1.0) -> dict:
+    """
+    Compares measurements with the budgets.
+
+    Parameters:
+        results (list): The output of `measure`.
+        scale (float): Multiplies every budget.
+
+    Returns:
+        dict: The report: per phase the median, budget, whether it is over
+        budget and its slowest modules, plus the deferred modules imported
+        by the chrome ("deferred_violations") and an overall "failed" flag.
+    """
+    report = {"runs": len(results), "phases": {}, "deferred_violations": []}
+    for phase in PHASES:
+        totals = [sum(us for _, us in run[phase]) / 1000 for run in results]
+        median = statistics.median(totals)
+        budget = BUDGETS_MS[phase] * scale
+        report["phases"][phase] = {
+            "median_ms": round(median, 2), "budget_ms": budget, "over_budget": median > budget,
+            "modules": len(results[0][phase]),
+            "slowest": sorted(results[0][phase], key=lambda item: -item[1]),
+        }
+    chrome = {name for name, _ in results[0]["chrome"]}
+    report["deferred_violations"] = [module for module in DEFERRED_MODULES if module in chrome]
+    report["failed"] = bool(report["deferred_violations"]) or any(
+        phase["over_budget"] for phase in report["phases"].values()
+    )
+    return report
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Checks cold-start import time against a budget.")
+    parser.add_argument("--runs", type=int, default=5, help="measurements per phase (median is used)")
+    parser.add_argument("--scale", type=float, default=1.0, help="multiply every budget, e.g. 2 on slow CI")
+    parser.add_argument("--top", type=int, default=3, help="slowest modules listed per phase")
+    parser.add_argument("--output", help="also write the report as JSON")
+    args = parser.parse_args(argv)
+
+    try:
+        results = measure(args.runs)
+    except RuntimeError as exc:
+        print(f"import probe failed: {exc}", file=sys.stderr)
+        return 1
+
+    report = evaluate(results, args.scale)
+    print(f"{'phase':<34} {'median ms':>9} {'budget':>7}  slowest modules")
+    for phase, entry in report["phases"].items():
+        entry["slowest"] = entry["slowest"][:args.top]
+        modules = ", ".join(f"{name} {us / 1000:.1f}" for name, us in entry["slowest"])
+        print(f"{phase:<34} {entry['median_ms']:9.1f} {entry['budget_ms']:7.0f}  {modules}"
+              f"{'  OVER BUDGET' if entry['over_budget'] else ''}")
+    if report["deferred_violations"]:
+        print(f"imported at startup but should be deferred: {', '.join(report['deferred_violations'])}")
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+    print("FAIL" if report["failed"] else "OK")
+    return 1 if report["failed"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
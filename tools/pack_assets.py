@@ -0,0 +1,96 @@
+# tools/pack_assets.py
+"""
+Fetches every Lottie animation referenced in the app's source and packs the
+minified JSON into the compressed bundle read by assets.py.
+
+Usage (from the repository root):
+    python -m tools.pack_assets [--precision 3] [--output data/lottie_bundle.json.gz]
+"""
+
+import argparse
+import os
+import re
+import sys
+
+import assets
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SKIP_DIRS = {".git", ".venv", "venv", "__pycache__", "tools", "data"}
+LOTTIE_URL_RE = re.compile(r"https?://[\w.-]*lottiefiles\.com/[^\s\"')]+?\.json")
+
+
+def find_lottie_urls(root: str = ROOT) -> list:
+    """
+    Collects Lottie URLs referenced in the Python sources under `root`.
+
+    Parameters:
+        root (str): Directory to scan.
+
+    Returns:
+        list: Sorted, de-duplicated URLs.
+    """
+    urls = set()
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames[:] = [d for d in dirnames if d not in SKIP_DIRS and not d.startswith(".")]
+        for name in filenames:
+            if name.endswith(".py"):
+                with open(os.path.join(dirpath, name), encoding="utf-8") as f:
+                    urls.update(LOTTIE_URL_RE.findall(f.read()))
+    return sorted(urls)
+
+
+def minify(data, precision=None):
+    """
+    Rounds floats in a Lottie document to `precision` decimal places.
+
+    Whitespace is stripped when the bundle is serialized, so with no
+    precision the data is returned unchanged.
+    """
+    if precision is None:
+        return data
+    if isinstance(data, float):
+        rounded = round(data, precision)
+        return int(rounded) if rounded.is_integer() else rounded
+    if isinstance(data, list):
+        return [minify(item, precision) for item in data]
+    if isinstance(data, dict):
+        return {key: minify(value, precision) for key, value in data.items()}
+    return data
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--output", default=assets.BUNDLE_PATH, help="bundle path")
+    parser.add_argument(
+        "--precision", type=int, default=None,
+        help="round floating point values to this many decimals",
+    )
+    parser.add_argument(
+        "--keep-going", action="store_true",
+        help="write the bundle even if some URLs could not be fetched",
+    )
+    args = parser.parse_args(argv)
+
+    packed = assets.read_bundle(args.output)
+    failed = []
+    for url in find_lottie_urls():
+        data = assets._fetch(url)
+        if data is None:
+            failed.append(url)
+            status = "kept" if url in packed else "missing"
+            print(f"FAILED  {url} ({status})", file=sys.stderr)
+            continue
+        packed[url] = minify(data, args.precision)
+        print(f"packed  {url}")
+
+    if failed and not args.keep_going:
+        print(f"{len(failed)} asset(s) could not be fetched; bundle not written", file=sys.stderr)
+        return 1
+
+    assets.write_bundle(packed, args.output)
+    print(f"wrote {len(packed)} asset(s) to {args.output} ({os.path.getsize(args.output)} bytes)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
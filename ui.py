@@ -0,0 +1,166 @@
+# ui.py
+"""
+Page chrome shared by every view: the sidebar, docs search, injected CSS and
+the profiling panel, plus widgets the pages use to render their content.
+
+The chrome runs once per full script run. Widget interactions inside a
+page's fragments rerun only that fragment and never re-execute it.
+"""
+
+import math
+
+import streamlit as st
+from streamlit_option_menu import option_menu
+
+import assets
+import instrumentation
+from search import SearchIndex
+from views import PAGES, page_for_slug, page_slug
+
+# Bootstrap icon shown next to each page in the navigation menu
+NAV_ICONS = {
+    "Home": "house",
+    "Frontend": "window",
+    "Backend": "hdd-stack",
+    "GenAI and Machine learning": "cpu",
+    "Architecture": "diagram-3",
+}
+
+# Listings longer than this are shown one page of lines at a time
+LISTING_PAGE_LINES = 40
+
+PAGE_CSS = """
+<style>
+.reportview-container .main .block-container{
+    padding-top: 1rem;
+    padding-right: 2rem;
+    padding-left: 2rem;
+    padding-bottom: 2rem;
+}
+</style>
+"""
+
+
+def inject_css():
+    """Adds the app-wide padding styles to the page."""
+    st.markdown(PAGE_CSS, unsafe_allow_html=True)
+
+
+def sidebar() -> str:
+    """
+    Renders the sidebar navigation.
+
+    Returns:
+        str: The title of the selected page.
+    """
+    st.sidebar.title("🔎 **Explore Home$crapper**")
+
+    # The page comes from ?page= (deep links, search results, reloads), so
+    # the menu's first value is already the linked page and the first run
+    # renders only that page. Clicks update the URL in place; writing the
+    # query param does not trigger another rerun.
+    titles = list(PAGES.keys())
+    linked_page = page_for_slug(st.query_params.get("page", ""))
+    index = titles.index(linked_page) if linked_page else 0
+    with st.sidebar:
+        selected_page = option_menu(
+            "Navigate to",
+            titles,
+            default_index=index,
+            icons=[NAV_ICONS.get(title, "file-earmark-text") for title in titles],
+            menu_icon="compass",
+            key="nav",
+        )
+    if st.query_params.get("page") != page_slug(selected_page):
+        st.query_params["page"] = page_slug(selected_page)
+
+    with st.sidebar:
+        search_box()
+    st.sidebar.write("---")
+    st.sidebar.write("©️ 2023 Home$crapper")
+    return selected_page
+
+
+@st.cache_resource
+def search_index() -> SearchIndex:
+    """Builds the docs search index once per process, shared by all sessions."""
+    return SearchIndex()
+
+
+@st.fragment
+def search_box():
+    """Sidebar search over every page; typing reruns only this fragment."""
+    query = st.text_input("Search the docs", placeholder="e.g. JWT, classify_scrap")
+    if not query.strip():
+        return
+
+    index = search_index()
+    index.refresh()
+    hits = index.search(query, limit=8)
+    if not hits:
+        st.caption("No matching sections.")
+        return
+    for hit in hits:
+        st.markdown(f"**[{hit.heading}]({hit.link})** · {hit.page}  \n{hit.snippet}")
+
+
+def timing_panel(record: instrumentation.RunRecord):
+    """Shows the timing breakdown of a profiled run in the sidebar."""
+    with st.sidebar.expander(f"⏱️ Render timings · {record.total_ms:.1f} ms", expanded=True):
+        rows = [
+            {
+                "section": "\u2003" * s["depth"] + s["name"],
+                "start (ms)": s["start_ms"],
+                "time (ms)": s["duration_ms"],
+                "detail": ", ".join(f"{k}={v}" for k, v in s["labels"].items()),
+            }
+            for s in record.spans
+        ]
+        st.dataframe(rows, hide_index=True, width="stretch")
+        stats = assets.cache_stats()
+        if stats is not None:
+            st.caption(
+                f"Shared asset cache: {stats['hits']} hits, {stats['stale_hits']} stale, "
+                f"{stats['misses']} fetches, {stats['waits']} waits "
+                f"({stats['wait_seconds'] * 1000:.0f} ms total, "
+                f"max {stats['max_wait_seconds'] * 1000:.0f} ms), {stats['entries']} entries"
+            )
+        st.download_button(
+            "Prometheus metrics",
+            instrumentation.prometheus_text(),
+            file_name="homescrapper.prom",
+            mime="text/plain",
+        )
+
+
+@st.fragment
+def code_listing(label: str, code: str, language: str):
+    """
+    Renders a code listing that is collapsed until the reader opens it.
+
+    The code is only sent to the browser once the toggle is switched on,
+    and toggling reruns just this fragment. Listings longer than
+    LISTING_PAGE_LINES are split into pages of that many lines.
+
+    Parameters:
+        label (str): The file name or caption shown on the toggle.
+        code (str): The listing itself.
+        language (str): Language used for syntax highlighting.
+    """
+    lines = code.strip("\n").splitlines()
+    key = f"listing:{label}"
+    if not st.toggle(f"📄 `{label}` ({len(lines)} lines)", key=key):
+        return
+
+    pages = math.ceil(len(lines) / LISTING_PAGE_LINES)
+    if pages <= 1:
+        st.code("\n".join(lines), language=language)
+        return
+
+    ranges = [
+        f"{start + 1}–{min(start + LISTING_PAGE_LINES, len(lines))}"
+        for start in range(0, len(lines), LISTING_PAGE_LINES)
+    ]
+    selected = st.select_slider("Lines", options=ranges, key=f"{key}:page")
+    start = ranges.index(selected) * LISTING_PAGE_LINES
+    st.code("\n".join(lines[start:start + LISTING_PAGE_LINES]), language=language)
@@ -0,0 +1,64 @@
+# views/__init__.py
+"""
+Page registry for the documentation app.
+
+Each page lives in its own module exposing a `render()` function. Modules
+are imported on first selection only, so a rerun never loads the code or
+markdown of pages that are not being shown.
+"""
+
+import importlib
+import re
+
+# Sidebar title -> module rendering that page
+PAGES = {
+    "Home": "views.home",
+    "Frontend": "views.frontend",
+    "Backend": "views.backend",
+    "GenAI and Machine learning": "views.genai_ml",
+    "Architecture": "views.architecture",
+    # "Investor Pitch": "views.investor_pitch",
+    # Include other pages if necessary
+}
+
+# Pages whose content is an interactive component and that have nothing to
+# show outside the app; the static export leaves them out
+INTERACTIVE_PAGES = {"Architecture"}
+
+
+def load_page(title: str):
+    """
+    Imports the module for a page and returns its render function.
+
+    Parameters:
+        title (str): The page title as registered in PAGES.
+
+    Returns:
+        callable: The page's `render()` function.
+    """
+    return importlib.import_module(PAGES[title]).render
+
+
+def slugify(text: str) -> str:
+    """
+    Turns a heading or title into a URL fragment.
+
+    Mirrors the anchors Streamlit generates for headings: markdown markup and
+    emoji are dropped and the remaining words are lowercased and joined with
+    dashes.
+    """
+    words = re.split(r"[^0-9a-z]+", re.sub(r"[*_`]", "", text).lower())
+    return "-".join(word for word in words if word)
+
+
+def page_slug(title: str) -> str:
+    """Returns the `?page=` value for a registered page."""
+    return slugify(title)
+
+
+def page_for_slug(slug: str):
+    """Returns the page title for a `?page=` value, or None if unknown."""
+    for title in PAGES:
+        if page_slug(title) == slug:
+            return title
+    return None
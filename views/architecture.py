@@ -0,0 +1,123 @@
+# views/architecture.py
+
+import streamlit as st
+from streamlit_agraph import Config, Edge, Node, agraph
+
+import architecture
+
+# Group -> (colour, vis.js shape, size)
+GROUP_STYLES = {
+    "app": ("#2E7D32", "star", 40),
+    "tier": ("#43A047", "hexagon", 32),
+    "folder": ("#B0BEC5", "dot", 12),
+    "page": ("#1E88E5", "dot", 20),
+    "component": ("#64B5F6", "dot", 16),
+    "hook": ("#4DD0E1", "dot", 14),
+    "state": ("#4DB6AC", "dot", 14),
+    "entry point": ("#FB8C00", "diamond", 22),
+    "controller": ("#8E24AA", "dot", 20),
+    "model": ("#BA68C8", "dot", 18),
+    "route": ("#D81B60", "dot", 18),
+    "middleware": ("#F06292", "dot", 16),
+    "database": ("#6D4C41", "dot", 16),
+    "ml module": ("#F4511E", "dot", 20),
+    "endpoint": ("#E53935", "triangle", 18),
+    "library": ("#9E9E9E", "square", 12),
+    "asset": ("#CFD8DC", "dot", 8),
+    "file": ("#90A4AE", "dot", 10),
+}
+
+EDGE_COLOURS = {
+    "contains": "#CFD8DC",
+    "imports": "#546E7A",
+    "declares": "#E53935",
+    "routes to": "#D81B60",
+}
+
+# Hidden until the reader asks for them, to keep the first view readable
+DETAIL_GROUPS = {"asset", "file", "library"}
+
+
+@st.cache_resource(show_spinner=False)
+def project_graph(versions: tuple) -> architecture.Graph:
+    """Builds the graph once per version of the documenting pages."""
+    return architecture.build_graph()
+
+
+@st.cache_resource(show_spinner=False, max_entries=16)
+def graph_layout(digest: str, _graph: architecture.Graph) -> dict:
+    """Computes node positions once per graph, keyed by its digest."""
+    return architecture.radial_layout(_graph)
+
+
+def render():
+    st.title("🗺️ **Architecture Explorer**")
+    st.markdown("""
+    The component and dependency graph of Home$crapper, built from the project trees and code listings on the
+    Frontend, Backend and GenAI pages. Folders contain files, files import each other and third-party libraries,
+    and the servers declare the HTTP endpoints the apps talk to.
+
+    Drag to pan, scroll to zoom, and click a node to see its connections.
+    """)
+    st.write("---")
+    explorer()
+
+
+@st.fragment
+def explorer():
+    """The filters and the graph; changing a filter reruns only this fragment."""
+    graph = project_graph(architecture.source_versions())
+    positions = graph_layout(graph.digest(), graph)
+
+    groups = sorted({node.group for node in graph.nodes.values()})
+    tiers = {"All tiers": None, **architecture.TIERS}
+    left, right = st.columns([1, 3])
+    tier = tiers[left.selectbox("Tier", list(tiers))]
+    shown_groups = set(right.multiselect(
+        "Show", groups, default=[g for g in groups if g not in DETAIL_GROUPS], key="architecture_groups"
+    ))
+
+    visible = {
+        node_id for node_id, node in graph.nodes.items()
+        if node.group in shown_groups and (tier is None or node.tier in ("", tier))
+    }
+    edges = [edge for edge in graph.edges if edge.source in visible and edge.target in visible]
+    if tier is not None:
+        # Only the libraries this tier imports
+        linked = {edge.source for edge in edges} | {edge.target for edge in edges}
+        visible = {node_id for node_id in visible if graph.nodes[node_id].tier or node_id in linked}
+        visible.add(architecture.APP_ID)
+
+    nodes = []
+    for node_id in sorted(visible):
+        node = graph.nodes[node_id]
+        colour, shape, size = GROUP_STYLES.get(node.group, GROUP_STYLES["file"])
+        x, y = positions[node_id]
+        nodes.append(Node(node_id, title=f"{node.group}: {node.path or node.label}", label=node.label,
+                          color=colour, shape=shape, size=size, x=x, y=y, group=node.group))
+    links = [
+        Edge(edge.source, edge.target, color=EDGE_COLOURS[edge.kind], title=edge.kind,
+             dashes=edge.kind == "contains")
+        for edge in edges if edge.source in visible and edge.target in visible
+    ]
+
+    # Positions are precomputed, so vis.js only draws: no physics, no stabilisation
+    config = Config(height=720, width=1100, directed=True, physics=False, hierarchical=False,
+                    interaction={"hover": True, "navigationButtons": True})
+    selected = agraph(nodes, links, config)
+    st.caption(f"{len(nodes)} of {len(graph.nodes)} nodes, {len(links)} edges")
+
+    if selected in graph.nodes:
+        node_details(graph, graph.nodes[selected])
+
+
+def node_details(graph: architecture.Graph, node: architecture.Node):
+    """Lists what a clicked node connects to."""
+    st.subheader(node.label)
+    st.markdown(f"**Group:** {node.group}" + (f" · **Path:** `{node.path}`" if node.path else ""))
+    outgoing, incoming = graph.neighbours(node.id)
+    for heading, edges, other in (("Links to", outgoing, "target"), ("Linked from", incoming, "source")):
+        if edges:
+            st.markdown(f"**{heading}:**\n" + "\n".join(
+                f"- {edge.kind}: {graph.nodes[getattr(edge, other)].label}" for edge in edges
+            ))
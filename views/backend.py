@@ -0,0 +1,179 @@
+# views/backend.py
+
+import streamlit as st
+
+import ui
+
+# Code listings, rendered on demand by ui.code_listing
+APP_JS = """\
+import express from "express";
+import dotenv from "dotenv";
+import cookieParser from "cookie-parser";
+import connectDB from "./db/connectDB.js";
+import { v2 as cloudinary } from "cloudinary";
+import userRouter from "./Routes/userRouter.js";
+
+dotenv.config();
+connectDB();
+
+cloudinary.config({
+    cloud_name: process.env.CLOUD_NAME,
+    api_key: process.env.CLOUD_API_KEY,
+    api_secret: process.env.CLOUD_API_SECRET,
+});
+
+const app = express();
+app.use(cookieParser());
+app.use(express.json({ limit: "50mb" }));
+app.use(express.urlencoded({ extended: true }));
+app.use("/api/user", userRouter);
+
+const PORT = process.env.PORT || 3000;
+app.listen(PORT, () => {
+    console.log("Server started on port " + PORT);
+});
+"""
+
+CONNECT_DB_JS = """\
+import mongoose from "mongoose";
+
+const connectDB = async () => {
+    try {
+        const conn = await mongoose.connect(process.env.MONGODB_URL);
+        console.log(`MongoDB connected: ${conn.connection.host}`);
+    } catch (error) {
+        console.log(`Error: ${error.message}`);
+        process.exit(1);
+    }
+};
+
+export default connectDB;
+"""
+
+ADDUSER_JS = """\
+const Adduser = async (req, res) => {
+    try {
+        const { email } = req.body;
+        console.log("Working:", req.body);
+
+        if (!email) {
+            return res.status(400).json({ message: "All fields are required" });
+        }
+
+        const buyer = await Buyer.create({ email });
+        const seller = await Seller.create({ email });
+
+        if (buyer && seller) {
+            generateTokenAndSetCookie(buyer._id, res);
+            generateTokenAndSetCookie(seller._id, res);
+        }
+
+        res.status(201).json({ buyer, seller });
+    } catch (error) {
+        console.log(error);
+        res.status(500).json({ message: error.message });
+    }
+};
+"""
+
+
+def render():
+    st.title("🚀 **Backend Documentation**")
+    st.write("---")
+
+    st.subheader("🔧 **Design Considerations**")
+    st.markdown("""
+    The backend of the **Home$crapper** project was developed with several design considerations to ensure robustness, scalability, and security:
+
+    - **Modular Architecture**: Structured in a modular fashion, allowing for easy maintenance and scalability. Each component (controllers, models, routes) is separated to enhance code readability and organization.
+    - **Security**: Implementing JWT (JSON Web Tokens) for authentication ensures that user sessions are secure. Additionally, sensitive data is managed through environment variables using dotenv.
+    - **Database Connection Management**: Utilizes Mongoose for MongoDB interactions, ensuring efficient database connection handling and schema validation.
+    - **Error Handling**: Comprehensive error handling mechanisms are implemented to provide meaningful responses to the client while logging errors for debugging purposes.
+    """)
+
+    st.subheader("✨ **Key Features**")
+    st.markdown("""
+    The backend of **Home$crapper** includes several essential features:
+
+    - **User Authentication**: Users can register and log in securely, with their credentials stored safely in the database.
+    - **Product Management**: Supports CRUD operations for products, allowing sellers to add, update, and delete their listings.
+    - **Buyer and Seller Profiles**: Separate models for buyers and sellers enable tailored functionalities according to user roles.
+    - **Cloud Storage Integration**: Integration with Cloudinary allows for image uploads and management directly from the application.
+    - **Feedback Mechanism**: Users can provide feedback on products, which is processed and stored for future reference.
+    """)
+
+    st.subheader("🛠️ **Technological Stack**")
+    st.markdown("""
+    The backend of **Home$crapper** employs a modern technological stack:
+
+    - **Node.js**: A JavaScript runtime that allows for server-side scripting.
+    - **Express.js**: A web application framework for Node.js that simplifies routing and middleware management.
+    - **MongoDB**: A NoSQL database used for storing user and product data.
+    - **Mongoose**: An ODM (Object Data Modeling) library for MongoDB that provides schema-based solutions to model application data.
+    - **Cloudinary**: A cloud service for image upload and management.
+    - **JWT (JSON Web Tokens)**: Used for secure authentication.
+    """)
+
+    st.subheader("📄 **Technical Documentation**")
+    st.markdown("""
+    **Project Structure:**
+
+    ```
+    backend
+    ├── app.js
+    ├── controller/
+    │   └── User.js
+    ├── db/
+    │   └── connectDB.js
+    ├── middleware/
+    │   └── protectRoute.js
+    ├── model/
+    │   ├── Buyer.js
+    │   ├── Product.js
+    │   └── Seller.js
+    ├── package-lock.json
+    ├── package.json
+    ├── Routes/
+    │   └── Router.router.js
+    └── utils/
+        └── helper/
+            └── cookies.js
+    ```
+
+    **Key Files:**
+
+    1. `app.js`: The main entry point of the application that initializes the server and connects to the database.
+    """)
+
+    ui.code_listing("app.js", APP_JS, "javascript")
+
+    st.markdown("""
+    2. `connectDB.js`: Handles the connection to MongoDB.
+    """)
+
+    ui.code_listing("connectDB.js", CONNECT_DB_JS, "javascript")
+
+    st.markdown("""
+    3. **Controllers (`controller/User.js`)**: Manages user-related operations such as registration, profile updates, and product management.
+
+    **Updated `Adduser` Controller Code:**
+    """)
+
+    ui.code_listing("controller/User.js", ADDUSER_JS, "javascript")
+
+    st.markdown("""
+    4. **Models (`model/`)**:
+       - `Buyer.js`: Defines the Buyer schema with fields like name, email, password, etc.
+       - `Seller.js`: Defines the Seller schema similar to Buyer but includes additional fields relevant to sellers.
+       - `Product.js`: Defines the Product schema including details like name, description, price, image array, etc.
+
+    5. **Middleware (`middleware/protectRoute.js`)**: Protects routes by verifying JWT tokens to ensure that only authenticated users can access certain endpoints.
+
+    **Error Handling**
+
+    The backend implements error handling in various parts of the code. For example, in the `Adduser` controller function provided above, we handle missing fields and log errors.
+
+    **Conclusion**
+
+    This documentation provides a comprehensive overview of the backend design considerations, key features, technological stack, and technical structure of the **Home$crapper** project. By following these guidelines and utilizing modern technologies, the project aims to create a secure and efficient platform for managing scrapping operations and facilitating second-hand transactions.
+    """)
@@ -0,0 +1,229 @@
+# views/frontend.py
+
+import streamlit as st
+
+import ui
+
+# Code listings, rendered on demand by ui.code_listing
+INDEX_HTML = """\
+<!doctype html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8" />
+    <link rel="icon" type="image/svg+xml" href="/vite.svg" />
+    <meta name="viewport" content="width=device-width, initial-scale=1.0" />
+    <title>Home$crapper</title>
+</head>
+<body>
+    <div id="root"></div>
+    <script type="module" src="/src/main.jsx"></script>
+</body>
+</html>
+"""
+
+MAIN_JSX = """\
+import { StrictMode } from 'react';
+import { createRoot } from 'react-dom/client';
+import { Auth0Provider } from '@auth0/auth0-react';
+import './index.css';
+import App from './App.jsx';
+import { RecoilRoot } from 'recoil';
+
+createRoot(document.getElementById('root')).render(
+    <Auth0Provider
+        domain="dev-ob2zgf2rb2cj4emu.us.auth0.com"
+        clientId="PKriUy3BJCzcEQzBVZGG0dKjlCaXEyEs"
+        authorizationParams={{
+            redirect_uri: window.location.origin,
+        }}
+    >
+        <StrictMode>
+            <RecoilRoot>
+                <App />
+            </RecoilRoot>
+        </StrictMode>
+    </Auth0Provider>
+);
+"""
+
+ESLINT_CONFIG_JS = """\
+import js from '@eslint/js';
+import globals from 'globals';
+import react from 'eslint-plugin-react';
+import reactHooks from 'eslint-plugin-react-hooks';
+import reactRefresh from 'eslint-plugin-react-refresh';
+
+export default [
+  {
+    ignores: ['dist'],
+  },
+  {
+    files: ['/.{js,jsx}'],
+    languageOptions: {
+      ecmaVersion: 2020,
+      globals: globals.browser,
+      parserOptions: {
+        ecmaVersion: 'latest',
+        ecmaFeatures: {
+          jsx: true,
+        },
+        sourceType: 'module',
+      },
+    },
+    settings: {
+      react: {
+        version: '18.3',
+      },
+    },
+    plugins: {
+      react,
+      'react-hooks': reactHooks,
+      'react-refresh': reactRefresh,
+    },
+    rules: {
+      ...js.configs.recommended.rules,
+      ...react.configs.recommended.rules,
+      ...react.configs['jsx-runtime'].rules,
+      ...reactHooks.configs.recommended.rules,
+      'react/jsx-no-target-blank': 'off',
+      'react-refresh/only-export-components': ['warn', { allowConstantExport: true }],
+    },
+  },
+];
+"""
+
+
+def render():
+    st.title("🚀 **Frontend Documentation**")
+    st.write("---")
+
+    st.subheader("📝 **Design Considerations**")
+    st.markdown("""
+    The frontend of the **Home$crapper** project was designed with several key considerations in mind:
+
+    - **User-Centric Design**: The interface prioritizes ease of use, ensuring that users can navigate the platform effortlessly to either list items for sale or browse available products.
+    - **Responsive Layout**: The application is built to be fully responsive, providing a seamless experience across various devices, including desktops and tablets.
+    - **Accessibility**: Adhering to accessibility standards ensures that the application is usable by individuals with disabilities, enhancing usability for all users.
+    - **Performance Optimization**: The frontend is optimized for performance, minimizing load times and ensuring smooth interactions through efficient rendering and state management.
+    """)
+
+    st.subheader("✨ **Key Features**")
+    st.markdown("""
+    The frontend of **Home$crapper** includes several notable features:
+
+    - **Authentication**: Users can easily log in and manage their profiles through a secure authentication process using auth0.
+    - **Marketplace Functionality**: Users can list items for sale, view details of listed products, and make purchases directly through the platform.
+    - **Garbage Scrapping Interface**: A dedicated section for users to report garbage or unwanted materials, facilitating community engagement in environmental efforts.
+    - **Dynamic Content Loading**: The application dynamically loads content based on user interactions, providing a smooth and engaging experience without full page reloads.
+    - **VoiceFlow ChatBot Service**: Enhances the user experience by providing answers to queries, adding to user satisfaction.
+    """)
+
+    st.subheader("🛠️ **Technological Stack**")
+    st.markdown("""
+    The **Home$crapper** frontend utilizes a modern technological stack:
+
+    - **React**: A JavaScript library for building user interfaces, allowing for the creation of reusable UI components.
+    - **Vite**: A build tool that provides a fast development environment with hot module replacement (HMR).
+    - **Material UI**: A popular React UI framework that offers pre-designed components to speed up development and ensure a consistent look and feel.
+    - **Emotion**: A CSS-in-JS library used for styling components dynamically based on props and state.
+    - **React Router**: A routing library for React that enables navigation between different views in the application.
+    """)
+
+    st.subheader("📄 **Technical Documentation**")
+    st.markdown("""
+    **Project Structure:**
+
+    ```
+    competition/
+    ├── eslint.config.js
+    ├── index.html
+    ├── package-lock.json
+    ├── package.json
+    ├── public/
+    │   └── vite.svg
+    ├── README.md
+    ├── src/
+    │   ├── App.css
+    │   ├── App.jsx
+    │   ├── assets/
+    │   │   ├── hero.png
+    │   │   ├── logo.png
+    │   │   ├── profile.png
+    │   │   ├── options1.png
+    │   │   ├── options2.png
+    │   │   │── rudra.png
+    │   │   │── sanatan.png
+    │   │   │── aryan.png
+    │   │   │── sagar.png
+    │   │   └── react.svg
+    │   ├── atom/
+    │   │     └──userAtom.js
+    │   ├── auth_config.json
+    │   ├── components/
+    │   │   └── Profile.jsx
+    │   ├── hooks/
+    │   │   └── usePreviewImg.jsx
+    │   ├── index.css
+    │   ├── main.jsx
+    │   ├── pages/
+    │   │   ├── Appbar.jsx
+    │   │   ├── Contact.jsx
+    │   │   ├── Hero.jsx
+    │   │   ├── HomeOptions.jsx
+    │   │   ├── Login.jsx
+    │   │   └── Logout.jsx
+    │   │   └── MyProfile.jsx
+    │   │   └── Orders.jsx
+    │   ├── part1/
+    │   │   ├── Final.jsx
+    │   │   ├── ModalData.jsx
+    │   │   ├── ProductList.jsx
+    │   │   ├── Seller.jsx
+    │   │   └── Vendor.jsx
+    │   │   └── VendorList.jsx
+    │   └── part2/
+    │       ├── Buyer.jsx
+    │       └── Seller.jsx
+    │       ├── ProductList.jsx
+    └── vite.config.js
+    ```
+
+    **Key Files:**
+
+    1. `index.html`: The entry point of the application. It includes meta tags for responsiveness and links to the main JavaScript file.
+    """)
+
+    ui.code_listing("index.html", INDEX_HTML, "html")
+
+    st.markdown("""
+    2. `main.jsx`: Initializes the React application and renders it into the DOM, using `Auth0Provider`, `RecoilRoot`, and `StrictMode` for enhanced setup.
+    """)
+
+    ui.code_listing("main.jsx", MAIN_JSX, "javascript")
+
+    st.markdown("""
+    3. `App.jsx`: The root component that manages routing and layout.
+
+    4. **Components Directory (`src/components/`)**: Contains reusable components such as `Profile.jsx`, which displays user profile information.
+
+    5. **Pages Directory (`src/pages/`)**: Contains various page components like `Hero`, `Login`, `Logout`, etc., each responsible for rendering specific parts of the application.
+
+    **Styling**
+
+    The application uses **CSS Modules** and **Emotion** for styling:
+
+    - **CSS Modules**: Styles are scoped locally to avoid conflicts between different components.
+    - **Emotion**: Provides dynamic styling capabilities based on component props.
+
+    **ESLint Configuration**
+
+    The project uses **ESLint** to maintain code quality. The configuration file (`eslint.config.js`) sets up rules specific to React development:
+    """)
+
+    ui.code_listing("eslint.config.js", ESLINT_CONFIG_JS, "javascript")
+
+    st.markdown("""
+    **Conclusion**
+
+    This documentation provides a comprehensive overview of the frontend design considerations, key features, technological stack, and technical structure of the **Home$crapper** project. By adhering to these guidelines and utilizing modern technologies, the project aims to create an efficient platform for scrapping garbage and facilitating second-hand transactions.
+    """)
@@ -0,0 +1,241 @@
+# views/genai_ml.py
+
+import streamlit as st
+
+import ui
+
+# Code listings, rendered on demand by ui.code_listing
+WASTE_INFO_PY = '''\
+import google.generativeai as genai
+from PIL import Image
+import geocoder
+from typing import List, Dict
+
+# Configure the Google Generative AI API
+genai.configure(api_key="YOUR_API_KEY")  # Replace with your API key
+model = genai.GenerativeModel("gemini-1.5-flash")
+
+class LocationService:
+    @staticmethod
+    def get_location() -> Dict[str, str]:
+        g = geocoder.ip("me")
+        if g.ok:
+            return {
+                "city": g.city or "Unknown",
+                "state": g.state or "Unknown",
+                "country": g.country or "India"
+            }
+        return {"city": "Mumbai", "state": "Maharashtra", "country": "India"}
+
+RECYCLING_RULES = { ... }  # Dictionary containing state-specific recycling rules
+
+def classify_scrap(images: List[str], location: Dict[str, str]):
+    classifications = []
+    state = location.get("state", "Maharashtra")
+
+    for image_path in images:
+        image = Image.open(image_path)
+        prompt = f"""
+
+        """
+        response = model.generate_content([prompt, image])
+
+        classifications.append({
+            "image": image_path,
+            "recyclable": "recyclable" in response.text.lower(),
+            "sellable": "sellable" in response.text.lower(),
+            "recommendation": response.text,
+            "recycling_rules": RECYCLING_RULES.get(state, "No specific rules found.")
+        })
+
+    return classifications
+'''
+
+FEEDBACK_CLASSIFY_PY = r"""
+import joblib
+import re
+from sklearn.pipeline import make_pipeline
+from sklearn.linear_model import LogisticRegression
+from sklearn.feature_extraction.text import TfidfVectorizer
+
+# Load model
+model = joblib.load("logistic_regression_sentiment_model.pkl")
+
+def clean_text(text):
+    text = re.sub(r"http\S+|www\S+|https\S+", "", text, flags=re.MULTILINE)
+    text = re.sub(r"@\w+", "", text)
+    text = re.sub(r"\W", " ", text)
+    return text.lower()
+
+def predict_sentiment(text):
+    cleaned_text = clean_text(text)
+    prediction = model.predict([cleaned_text])
+    return "Positive" if prediction[0] == 1 else "Negative"
+""".lstrip("\n")
+
+MAIN_PY = """\
+from fastapi import FastAPI, HTTPException
+from typing import List
+import requests
+import google.generativeai as genai
+import joblib
+from PIL import Image
+from io import BytesIO
+
+# Configure Google Generative AI
+genai.configure(api_key="YOUR_API_KEY")
+model = genai.GenerativeModel("gemini-1.5-flash")
+
+# Load sentiment model
+sentiment_model = joblib.load("logistic_regression_sentiment_model.pkl")
+
+app = FastAPI()
+
+# Feedback Analysis Endpoint
+@app.post("/analyze-feedback/")
+async def analyze_feedback(text: str):
+    prediction = sentiment_model.predict([text])[0]
+    sentiment = "Positive" if prediction == 1 else "Negative"
+    return {"sentiment": sentiment}
+
+# Scrap Classification Endpoint
+@app.post("/classify-scrap/")
+async def classify_scrap(image_urls: List[str]):
+    classifications = []
+    for url in image_urls:
+        response = requests.get(url)
+        image = Image.open(BytesIO(response.content))
+        prompt = "Classify this scrap item based on recyclability and sellability."
+        ai_response = model.generate_content([prompt, image])
+
+        classifications.append({
+            "url": url,
+            "classification": ai_response.text
+        })
+    return classifications
+"""
+
+
+def render():
+    st.title("🧠 **GenAI and Machine learning Documentation**")
+    st.write("---")
+
+    st.subheader("🔬 **Design Considerations**")
+    st.markdown("""
+    The machine learning models in the **Home$crapper** project were developed with the following considerations in mind:
+
+    - **Data Quality and Preprocessing**: Emphasis was placed on ensuring high-quality data input. Feedback text is cleaned and normalized, and images are processed to be compatible with image classification requirements.
+    - **Model Selection**: Focus on sentiment classification and image classification for scrap items.
+    - **Scalability**: Models are designed to handle increasing amounts of data efficiently, ensuring smooth scaling as user activity grows.
+    - **Performance Monitoring**: Continuous monitoring of model performance metrics such as accuracy, precision, and recall helps maintain the effectiveness of these models over time.
+    """)
+
+    st.subheader("✨ **Key Features**")
+    st.markdown("""
+    The **Home$crapper** machine learning components include:
+
+    - **Feedback Sentiment Analysis**: Analyzes user feedback to classify sentiments as positive or negative, helping improve user experience based on insights from customer feedback.
+    - **Recommendation System**: Provides personalized product recommendations based on user preferences and historical behavior.
+    - **Image Classification for Scrap**: Utilizes Google Generative AI (`google.generativeai`) to classify scrap items based on recyclability and sellability, with location-based guidelines.
+    """)
+
+    st.subheader("🛠️ **Technological Stack**")
+    st.markdown("""
+    - **Python**: Programming language for model development and deployment.
+    - **scikit-learn**: For traditional machine learning algorithms used in feedback sentiment analysis.
+    - **Pandas/Numpy**: Libraries for data manipulation and preprocessing.
+    - **FastAPI**: Serves the machine learning models as RESTful APIs.
+    - **google.generativeai**: Utilizes Google’s Gemini model for advanced image classification and content generation, which is crucial for classifying images based on regional recycling guidelines.
+    """)
+
+    st.subheader("📄 **Technical Documentation**")
+    st.markdown("""
+    **Project Structure:**
+
+    ```
+    GenAI-X-ML/
+    ├── recommendation_model/
+    │   ├── execution.py
+    │   └── feedback_classify.py
+    ├── waste_classification/
+    │   ├── waste_info.py
+    └── main.py (FastAPI application)
+    ```
+
+    ### Components Overview
+
+    1. **Waste Classification Model (`waste_info.py`)**
+       - **Purpose**: Classifies images of scrap items as recyclable or non-recyclable and evaluates their sellability based on user location.
+       - **Technology**: Uses Google Generative AI’s `gemini-1.5-flash` model from `google.generativeai`.
+       - **Example Usage**:
+       ```python
+       location = LocationService.get_location()
+       images = ["iron1.jpg", "cell_phone.webp"]
+       classifications = classify_scrap(images, location)
+       ```
+
+       - **Code Implementation**:
+    """)
+
+    ui.code_listing("waste_info.py", WASTE_INFO_PY, "python")
+
+    st.markdown("""
+    2. **Feedback Sentiment Analysis Model (`feedback_classify.py`)**
+       - **Purpose**: Analyzes user feedback to classify it as positive or negative.
+       - **Technology**: Utilizes scikit-learn’s `LogisticRegression` with `TfidfVectorizer`.
+       - **Example Usage**:
+       ```python
+       text_input = "Great service!"
+       cleaned_input = clean_text(text_input)
+       sentiment = model.predict([cleaned_input])
+       sentiment_label = "Positive" if sentiment[0] == 1 else "Negative"
+       ```
+
+       - **Code Implementation**:
+    """)
+
+    ui.code_listing("feedback_classify.py", FEEDBACK_CLASSIFY_PY, "python")
+
+    st.markdown("""
+    3. **FastAPI Application (`main.py`)**
+       - **Purpose**: Exposes RESTful APIs for sentiment analysis and scrap classification.
+       - **Endpoints**:
+         - `/analyze-feedback/`: Analyzes feedback sentiment.
+         - `/classify-scrap/`: Classifies scrap items based on image URLs and user location.
+       - **Example Usage**:
+       ```python
+       # Analyze Feedback
+       POST /analyze-feedback/
+       {
+           "text": "Amazing app, very helpful!"
+       }
+
+       # Classify Scrap
+       POST /classify-scrap/
+       {
+           "image_urls": ["https://example.com/image1.jpg", "https://example.com/image2.jpg"]
+       }
+       ```
+
+       - **Code Implementation**:
+    """)
+
+    ui.code_listing("main.py", MAIN_PY, "python")
+
+    st.markdown("""
+    ### Model Training and Evaluation Details
+
+    - **Feedback Model Training**:
+      - **Dataset**: Twitter Sentiment dataset (pre-processed for positive and negative feedback).
+      - **Algorithm**: Logistic Regression with TF-IDF vectorization.
+      - **Metrics**: Accuracy, Precision, Recall.
+
+    - **Scrap Image Classification**:
+      - **Data Source**: User-uploaded images of scrap items.
+      - **Generative AI Integration**: Generates a location-based response with recycling and resale recommendations.
+      - **Output**: Recyclable/Non-Recyclable, Sellable/Non-Sellable, and recommendations based on state guidelines.
+
+    ### Conclusion
+
+    This documentation provides a comprehensive overview of the machine learning models and APIs integrated into the **Home$crapper** project. By leveraging machine learning and location-based recycling guidelines, the project provides valuable insights and personalized experiences for users engaged in recycling and sustainable practices.
+    """)
@@ -0,0 +1,80 @@
+# views/home.py
+
+import streamlit as st
+
+from assets import load_lottieurl_async
+from instrumentation import span
+
+
+def render():
+    st.title("♻️ **Welcome to Home$crapper!**")
+    st.markdown("### *Your Sustainable Waste Management Solution*")
+    st.write("---")
+
+    # Start loading the Lottie animation in the background and keep its slot,
+    # so the text below renders without waiting on the asset host
+    lottie_future = load_lottieurl_async("https://assets9.lottiefiles.com/packages/lf20_u4yrau.json")
+    lottie_slot = st.empty()
+
+    st.markdown("""
+    **Home$crapper** is an innovative platform connecting households and vendors to promote responsible recycling and waste management. Our mission is to help users turn recyclable waste into value, ensuring proper and sustainable disposal.
+
+    Our platform also facilitates a marketplace where users can donate or sell reusable items at minimal cost, making Home$crapper an eco-friendly and socially impactful choice.
+    """)
+
+    st.write("---")
+    st.header("🔍 **Key Features**")
+    st.markdown("""
+    - **Trusted Vendors**: Connect with genuine, vetted vendors.
+    - **Real-Time Pricing**: Access current market rates for waste materials.
+    - **Verified Weighing Machines**: Ensure accurate weights for transparency.
+    - **Marketplace for Donations and Resales**: Donate or sell reusable goods.
+    - **Secure Transactions**: Reliable interactions between users and vendors.
+    """)
+
+    st.write("---")
+    how_it_works()
+
+    st.write("---")
+    get_started()
+
+    # Fill in the animation once the background fetch completes
+    with span("lottie.wait"):
+        lottie_animation = lottie_future.result()
+    if lottie_animation:
+        # Imported only when there is an animation to show
+        from streamlit_lottie import st_lottie
+
+        with span("lottie.render"), lottie_slot.container():
+            st_lottie(lottie_animation, height=300, key="home_animation")
+
+
+# Interactive regions run as fragments: a widget interaction inside one
+# reruns only that fragment, not the sidebar, CSS or the rest of the page.
+@st.fragment
+def how_it_works():
+    st.header("🚗 **How It Works**")
+    with st.expander("♻️ Recycling Waste"):
+        st.markdown("""
+        1. **Select Waste Type**: Choose the recyclable waste you want to dispose of.
+        2. **Find a Vendor**: View nearby vendors offering competitive prices.
+        3. **Schedule Pickup**: Select a vendor and set a pickup date.
+        4. **Receive Payment**: Get paid based on weight and market rate.
+        """)
+
+    with st.expander("🎁 Donate or Resell Goods"):
+        st.markdown("""
+        1. **List an Item**: Post items for donation or minimal sale.
+        2. **Connect with a Buyer/Recipient**: Interested parties reach out.
+        3. **Arrange Pickup or Delivery**: Hand over the item directly.
+        """)
+
+
+@st.fragment
+def get_started():
+    st.header("🔗 **Get Started**")
+    st.markdown("""
+    Ready to turn waste into value? **[Join Home$crapper today](#)** to start recycling responsibly or donating unused items with ease.
+    """)
+
+    st.button("🌟 **Join Now**", help="Click to sign up and start your eco-friendly journey with Home$crapper!")